@@ -2,12 +2,11 @@ from flask import Flask, request, jsonify
 from flask_jwt_extended import JWTManager, create_access_token, create_refresh_token, jwt_required, get_jwt_identity
 from flask_cors import CORS
 import redis
-import pymysql
 import os
 from datetime import timedelta
 from config import Config
+import db_pool
 from models.user import User
-from urllib.parse import urlparse
 from functools import wraps
 from repository.user_repo import UserRepository
 from service.user_service import UserService, UserExistsException, InvalidCredentialsException
@@ -24,22 +23,11 @@ CORS(app, origins=Config.CORS_ORIGINS, supports_credentials=True)
 # Redis 연결
 redis_client = redis.from_url(Config.REDIS_URL)
 
-# MySQL 연결
+# MySQL 연결 (프로세스 공유 풀에서 빌리며, close()하면 풀로 반환)
 def get_db_connection():
-    url = os.environ.get('DATABASE_URL')
-    if url is None:
+    if os.environ.get('DATABASE_URL') is None:
         raise Exception("DATABASE_URL 환경변수가 설정되지 않았습니다.")
-
-    parsed = urlparse(url)
-    return pymysql.connect(
-        host=parsed.hostname,
-        user=parsed.username,
-        password=parsed.password,
-        database=parsed.path.lstrip('/'),
-        port=parsed.port or 3306,
-        charset='utf8mb4',
-        cursorclass=pymysql.cursors.DictCursor
-    )
+    return db_pool.raw_connection()
 
 # 데이터베이스 초기화
 def init_db():
@@ -0,0 +1,173 @@
+"""
+프로세스 전체에서 공유하는 MySQL 연결 풀입니다.
+
+인증 API(app.py, repository), 분류 API의 raw SQL 헬퍼(app/db/database.py),
+Flask-SQLAlchemy 모델이 모두 이 모듈의 엔진 하나를 사용합니다.
+
+- 풀 크기 / 오버플로 / 대기 시간 / recycle / pre-ping은 Config의 DB_POOL_* 값으로 설정합니다.
+- fork된 워커(gunicorn, 작업 워커 등)는 부모의 연결을 공유하지 않고 자신의 연결을 새로 엽니다.
+- 연결 대기 시간과 체크아웃 횟수를 pool_stats()로 조회할 수 있습니다.
+"""
+import os
+import threading
+import time
+import pymysql
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool
+from config import Config
+
+_engine = None
+_engine_lock = threading.Lock()
+
+# 풀 사용 통계
+_stats = {
+    "checkouts": 0,
+    "connects": 0,
+    "timeouts": 0,
+    "wait_seconds_total": 0.0,
+    "wait_seconds_max": 0.0,
+}
+_stats_lock = threading.Lock()
+
+# 연결을 기다린 시간(초)을 받는 콜백 (지표 모듈이 히스토그램을 연결)
+_wait_observers = []
+
+
+def database_url() -> str:
+    """SQLAlchemy 연결 URL. 드라이버가 없는 mysql:// 형식이면 PyMySQL을 사용하도록 바꿉니다."""
+    url = Config.DATABASE_URL
+    if url.startswith("mysql://"):
+        url = "mysql+pymysql://" + url[len("mysql://"):]
+    return url
+
+
+class InstrumentedQueuePool(QueuePool):
+    """풀에서 연결을 얻기까지 기다린 시간을 기록하는 QueuePool"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            with _stats_lock:
+                _stats["timeouts"] += 1
+            raise
+        finally:
+            _record_wait(time.perf_counter() - start)
+
+
+def _record_wait(seconds: float):
+    with _stats_lock:
+        _stats["wait_seconds_total"] += seconds
+        _stats["wait_seconds_max"] = max(_stats["wait_seconds_max"], seconds)
+    for observer in _wait_observers:
+        observer(seconds)
+
+
+def _create_engine():
+    engine = create_engine(
+        database_url(),
+        poolclass=InstrumentedQueuePool,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_timeout=Config.DB_POOL_TIMEOUT,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_pre_ping=Config.DB_POOL_PRE_PING,
+        connect_args={"charset": "utf8mb4"},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        with _stats_lock:
+            _stats["connects"] += 1
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        with _stats_lock:
+            _stats["checkouts"] += 1
+
+    print(f"[DB POOL] Engine created (pool_size={Config.DB_POOL_SIZE}, max_overflow={Config.DB_MAX_OVERFLOW})")
+    return engine
+
+
+def get_engine():
+    """프로세스 공유 엔진을 반환합니다. 첫 호출 시 생성합니다."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine()
+    return _engine
+
+
+class PooledConnection:
+    """
+    풀에서 빌린 PyMySQL 연결입니다. 기존 pymysql.connect()와 같은 방식으로 사용하며
+    cursor()는 DictCursor를 반환하고, close()는 연결을 닫지 않고 풀에 돌려줍니다.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def cursor(self, cursor_class=pymysql.cursors.DictCursor):
+        return self._connection.cursor(cursor_class)
+
+    def commit(self):
+        self._connection.commit()
+
+    def rollback(self):
+        self._connection.rollback()
+
+    def close(self):
+        if self._connection is not None:
+            # 커밋되지 않은 작업은 풀 반환 시 롤백됩니다.
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def raw_connection() -> PooledConnection:
+    """raw SQL(PyMySQL 커서)용 풀 연결을 빌립니다. 사용 후 close()로 반환하세요."""
+    return PooledConnection(get_engine().raw_connection())
+
+
+def add_wait_observer(observer):
+    """연결 대기 시간(초)을 받을 콜백을 등록합니다."""
+    _wait_observers.append(observer)
+
+
+def pool_stats() -> dict:
+    """풀 상태와 누적 사용 통계"""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["wait_seconds_mean"] = stats["wait_seconds_total"] / stats["checkouts"] if stats["checkouts"] else None
+
+    engine = _engine
+    if engine is not None:
+        pool = engine.pool
+        stats.update({
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+        })
+    return stats
+
+
+def _after_fork():
+    # 부모 프로세스의 소켓을 자식이 닫거나 재사용하지 않도록, 풀만 버리고 연결은 건드리지 않습니다.
+    # fork 시점에 다른 스레드가 잡고 있던 잠금이 자식에 남지 않도록 잠금도 새로 만듭니다.
+    global _engine_lock, _stats_lock
+    _engine_lock = threading.Lock()
+    _stats_lock = threading.Lock()
+    if _engine is not None:
+        _engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,131 @@
+# app/benchmarks/bench_autocomplete.py
+"""
+자동완성 지연 시간 벤치마크.
+합성 규정 목록(기본 1k, 10k, 100k개)으로 인덱스를 만들고 여러 종류의 입력
+(접두어, 입력 중인 글자, 초성, 부분 문자열, 영어, 오타)에 대한 p50/p99 지연 시간을 측정합니다.
+인덱스 검색의 p99가 예산을 넘으면 종료 코드 1로 실패합니다.
+--linear를 주면 기존 방식(전체 이름에 대한 WRatio 선형 검색)도 함께 측정합니다.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.benchmarks.bench_autocomplete
+    python -m app.benchmarks.bench_autocomplete --sizes 1000 10000 --linear --budget-p99-ms 5
+"""
+import argparse
+import random
+import sys
+import time
+from rapidfuzz import process, fuzz
+from app.matching.autocomplete import AutocompleteIndex, to_chosung
+
+# 합성 이름 재료 (실제 목록처럼 공통 단어가 반복되도록)
+KO_WORDS = ["보조", "배터리", "라이터", "가위", "칼", "스프레이", "헤어", "드라이기", "캠핑", "가스", "접이식",
+            "전자", "담배", "액체", "화장품", "향수", "공구", "망치", "드라이버", "충전기", "노트북", "우산",
+            "등산", "스틱", "골프", "클럽", "면도기", "손톱", "깎이", "분유", "약품", "소화기", "폭죽", "성냥"]
+EN_WORDS = ["power", "bank", "lighter", "scissors", "knife", "spray", "hair", "dryer", "camping", "gas",
+            "folding", "electronic", "cigarette", "liquid", "cosmetic", "perfume", "tool", "hammer",
+            "screwdriver", "charger", "laptop", "umbrella", "trekking", "pole", "golf", "club", "razor"]
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후"
+
+
+def synthetic_catalog(size: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    items = []
+    for i in range(size):
+        words = rng.sample(KO_WORDS, rng.randint(1, 3))
+        # 같은 이름이 많아지지 않도록 임의 음절 단어를 섞습니다.
+        words.insert(rng.randrange(len(words) + 1), "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))))
+        name_ko = " ".join(words) + f" {i}"
+        name_en = " ".join(rng.sample(EN_WORDS, rng.randint(1, 3))) + f" {i}"
+        items.append({"item_name": name_ko, "item_name_EN": name_en})
+    return items
+
+
+def sample_queries(items: list, count: int, seed: int = 1) -> list:
+    """[(종류, 질의)]"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        item = rng.choice(items)
+        ko = item["item_name"].split()[0]
+        kind = rng.choice(["prefix", "composing", "chosung", "infix", "english", "typo"])
+        if kind == "prefix":
+            query = ko[:rng.randint(1, len(ko))]
+        elif kind == "composing":
+            # 다음 음절의 초성까지 입력된 상태 ('가방' 입력 중 '갑')
+            query = ko[:-1] + to_chosung(ko[-1]) if len(ko) > 1 else to_chosung(ko)
+        elif kind == "chosung":
+            query = to_chosung(item["item_name"].replace(" ", ""))[:rng.randint(2, 4)]
+        elif kind == "infix":
+            name = item["item_name"].replace(" ", "")
+            start = rng.randrange(max(1, len(name) - 2))
+            query = name[start:start + 2]
+        elif kind == "english":
+            query = item["item_name_EN"][:rng.randint(2, 8)]
+        else:
+            chars = list(ko)
+            if len(chars) > 1:
+                chars[rng.randrange(len(chars))] = rng.choice(SYLLABLES)
+            query = "".join(chars)
+        queries.append((kind, query))
+    return queries
+
+
+def percentiles(timings: list) -> tuple:
+    ordered = sorted(timings)
+    return ordered[len(ordered) // 2], ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+def measure(search, queries: list) -> tuple:
+    search(queries[0][1])  # 워밍업
+    timings = []
+    for _, query in queries:
+        start = time.perf_counter()
+        search(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return percentiles(timings)
+
+
+def linear_search(names: list):
+    """기존 ItemsService.get_autocomplete_suggestions 방식"""
+    def search(query):
+        return [r[0] for r in process.extract(query, names, scorer=fuzz.WRatio, limit=5, score_cutoff=75)]
+    return search
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자동완성 지연 시간 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--linear", action="store_true", help="기존 선형 WRatio 검색도 측정")
+    parser.add_argument("--budget-p99-ms", type=float, default=10)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'items':>7} | {'build s':>7} | {'index p50':>9} | {'index p99':>9} | {'linear p50':>10} | {'linear p99':>10}")
+    print("-" * 70)
+    for size in args.sizes:
+        items = synthetic_catalog(size)
+        queries = sample_queries(items, args.queries)
+
+        start = time.perf_counter()
+        index = AutocompleteIndex(items)
+        build_s = time.perf_counter() - start
+
+        p50, p99 = measure(lambda q: index.search(q), queries)
+        linear = "-", "-"
+        if args.linear:
+            # 선형 검색은 느리므로 질의 수를 줄여 측정합니다.
+            l50, l99 = measure(linear_search([item["item_name"] for item in items]), queries[:200])
+            linear = f"{l50:.2f}", f"{l99:.2f}"
+        print(f"{size:>7} | {build_s:>7.2f} | {p50:>9.3f} | {p99:>9.3f} | {linear[0]:>10} | {linear[1]:>10}")
+
+        if p99 > args.budget_p99_ms:
+            print(f"FAIL: p99 {p99:.2f} ms at {size} items exceeds budget {args.budget_p99_ms:.2f} ms")
+            failed = True
+
+    print("FAIL" if failed else "OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
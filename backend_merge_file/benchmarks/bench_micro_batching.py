@@ -0,0 +1,63 @@
+# app/benchmarks/bench_micro_batching.py
+"""
+동시 요청 수에 따른 마이크로 배치 효과를 측정합니다.
+N개의 스레드가 동시에 SKU 탐지 + YOLO 분류를 실행하고, 처리량과 배치 크기 / 대기 시간 히스토그램을 출력합니다.
+MICRO_BATCHING=false로 실행하면 배치 없이 요청별로 실행한 결과와 비교할 수 있습니다.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.benchmarks.bench_micro_batching --concurrency 1 4 8 20
+    MICRO_BATCH_MAX_WAIT_MS=5 python -m app.benchmarks.bench_micro_batching --concurrency 20
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.imaging.decoded_image import DecodedImage
+from app.inference.batcher import batching_stats
+from app.inference.registry import model_registry
+from app.sku.detect import predict_bbox_with_sku
+from app.yolo.detect import predict_name_with_yolo
+
+SAMPLE_IMAGE = os.path.join(os.path.dirname(__file__), "..", "yolo", "sliding_multy.jpg")
+
+
+def classify_once(image: DecodedImage):
+    """요청 하나와 같은 순서로 SKU 탐지 후 크롭 분류를 실행하고 지연 시간(ms)을 반환합니다."""
+    start = time.perf_counter()
+    with model_registry.pin():
+        bboxes = predict_bbox_with_sku(image)
+        predict_name_with_yolo(image, bboxes)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="마이크로 배치 동시 요청 벤치마크")
+    parser.add_argument("--image", default=SAMPLE_IMAGE)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 20])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(args.image, "rb") as f:
+        image = DecodedImage.from_bytes(f.read())
+    classify_once(image)  # 워밍업
+
+    print(f"{'concurrency':>11} | {'p50 ms':>8} | {'max ms':>8} | {'req/s':>7}")
+    print("-" * 44)
+    for concurrency in args.concurrency:
+        latencies = []
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for _ in range(args.rounds):
+                latencies.extend(pool.map(classify_once, [image] * concurrency))
+        elapsed = time.perf_counter() - start
+        print(f"{concurrency:>11} | {statistics.median(latencies):>8.1f} | {max(latencies):>8.1f} | "
+              f"{len(latencies) / elapsed:>7.2f}")
+
+    print(json.dumps(batching_stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+# app/benchmarks/bench_pipeline.py
+"""
+SKU + YOLO 파이프라인 오프라인 벤치마크 모음입니다. (CPU, 네트워크/가중치 파일 불필요)
+
+- 단계별 지연 시간: 디코딩, SKU 탐지(predict_bbox_with_sku), 크롭 분류(predict_name_with_yolo), 전체
+  (--with-db를 주면 run_detection을 롤백되는 트랜잭션 안에서 함께 측정)
+- 시나리오: 합성 노이즈 이미지와 샘플 사진(sliding_multy.jpg) x 해상도 x 크롭 개수
+- 동시 요청 수별 처리량 (req/s, p50/p95)
+- 최대 RSS (MB)
+
+기본은 stub_models의 대체 모델을 사용하며, --model real이면 레지스트리의 실제 가중치를 로드합니다.
+결과를 JSON으로 저장(--save-baseline)하고, 저장된 기준(--baseline)과 p50/p95 변화를 비교합니다.
+기준보다 --max-regression % 이상 느려진 항목이 있으면 종료 코드 1로 실패합니다.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.benchmarks.bench_pipeline --save-baseline app/benchmarks/baselines/pipeline_stub.json
+    python -m app.benchmarks.bench_pipeline --baseline app/benchmarks/baselines/pipeline_stub.json
+    python -m app.benchmarks.bench_pipeline --model real --resolutions 1920x1440 --crops 10 25
+"""
+import os
+
+# 라우트/탐지 모듈을 import할 때 실제 가중치를 로드하지 않도록 Config보다 먼저 설정합니다.
+os.environ.setdefault("MODEL_LOAD_MODE", "lazy")
+
+import argparse
+import io
+import json
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from app.imaging.decoded_image import DecodedImage
+from app.inference.registry import model_registry
+from app.sku.detect import predict_bbox_with_sku
+from app.yolo.detect import predict_name_with_yolo
+from app.benchmarks.stub_models import install_stub_models
+
+SAMPLE_IMAGE = os.path.join(os.path.dirname(__file__), "..", "yolo", "sliding_multy.jpg")
+STAGES = ("decode", "sku", "yolo", "total")
+
+# 이 값(ms)보다 작은 변화는 측정 잡음으로 보고 회귀로 판단하지 않습니다.
+NOISE_FLOOR_MS = 1.0
+
+
+def percentile(values, q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100)"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(timings) -> dict:
+    return {
+        "p50": percentile(timings, 50),
+        "p95": percentile(timings, 95),
+        "mean": sum(timings) / len(timings),
+        "n": len(timings),
+    }
+
+
+def peak_rss_mb() -> float:
+    # Linux는 KB, macOS는 바이트 단위입니다.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def parse_resolution(text: str):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def encode_jpeg(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def build_inputs(resolutions, sample_path: str) -> dict:
+    """{'합성/샘플@WxH': JPEG 바이트} 입력 이미지를 만듭니다."""
+    sample = Image.open(sample_path).convert("RGB")
+    inputs = {}
+    for width, height in resolutions:
+        inputs[f"synthetic@{width}x{height}"] = encode_jpeg(Image.effect_noise((width, height), 64).convert("RGB"))
+        inputs[f"sample@{width}x{height}"] = encode_jpeg(sample.resize((width, height), Image.BILINEAR))
+    return inputs
+
+
+def run_once(image_bytes: bytes, conn=None) -> dict:
+    """요청 하나를 처리하고 단계별 소요 시간(ms)과 크롭 수를 반환합니다."""
+    timings = {}
+    start = time.perf_counter()
+    image = DecodedImage.from_bytes(image_bytes)
+    timings["decode"] = (time.perf_counter() - start) * 1000
+
+    with model_registry.pin():
+        stage_start = time.perf_counter()
+        bboxes = predict_bbox_with_sku(image)
+        timings["sku"] = (time.perf_counter() - stage_start) * 1000
+
+        stage_start = time.perf_counter()
+        predict_name_with_yolo(image, bboxes)
+        timings["yolo"] = (time.perf_counter() - stage_start) * 1000
+
+        if conn is not None:
+            from app.db.database import insert_image
+            from app.routes.classify import run_detection
+
+            stage_start = time.perf_counter()
+            image_id = insert_image(conn, user_id="custom1", image_bytes=image_bytes,
+                                    width=image.width, height=image.height)
+            run_detection(image, conn, image_id, image.width, image.height)
+            timings["run_detection"] = (time.perf_counter() - stage_start) * 1000
+
+    timings["total"] = (time.perf_counter() - start) * 1000
+    return {"timings": timings, "crops": len(bboxes)}
+
+
+def bench_stages(inputs: dict, crop_counts, repeat: int, detector=None, conn=None) -> dict:
+    results = {}
+    for name, image_bytes in inputs.items():
+        for crops in (crop_counts if detector else [None]):
+            if detector:
+                detector.boxes_per_image = crops
+            run_once(image_bytes, conn)  # 워밍업
+            runs = [run_once(image_bytes, conn) for _ in range(repeat)]
+
+            scenario = f"{name}/crops={crops}" if detector else name
+            stage_names = STAGES + (("run_detection",) if conn is not None else ())
+            results[scenario] = {
+                "crops": runs[-1]["crops"],
+                **{stage: summarize([run["timings"][stage] for run in runs]) for stage in stage_names},
+            }
+            total = results[scenario]["total"]
+            print(f"  {scenario:<40} crops={results[scenario]['crops']:>3}  "
+                  f"total p50 {total['p50']:8.1f} ms  p95 {total['p95']:8.1f} ms")
+    return results
+
+
+def bench_throughput(image_bytes: bytes, levels, rounds: int) -> dict:
+    results = {}
+    for concurrency in levels:
+        latencies = []
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for _ in range(rounds):
+                runs = pool.map(run_once, [image_bytes] * concurrency)
+                latencies.extend(run["timings"]["total"] for run in runs)
+        elapsed = time.perf_counter() - start
+        results[str(concurrency)] = {
+            "req_per_s": len(latencies) / elapsed,
+            **summarize(latencies),
+        }
+        print(f"  concurrency {concurrency:>3}: {results[str(concurrency)]['req_per_s']:7.2f} req/s  "
+              f"p50 {results[str(concurrency)]['p50']:8.1f} ms  p95 {results[str(concurrency)]['p95']:8.1f} ms")
+    return results
+
+
+def compare(baseline: dict, current: dict, max_regression: float) -> int:
+    """p50/p95를 기준과 비교해 출력하고, 허용치를 넘게 느려진 항목 수를 반환합니다."""
+    rows = []
+    for scenario, stages in current["stages"].items():
+        for stage, stats in stages.items():
+            base = baseline.get("stages", {}).get(scenario, {}).get(stage)
+            if isinstance(stats, dict) and isinstance(base, dict):
+                rows.append((f"{scenario} {stage}", base, stats))
+    for level, stats in current["throughput"].items():
+        base = baseline.get("throughput", {}).get(level)
+        if base:
+            rows.append((f"throughput c={level}", base, stats))
+
+    regressions = 0
+    print(f"\n{'metric':<56} | {'p50 base → now':>22} | {'p95 base → now':>22}")
+    print("-" * 108)
+    for label, base, stats in rows:
+        cells = []
+        for key in ("p50", "p95"):
+            delta = stats[key] - base[key]
+            change = delta / base[key] * 100 if base[key] else 0.0
+            regressed = change > max_regression and delta > NOISE_FLOOR_MS
+            regressions += regressed
+            cells.append(f"{base[key]:7.1f} → {stats[key]:7.1f} {change:+5.0f}%{'!' if regressed else ' '}")
+        print(f"{label:<56} | {cells[0]:>22} | {cells[1]:>22}")
+
+    rss_base, rss_now = baseline.get("peak_rss_mb"), current["peak_rss_mb"]
+    if rss_base:
+        print(f"\npeak RSS: {rss_base:.0f} MB → {rss_now:.0f} MB ({(rss_now - rss_base) / rss_base * 100:+.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SKU + YOLO 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--model", choices=["stub", "real"], default="stub")
+    parser.add_argument("--resolutions", nargs="+", default=["640x480", "1920x1440", "4032x3024"])
+    parser.add_argument("--crops", type=int, nargs="+", default=[1, 10, 40], help="stub 모델의 이미지당 박스 수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=3, help="동시성 수준별 반복 횟수")
+    parser.add_argument("--sample", default=SAMPLE_IMAGE)
+    parser.add_argument("--with-db", action="store_true", help="run_detection을 DB 트랜잭션(롤백) 안에서 함께 측정")
+    parser.add_argument("--save-baseline", default=None, help="결과 JSON을 저장할 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 JSON 경로")
+    parser.add_argument("--max-regression", type=float, default=20.0, help="허용하는 p50/p95 증가율(%%)")
+    args = parser.parse_args()
+
+    detector = None
+    if args.model == "stub":
+        detector, _ = install_stub_models()
+    else:
+        model_registry.load("sku")
+        model_registry.load("yolo")
+
+    inputs = build_inputs([parse_resolution(r) for r in args.resolutions], args.sample)
+
+    conn = transaction = None
+    if args.with_db:
+        from app.db.database import get_engine
+        conn = get_engine().connect()
+        transaction = conn.begin()
+
+    try:
+        print("[stages]")
+        stages = bench_stages(inputs, args.crops, args.repeat, detector, conn)
+    finally:
+        if conn is not None:
+            transaction.rollback()
+            conn.close()
+
+    print("[throughput]")
+    if detector:
+        detector.boxes_per_image = sorted(args.crops)[len(args.crops) // 2]
+    throughput_input = inputs.get("sample@1920x1440") or next(iter(inputs.values()))
+    throughput = bench_throughput(throughput_input, args.concurrency, args.rounds)
+
+    current = {
+        "meta": {
+            "model": args.model,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "stages": stages,
+        "throughput": throughput,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    print(f"peak RSS: {current['peak_rss_mb']:.0f} MB")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"Saved results to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("model") != args.model:
+            print(f"WARNING: baseline was recorded with model={baseline.get('meta', {}).get('model')}")
+        regressions = compare(baseline, current, args.max_regression)
+        print("OK" if regressions == 0 else f"FAIL: {regressions} p50/p95 regressions over {args.max_regression}%")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
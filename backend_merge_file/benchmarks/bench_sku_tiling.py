@@ -0,0 +1,142 @@
+# app/benchmarks/bench_sku_tiling.py
+"""
+SKU 타일 탐지 지연 시간 벤치마크.
+전체 이미지 1회 추론, 타일을 하나씩 추론하는 방식, 타일 배치 추론 방식, 그리고 현재 설정
+(Config.SKU_TILING / SKU_TILING_MIN_DIM / SKU_MAX_TILES)으로 업로드 경로가 실행하는 SKU 탐지를 비교합니다.
+현재 설정의 p95가 CPU 지연 시간 예산을 넘으면 종료 코드 1로 실패합니다.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.benchmarks.bench_sku_tiling --budget-ms 3000
+    python -m app.benchmarks.bench_sku_tiling --images photo.jpg --tile-size 512 --overlap 0.25
+    python -m app.benchmarks.bench_sku_tiling --resolutions 4032x3024 --save app/benchmarks/baselines/sku_tiling.json
+"""
+import os
+
+# 탐지 모듈을 import할 때 실제 가중치를 로드하지 않도록 Config보다 먼저 설정합니다.
+os.environ.setdefault("MODEL_LOAD_MODE", "lazy")
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+
+from PIL import Image
+
+from config import Config
+from app.imaging.decoded_image import DecodedImage
+from app.inference.registry import model_registry
+from app.sku.detect import predict_bbox_with_sku
+from app.sku.tiling import detect_full, detect_tiled, capped_tile_windows, should_tile
+from app.benchmarks.stub_models import install_stub_models
+
+SAMPLE_IMAGE = os.path.join(os.path.dirname(__file__), "..", "yolo", "sliding_multy.jpg")
+SKU_CONF_THRESHOLD = 0.10
+
+
+def measure(fn, repeat: int):
+    """
+    repeat회 실행한 지연 시간(ms)의 {p50, p95}와 마지막 결과를 반환합니다. 첫 실행은 워밍업으로 제외합니다.
+    """
+    result = fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    p95 = statistics.quantiles(timings, n=20, method="inclusive")[-1] if len(timings) > 1 else timings[0]
+    return {"p50": statistics.median(timings), "p95": p95}, result
+
+
+def load_images(paths, resolutions) -> dict:
+    """{이름: DecodedImage} 입력 (파일, 그리고 샘플 사진을 지정한 해상도로 리사이즈한 JPEG)"""
+    images = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            images[os.path.basename(path)] = DecodedImage.from_bytes(f.read())  # 디코딩 시간은 측정에서 제외
+    if resolutions:
+        sample = Image.open(SAMPLE_IMAGE).convert("RGB")
+        for text in resolutions:
+            width, height = (int(v) for v in text.lower().split("x"))
+            buffer = io.BytesIO()
+            sample.resize((width, height), Image.BILINEAR).save(buffer, "JPEG", quality=90)
+            images[f"sample@{width}x{height}"] = DecodedImage.from_bytes(buffer.getvalue())
+    return images
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SKU 타일 탐지 벤치마크")
+    parser.add_argument("--model", choices=["stub", "real"], default="real")
+    parser.add_argument("--images", nargs="*", default=[SAMPLE_IMAGE])
+    parser.add_argument("--resolutions", nargs="*", default=[], help="샘플 사진을 이 해상도(WxH)로 바꿔 추가")
+    parser.add_argument("--tile-size", type=int, default=None)
+    parser.add_argument("--overlap", type=float, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=3000, help="현재 설정으로 실행한 SKU 탐지의 이미지당 p95 예산")
+    parser.add_argument("--save", default=None, help="결과 JSON을 저장할 경로")
+    args = parser.parse_args()
+
+    if args.model == "stub":
+        install_stub_models()
+    model = model_registry.load("sku").model if args.model == "real" else model_registry.get("sku").model
+    tile_size = args.tile_size or Config.SKU_TILE_SIZE
+    overlap = Config.SKU_TILE_OVERLAP if args.overlap is None else args.overlap
+    failed = False
+    results = {}
+
+    print(f"{'image':>24} | {'tiles':>5} | {'full p50':>8} | {'looped p50':>10} | {'batched p50':>11} | "
+          f"{'default':>7} | {'default p50/p95':>15} | {'boxes':>11}")
+    print("-" * 118)
+    for name, image in load_images(args.images, args.resolutions).items():
+        array_height, array_width = image.array.shape[:2]
+        num_tiles = len(capped_tile_windows(array_width, array_height, tile_size, overlap, Config.SKU_MAX_TILES))
+
+        full, (full_boxes, _) = measure(
+            lambda: detect_full(model, image, SKU_CONF_THRESHOLD), args.repeat)
+        looped, _ = measure(
+            lambda: detect_tiled(model, image, SKU_CONF_THRESHOLD, tile_size=tile_size,
+                                 overlap=overlap, batch_size=1), args.repeat)
+        batched, (tiled_boxes, _) = measure(
+            lambda: detect_tiled(model, image, SKU_CONF_THRESHOLD, tile_size=tile_size,
+                                 overlap=overlap, batch_size=args.batch_size), args.repeat)
+        # 업로드 경로와 같은 호출 (타일 여부와 타일 수 제한은 Config 설정을 따름)
+        default, _ = measure(lambda: predict_bbox_with_sku(image), args.repeat)
+        default_mode = "tiled" if should_tile(image) else "full"
+
+        results[name] = {"tiles": num_tiles, "full": full, "looped": looped, "batched": batched,
+                         "default_mode": default_mode, "default": default}
+        boxes = f"{len(full_boxes)} -> {len(tiled_boxes)}"
+        print(f"{name[-24:]:>24} | {num_tiles:>5} | {full['p50']:>8.1f} | {looped['p50']:>10.1f} | "
+              f"{batched['p50']:>11.1f} | {default_mode:>7} | {default['p50']:>7.1f}/{default['p95']:<7.1f} | {boxes:>11}")
+        if default["p95"] > args.budget_ms:
+            print(f"FAIL: {name} p95 {default['p95']:.0f} ms at current settings exceeds budget {args.budget_ms:.0f} ms")
+            failed = True
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump({
+                "meta": {
+                    "model": args.model,
+                    "sku_weights": None if args.model == "stub" else model_registry.get("sku").version,
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "cpu_count": os.cpu_count(),
+                    "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "settings": {key: getattr(Config, key) for key in (
+                        "DEFAULT_INFERENCE_PROFILE", "SKU_TILING", "SKU_TILING_MIN_DIM", "SKU_TILE_SIZE",
+                        "SKU_TILE_OVERLAP", "SKU_MAX_TILES", "SKU_MAX_BATCH_SIZE")},
+                },
+                "results": results,
+            }, f, indent=2)
+        print(f"Saved results to {args.save}")
+
+    print("FAIL" if failed else "OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
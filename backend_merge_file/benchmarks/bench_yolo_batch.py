@@ -0,0 +1,69 @@
+# app/benchmarks/bench_yolo_batch.py
+"""
+크롭 개수에 따른 predict_name_with_yolo 지연 시간 벤치마크.
+크롭마다 개별 추론하는 기존 방식과 배치 추론 방식을 비교합니다.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.benchmarks.bench_yolo_batch --crops 1 5 10 25 50 --repeat 5
+"""
+import argparse
+import io
+import random
+import statistics
+import time
+
+from PIL import Image
+
+from app.imaging.decoded_image import DecodedImage
+from app.yolo.detect import predict_name_with_yolo
+
+
+def make_sample(width: int, height: int, num_crops: int, seed: int = 0):
+    """무작위 노이즈 이미지와 num_crops개의 임의 바운딩 박스를 생성합니다."""
+    rng = random.Random(seed)
+    image = Image.effect_noise((width, height), 64).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+
+    bboxes = []
+    for _ in range(num_crops):
+        w = rng.randint(width // 16, width // 4)
+        h = rng.randint(height // 16, height // 4)
+        x = rng.randint(0, width - w)
+        y = rng.randint(0, height - h)
+        bboxes.append([float(x), float(y), float(x + w), float(y + h)])
+    return buffer.getvalue(), bboxes
+
+
+def measure(image, bboxes: list, batched: bool, repeat: int, max_batch_size: int = None):
+    """repeat회 실행한 지연 시간(ms) 목록을 반환합니다. 첫 실행은 워밍업으로 제외합니다."""
+    predict_name_with_yolo(image, bboxes, batched=batched, max_batch_size=max_batch_size)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        predict_name_with_yolo(image, bboxes, batched=batched, max_batch_size=max_batch_size)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YOLO 크롭 분류 배치 벤치마크")
+    parser.add_argument("--crops", type=int, nargs="+", default=[1, 5, 10, 25, 50])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1440)
+    parser.add_argument("--max-batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"{'crops':>6} | {'per-crop ms':>12} | {'batched ms':>11} | {'speedup':>7}")
+    print("-" * 46)
+    for num_crops in args.crops:
+        image_bytes, bboxes = make_sample(args.width, args.height, num_crops)
+        image = DecodedImage.from_bytes(image_bytes)  # 디코딩 시간은 측정에서 제외
+        per_crop = statistics.median(measure(image, bboxes, False, args.repeat))
+        batched = statistics.median(measure(image, bboxes, True, args.repeat, args.max_batch_size))
+        print(f"{num_crops:>6} | {per_crop:>12.1f} | {batched:>11.1f} | {per_crop / batched:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# app/benchmarks/check_engine_parity.py
+"""
+ONNX / INT8 엔진의 결과가 PyTorch 엔진과 허용 오차 안에서 일치하는지 확인합니다.
+- SKU: 박스를 IoU로 짝지어 좌표(IoU)와 confidence 차이를 비교합니다.
+- YOLO: 같은 크롭 배치에 대해 클래스 일치 여부와 confidence 차이를 비교합니다.
+불일치가 있으면 종료 코드 1로 실패합니다.
+tests/test_engine_parity.py는 같은 비교를 작은 무작위 가중치 모델로 실행합니다. (실제 가중치 불필요)
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.benchmarks.check_engine_parity --engine onnx
+    python -m app.benchmarks.check_engine_parity --engine onnx-int8 --conf-tol 0.08 --iou-min 0.85
+"""
+import argparse
+import os
+import sys
+import numpy as np
+from PIL import Image
+from app.imaging.decoded_image import DecodedImage
+from app.inference.box_ops import box_iou
+from app.inference.engines import load_engine
+from app.inference.model_versions import resolve_model_weights
+from app.yolo.detect import letterbox, classify_batch, YOLO_CROP_IMGSZ
+
+SAMPLE_IMAGE = os.path.join(os.path.dirname(__file__), "..", "yolo", "sliding_multy.jpg")
+SKU_CONF_THRESHOLD = 0.10
+
+
+def load_samples(paths):
+    samples = [DecodedImage(np.asarray(Image.open(path).convert("RGB"))) for path in paths]
+    # 실제 사진 외에 해상도가 다른 합성 이미지도 함께 비교합니다.
+    for size in ((640, 480), (1920, 1440)):
+        samples.append(DecodedImage(np.asarray(Image.effect_noise(size, 64).convert("RGB"))))
+    return samples
+
+
+def detect(engine, image: DecodedImage, conf_threshold: float = SKU_CONF_THRESHOLD):
+    boxes = engine(image.to_bgr(), conf=conf_threshold, verbose=False)[0].boxes
+    return boxes.xyxy.cpu().numpy(), boxes.conf.cpu().numpy()
+
+
+def compare_sku(reference, candidate, samples, iou_min, conf_tol, conf_threshold: float = SKU_CONF_THRESHOLD):
+    failures = 0
+    for index, image in enumerate(samples):
+        ref_boxes, ref_conf = detect(reference, image, conf_threshold)
+        cand_boxes, cand_conf = detect(candidate, image, conf_threshold)
+        if len(ref_boxes) == 0 and len(cand_boxes) == 0:
+            continue
+
+        iou = box_iou(ref_boxes, cand_boxes) if len(cand_boxes) else np.zeros((len(ref_boxes), 0))
+        for i in range(len(ref_boxes)):
+            j = int(iou[i].argmax()) if iou.shape[1] else -1
+            matched = j >= 0 and iou[i, j] >= iou_min and abs(ref_conf[i] - cand_conf[j]) <= conf_tol
+            # 임계값 근처의 박스는 오차 범위 안에서 한쪽에만 나타날 수 있습니다.
+            near_threshold = ref_conf[i] - conf_threshold <= conf_tol
+            if not matched and not near_threshold:
+                failures += 1
+                print(f"  [SKU] sample {index}: box {ref_boxes[i].round(1).tolist()} "
+                      f"(conf {ref_conf[i]:.3f}) has no match")
+        print(f"[SKU] sample {index}: reference {len(ref_boxes)} boxes, candidate {len(cand_boxes)} boxes")
+    return failures
+
+
+def compare_yolo(reference, candidate, sku_reference, samples, conf_tol, conf_threshold: float = SKU_CONF_THRESHOLD):
+    import torch
+
+    failures = 0
+    for index, image in enumerate(samples):
+        ref_boxes, _ = detect(sku_reference, image, conf_threshold)
+        if len(ref_boxes) == 0:
+            continue
+        batch = np.stack([letterbox(image.crop(bbox), YOLO_CROP_IMGSZ) for bbox in ref_boxes.tolist()])
+        ref_conf, ref_cls = classify_batch(reference, batch)
+        cand_conf, cand_cls = classify_batch(candidate, batch)
+
+        conf_diff = (ref_conf - cand_conf).abs()
+        mismatch = (ref_cls != cand_cls) | (conf_diff > conf_tol)
+        failures += int(mismatch.sum())
+        print(f"[YOLO] sample {index}: {len(ref_boxes)} crops, {int(mismatch.sum())} mismatches, "
+              f"max conf diff {float(conf_diff.max()):.4f}")
+        if torch.any(mismatch):
+            for i in mismatch.nonzero().flatten().tolist():
+                print(f"  [YOLO] crop {i}: {reference.names.get(int(ref_cls[i]))} ({float(ref_conf[i]):.3f}) vs "
+                      f"{candidate.names.get(int(cand_cls[i]))} ({float(cand_conf[i]):.3f})")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추론 엔진 결과 일치 검사 (PyTorch 기준)")
+    parser.add_argument("--engine", choices=["onnx", "onnx-int8"], default="onnx")
+    parser.add_argument("--images", nargs="*", default=[SAMPLE_IMAGE])
+    parser.add_argument("--iou-min", type=float, default=0.9)
+    parser.add_argument("--conf-tol", type=float, default=0.05)
+    args = parser.parse_args()
+
+    samples = load_samples(args.images)
+    sku_path = resolve_model_weights("sku")[1]
+    yolo_path = resolve_model_weights("yolo")[1]
+    sku_reference = load_engine(sku_path, "torch")
+
+    failures = compare_sku(sku_reference, load_engine(sku_path, args.engine), samples, args.iou_min, args.conf_tol)
+    failures += compare_yolo(load_engine(yolo_path, "torch"), load_engine(yolo_path, args.engine),
+                             sku_reference, samples, args.conf_tol)
+
+    print("OK" if failures == 0 else f"FAIL: {failures} mismatches")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
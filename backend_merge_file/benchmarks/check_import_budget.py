@@ -0,0 +1,80 @@
+# app/benchmarks/check_import_budget.py
+"""
+Flask 라우트 모듈의 import 시간 예산을 확인합니다.
+새 프로세스에서 라우트를 import하고, 시간이 예산을 넘거나 무거운 의존성(torch 등)이
+로드되면 종료 코드 1로 실패합니다. 배포 전 점검에 사용하며, 같은 검사를 tests/test_import_budget.py가
+pytest로 실행합니다.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.benchmarks.check_import_budget --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# 앱 부팅 시 import되는 라우트 모듈
+APP_MODULES = [
+    "app.routes.classify",
+    "app.routes.items",
+    "app.routes.admin",
+    "app.routes.health",
+    "app.routes.images",
+    "app.routes.metrics",
+]
+
+# import 시점에 로드되면 안 되는 무거운 모듈
+FORBIDDEN_MODULES = ["torch", "ultralytics", "cv2", "pandas", "google.generativeai"]
+
+PROBE = """
+import json, sys, time
+{setup}
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"elapsed_ms": elapsed_ms, "loaded": [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(modules, forbidden, setup: str = "", cwd: str = None):
+    """
+    새 프로세스에서 modules를 import한 시간(ms)과 로드된 forbidden 모듈을 반환합니다.
+    setup: import 전에 실행할 코드 (측정 시간에 포함되지 않음. 예: 테스트의 import 경로 설정)
+    """
+    # 모델은 첫 사용 시 로드하도록 하여 import 자체의 비용만 측정합니다.
+    env = dict(os.environ, MODEL_LOAD_MODE="lazy")
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(modules=modules, forbidden=forbidden, setup=setup)],
+        check=True, capture_output=True, text=True, env=env, cwd=cwd,
+    ).stdout
+    # import 중 출력된 로그는 건너뛰고 마지막 줄(JSON)만 사용합니다.
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라우트 import 시간 예산 점검")
+    parser.add_argument("--budget-ms", type=float, default=1500)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    results = [measure_import(APP_MODULES, FORBIDDEN_MODULES) for _ in range(args.runs)]
+    best_ms = min(r["elapsed_ms"] for r in results)
+    loaded = sorted({m for r in results for m in r["loaded"]})
+
+    print(f"import time: {best_ms:.0f} ms (budget {args.budget_ms:.0f} ms, best of {args.runs})")
+    failed = False
+    if best_ms > args.budget_ms:
+        print("FAIL: import time exceeds budget")
+        failed = True
+    if loaded:
+        print(f"FAIL: heavy modules loaded at import time: {', '.join(loaded)}")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
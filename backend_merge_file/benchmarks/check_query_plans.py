@@ -0,0 +1,73 @@
+# app/benchmarks/check_query_plans.py
+"""
+자주 실행되는 조회의 실행 계획(EXPLAIN)을 확인합니다.
+어느 조회라도 전체 테이블 스캔(type = ALL)이 나오면 종료 코드 1로 실패합니다.
+마이그레이션(python -m app.db.migrate) 이후 배포 전 점검에 사용합니다.
+
+행이 거의 없는 테이블에서는 MySQL이 인덱스 대신 전체 스캔을 고를 수 있으므로
+실제 데이터가 들어 있는 DB(스테이징 등)에서 실행하세요.
+같은 조회는 tests/test_migrations.py가 데이터를 채운 일회용 DB에서도 확인합니다. (TEST_MYSQL_URL)
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.benchmarks.check_query_plans
+"""
+import sys
+from sqlalchemy import text
+from app.db.database import get_engine
+
+# (이름, 조회 SQL, 파라미터) — 각 조회는 앱 코드의 SQL과 같은 형태입니다.
+HOT_QUERIES = [
+    ("detected items by image (get_detailed_by_image_id)", """
+        SELECT d.*, i.*
+        FROM detected_items d
+        LEFT OUTER JOIN items i ON d.regulation_item_id = i.id
+        WHERE d.image_id = :image_id
+    """, {"image_id": 1}),
+    ("item by english name (fetch_item_info)", """
+        SELECT id, item_name, item_name_EN, carry_on_allowed, checked_baggage_allowed, notes
+        FROM items WHERE item_name_EN = :name
+    """, {"name": "knife"}),
+    ("items by korean names (fetch_items_by_names)", """
+        SELECT id, item_name, item_name_EN, carry_on_allowed, checked_baggage_allowed, notes
+        FROM items WHERE item_name IN (:a, :b, :c)
+    """, {"a": "칼", "b": "가위", "c": "라이터"}),
+    ("catalog changes since version (fetch_catalog_changes)", """
+        SELECT id, item_name, row_version FROM items WHERE row_version > :since ORDER BY id
+    """, {"since": 2 ** 62}),
+    ("image by id (get_image_details_by_id)", """
+        SELECT image_id, blob_key, byte_size, content_type, width, height
+        FROM images WHERE image_id = :image_id
+    """, {"image_id": 1}),
+    ("detection cache lookup (fetch_cached_result)", """
+        SELECT image_id, payload FROM detection_result_cache
+        WHERE cache_key = :cache_key AND created_at >= NOW() - INTERVAL 1 DAY
+        LIMIT 1
+    """, {"cache_key": "0" * 64}),
+    ("expired detection cache (prune_cached_results)", """
+        SELECT cache_key FROM detection_result_cache WHERE created_at < NOW() - INTERVAL 30 DAY
+    """, {}),
+]
+
+
+def explain(conn, sql: str, params: dict) -> list:
+    return [dict(row) for row in conn.execute(text("EXPLAIN " + sql), params).mappings()]
+
+
+def main():
+    failed = False
+    with get_engine().connect() as conn:
+        for name, sql, params in HOT_QUERIES:
+            plan = explain(conn, sql, params)
+            scans = [row for row in plan if row.get("type") == "ALL"]
+            status = "FAIL" if scans else "OK"
+            print(f"{status:>4}  {name}")
+            for row in plan:
+                print(f"        table={row.get('table')} type={row.get('type')} key={row.get('key')} rows={row.get('rows')}")
+            failed = failed or bool(scans)
+
+    print("FAIL: full table scans found" if failed else "OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
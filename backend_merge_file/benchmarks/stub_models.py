@@ -0,0 +1,122 @@
+# app/benchmarks/stub_models.py
+"""
+가중치 파일(.pt) 없이 SKU/YOLO 파이프라인을 벤치마크하기 위한 대체 모델입니다.
+추론 엔진(app.inference.engines.InferenceEngine)과 같은 인터페이스를 제공하며
+model_registry.install()로 설치합니다.
+
+- 전처리(리사이즈, 텐서 변환)는 실제로 수행하고, 모델 연산 시간은
+  forward_ms + per_item_ms x 배치 크기 만큼 대기하여 배치 효과를 흉내 냅니다.
+- 출력은 입력 크기에만 의존하는 결정적(deterministic) 값이므로 실행 간 비교가 가능합니다.
+"""
+import math
+import time
+import numpy as np
+from app.matching.matcher import YOLO_TO_DB_MAP
+
+
+class _Values:
+    """torch 텐서의 .cpu().numpy() 호출을 흉내 내는 numpy 래퍼"""
+
+    def __init__(self, array: np.ndarray):
+        self._array = array
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self._array
+
+
+class StubBoxes:
+    def __init__(self, xyxy: np.ndarray, conf: np.ndarray):
+        self.xyxy = _Values(xyxy)
+        self.conf = _Values(conf)
+
+    def __len__(self):
+        return len(self.conf.numpy())
+
+
+class StubResult:
+    def __init__(self, boxes: StubBoxes):
+        self.boxes = boxes
+
+
+class StubDetector:
+    """
+    SKU 탐지 모델 대체. 이미지를 격자로 나누어 칸마다 겹치지 않는 박스 하나씩,
+    이미지당 boxes_per_image개의 박스를 반환합니다. (박스 정리 단계에서 제거되지 않도록)
+    """
+
+    def __init__(self, boxes_per_image: int = 10, forward_ms: float = 20.0, per_item_ms: float = 5.0):
+        self.boxes_per_image = boxes_per_image
+        self.forward_ms = forward_ms
+        self.per_item_ms = per_item_ms
+        self.names = {0: "item"}
+
+    def __call__(self, source, conf: float = 0.25, imgsz: int = 640, verbose: bool = False, **kwargs):
+        import cv2
+
+        images = source if isinstance(source, list) else [source]
+        # 실제 모델과 같은 크기로 리사이즈하여 전처리 비용을 반영합니다.
+        for image in images:
+            cv2.resize(image, (imgsz, imgsz), interpolation=cv2.INTER_LINEAR)
+        time.sleep((self.forward_ms + self.per_item_ms * len(images)) / 1000)
+        return [self._detect(image.shape[1], image.shape[0], conf) for image in images]
+
+    def _detect(self, width: int, height: int, conf: float) -> StubResult:
+        count = self.boxes_per_image
+        grid = max(1, math.ceil(math.sqrt(count)))
+        cell_w, cell_h = width / grid, height / grid
+        cells = np.arange(count)
+        x0 = (cells % grid) * cell_w + cell_w * 0.1
+        y0 = (cells // grid) * cell_h + cell_h * 0.1
+        xyxy = np.stack([x0, y0, x0 + cell_w * 0.8, y0 + cell_h * 0.8], axis=1).astype(np.float32)
+        scores = np.linspace(0.9, 0.3, count, dtype=np.float32) if count else np.zeros(0, dtype=np.float32)
+        keep = scores >= conf
+        return StubResult(StubBoxes(xyxy[keep], scores[keep]))
+
+    def warmup(self, imgsz: int):
+        pass
+
+
+class StubClassifier:
+    """
+    YOLO 크롭 분류 모델 대체. forward()가 실제 엔진과 같은 (B, 4 + num_classes, num_anchors)
+    원시 출력을 반환하므로 classify_batch의 후처리까지 그대로 실행됩니다.
+    """
+
+    NUM_ANCHORS = 16
+
+    def __init__(self, forward_ms: float = 10.0, per_item_ms: float = 3.0):
+        self.forward_ms = forward_ms
+        self.per_item_ms = per_item_ms
+        self.names = dict(enumerate(sorted(YOLO_TO_DB_MAP)))
+        rng = np.random.default_rng(0)
+        self._weight = rng.standard_normal((len(self.names), 3)).astype(np.float32)
+
+    def forward(self, batch):
+        import torch
+        import torch.nn.functional as F
+
+        # 입력 픽셀에 실제로 의존하는 가벼운 연산으로 클래스 점수를 만듭니다.
+        pooled = F.adaptive_avg_pool2d(batch, 4).flatten(2)  # (B, 3, 16)
+        logits = torch.einsum("kc,bca->bka", torch.from_numpy(self._weight), pooled)
+        scores = torch.sigmoid(logits * 4 + 1)
+        boxes = torch.zeros((batch.shape[0], 4, self.NUM_ANCHORS))
+        time.sleep((self.forward_ms + self.per_item_ms * batch.shape[0]) / 1000)
+        return torch.cat([boxes, scores], dim=1)
+
+    def warmup(self, imgsz: int):
+        pass
+
+
+def install_stub_models(boxes_per_image: int = 10, sku_forward_ms: float = 20.0, sku_per_image_ms: float = 5.0,
+                        yolo_forward_ms: float = 10.0, yolo_per_crop_ms: float = 3.0):
+    """대체 모델을 model_registry에 설치하고 (detector, classifier)를 반환합니다."""
+    from app.inference.registry import model_registry
+
+    detector = StubDetector(boxes_per_image, sku_forward_ms, sku_per_image_ms)
+    classifier = StubClassifier(yolo_forward_ms, yolo_per_crop_ms)
+    model_registry.install("sku", detector, version="stub")
+    model_registry.install("yolo", classifier, version="stub")
+    return detector, classifier
@@ -0,0 +1,136 @@
+# app/cache/detection_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from config import Config
+from app.db.redis_client import get_redis
+from app.db.database import (get_engine, fetch_cached_result, insert_cached_result, prune_cached_results,
+                             delete_cached_result)
+from app.inference.model_versions import get_model_versions
+
+# Redis 키 구성
+RESULT_KEY = "classify:result:{cache_key}"
+INDEX_KEY = "classify:result:index"  # cache_key -> 마지막 사용 시각 (LRU 제거용)
+
+
+def content_hash(image_bytes: bytes) -> str:
+    """업로드 원본 바이트의 SHA-256 해시"""
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+class DetectionResultCache:
+    """
+    같은 사진을 다시 업로드했을 때 추론을 건너뛰기 위한 탐지 결과 캐시입니다.
+    Redis(1차)와 DB(2차)에 저장하며, 키에 모델 가중치 버전이 포함되므로
+    가중치를 교체하면 기존 항목은 자동으로 무효화됩니다.
+    """
+
+    def __init__(self, redis_client=None):
+        self._redis = redis_client
+        self._prune_lock = threading.Lock()
+        self._inserts_since_prune = 0
+        self._pruning = False
+
+    @property
+    def redis(self):
+        return self._redis if self._redis is not None else get_redis()
+
+    def build_key(self, image_hash: str, **variant) -> str:
+        """업로드 해시, 모델 버전, 추론 옵션(variant)으로 캐시 키를 만듭니다."""
+        parts = {"content": image_hash, "models": get_model_versions(), "variant": variant}
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, conn, cache_key: str):
+        """캐시된 {image_id, payload}를 반환합니다. Redis에 없으면 DB를 확인하고 Redis를 다시 채웁니다."""
+        try:
+            raw = self.redis.get(RESULT_KEY.format(cache_key=cache_key))
+            if raw is not None:
+                self.redis.zadd(INDEX_KEY, {cache_key: time.time()})
+                return json.loads(raw)
+        except Exception as e:
+            print(f"[RESULT CACHE] Redis lookup failed: {e}")
+
+        row = fetch_cached_result(conn, cache_key, Config.RESULT_CACHE_TTL)
+        if not row:
+            return None
+
+        entry = {"image_id": row["image_id"], "payload": json.loads(row["payload"])}
+        self._put_redis(cache_key, entry)
+        return entry
+
+    def put(self, conn, cache_key: str, image_hash: str, image_id: int, payload: dict):
+        """
+        탐지 결과를 Redis와 DB에 저장합니다.
+        만료/초과 항목 정리는 업로드 트랜잭션 밖에서 RESULT_CACHE_PRUNE_EVERY번 저장마다 한 번 실행합니다.
+        """
+        entry = {"image_id": image_id, "payload": payload}
+        insert_cached_result(conn, cache_key, image_hash, image_id, json.dumps(payload, ensure_ascii=False))
+        self._put_redis(cache_key, entry)
+        self._schedule_prune()
+
+    def _schedule_prune(self):
+        """저장 횟수가 RESULT_CACHE_PRUNE_EVERY에 이르면 별도 연결을 쓰는 백그라운드 스레드에서 정리합니다."""
+        with self._prune_lock:
+            self._inserts_since_prune += 1
+            if self._pruning or self._inserts_since_prune < Config.RESULT_CACHE_PRUNE_EVERY:
+                return
+            self._inserts_since_prune = 0
+            self._pruning = True
+        threading.Thread(target=self._prune, name="result-cache-prune", daemon=True).start()
+
+    def _prune(self):
+        try:
+            engine = get_engine()
+            if engine:
+                with engine.begin() as conn:
+                    prune_cached_results(conn, Config.RESULT_CACHE_TTL, Config.RESULT_CACHE_MAX_ENTRIES)
+        except Exception as e:
+            print(f"[RESULT CACHE] Failed to prune cached results: {e}")
+        finally:
+            with self._prune_lock:
+                self._pruning = False
+
+    def _after_fork(self):
+        # 정리 스레드는 자식 프로세스로 복사되지 않으므로 상태와 잠금을 새로 만듭니다.
+        self._prune_lock = threading.Lock()
+        self._inserts_since_prune = 0
+        self._pruning = False
+
+    def delete(self, conn, cache_key: str):
+        """항목을 Redis와 DB에서 지웁니다. (연결된 이미지가 삭제된 경우 등)"""
+        delete_cached_result(conn, cache_key)
+        try:
+            pipe = self.redis.pipeline()
+            pipe.delete(RESULT_KEY.format(cache_key=cache_key))
+            pipe.zrem(INDEX_KEY, cache_key)
+            pipe.execute()
+        except Exception as e:
+            print(f"[RESULT CACHE] Redis delete failed: {e}")
+
+    def _put_redis(self, cache_key: str, entry: dict):
+        try:
+            pipe = self.redis.pipeline()
+            pipe.set(RESULT_KEY.format(cache_key=cache_key), json.dumps(entry, ensure_ascii=False),
+                     ex=Config.RESULT_CACHE_TTL)
+            pipe.zadd(INDEX_KEY, {cache_key: time.time()})
+            pipe.execute()
+            self._evict_redis()
+        except Exception as e:
+            print(f"[RESULT CACHE] Redis store failed: {e}")
+
+    def _evict_redis(self):
+        """인덱스 크기가 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다."""
+        overflow = self.redis.zcard(INDEX_KEY) - Config.RESULT_CACHE_MAX_ENTRIES
+        if overflow <= 0:
+            return
+        evicted = self.redis.zpopmin(INDEX_KEY, overflow)
+        keys = [RESULT_KEY.format(cache_key=k.decode() if isinstance(k, bytes) else k) for k, _ in evicted]
+        if keys:
+            self.redis.delete(*keys)
+
+
+# 싱글톤 인스턴스
+detection_cache = DetectionResultCache()
+os.register_at_fork(after_in_child=detection_cache._after_fork)
@@ -0,0 +1,197 @@
+# app/cache/item_results_cache.py
+"""
+이미지별 상세 탐지 결과(DetectedItemModel.get_detailed_by_image_id)의 read-through 캐시입니다.
+결과는 응답 그대로 쓸 수 있도록 JSON 문자열로 Redis에 저장합니다.
+
+- 조회: 값이 없으면 한 워커만 잠금(SET NX)을 잡고 DB에서 다시 계산합니다. (single-flight)
+  다른 워커는 잠금이 풀리거나 값이 채워질 때까지 기다렸다가 그 값을 사용합니다.
+- 무효화: /api/items/add, /api/items/delete는 커밋 후 refresh()로 세대(generation)를 올리고 새 결과를 다시 씁니다.
+  계산 시작 시점의 세대가 저장 시점과 다르면(그 사이 쓰기가 있었으면) 저장하지 않으므로
+  늦게 끝난 계산이 최신 결과를 덮어쓰지 않습니다.
+- 규정 정보(items)가 바뀌면 clear()로 전체 세대(epoch)를 올리고 모든 항목을 지웁니다.
+- 빈 결과는 저장하지 않습니다. (아직 만들어지지 않은 image_id의 빈 목록이 남지 않도록)
+- Redis 오류 시에는 캐시 없이 DB에서 바로 계산합니다.
+"""
+import json
+import time
+import uuid
+import redis
+from config import Config
+from app.db.redis_client import get_redis
+from app.monitoring.metrics import record_item_results_lookup
+
+# Redis 키 구성
+VALUE_KEY = "items:results:{image_id}:json"
+GENERATION_KEY = "items:results:{image_id}:gen"  # 쓰기마다 증가
+LOCK_KEY = "items:results:{image_id}:lock"  # 다시 계산 중인 워커의 토큰
+EPOCH_KEY = "items:results:epoch"  # 전체 무효화마다 증가
+
+# 잠금을 잡은 워커의 토큰이 같을 때만 잠금을 지웁니다.
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# 다른 워커의 계산을 기다릴 때 확인 간격 (초)
+WAIT_INTERVAL = 0.02
+
+EMPTY_RESULTS = "[]"
+
+
+def _version(value) -> int:
+    return int(value) if value is not None else 0
+
+
+def _text(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class ItemResultsCache:
+    def __init__(self, redis_client=None):
+        self._redis = redis_client
+
+    @property
+    def redis(self):
+        return self._redis if self._redis is not None else get_redis()
+
+    def get_json(self, image_id: int, load) -> str:
+        """
+        image_id의 상세 결과 JSON을 반환합니다.
+        load: 캐시에 없을 때 결과 목록을 DB에서 만드는 함수
+        """
+        start = time.perf_counter()
+        if not Config.ITEM_RESULTS_CACHE_ENABLED:
+            return json.dumps(load(), ensure_ascii=False)
+
+        try:
+            cached, generation, epoch = self.redis.mget(
+                VALUE_KEY.format(image_id=image_id), GENERATION_KEY.format(image_id=image_id), EPOCH_KEY)
+        except Exception as e:
+            print(f"[ITEM RESULTS CACHE] Redis lookup failed: {e}")
+            return self._load_uncached(load, start)
+
+        if cached is not None:
+            record_item_results_lookup("hit", time.perf_counter() - start)
+            return _text(cached)
+
+        token = uuid.uuid4().hex
+        if not self._acquire(image_id, token):
+            payload = self._wait_for(image_id)
+            if payload is not None:
+                record_item_results_lookup("coalesced", time.perf_counter() - start)
+                return payload
+            # 기다려도 채워지지 않으면(빈 결과, 계산 실패 등) 직접 계산합니다.
+            return self._load_uncached(load, start)
+
+        try:
+            payload = json.dumps(load(), ensure_ascii=False)
+            self._store(image_id, payload, (_version(generation), _version(epoch)))
+        finally:
+            self._release(image_id, token)
+        record_item_results_lookup("miss", time.perf_counter() - start)
+        return payload
+
+    def refresh(self, image_id: int, load) -> str:
+        """
+        image_id의 결과가 바뀐 뒤(커밋 후) 호출합니다.
+        기존 항목을 무효화하고 새 결과를 계산해 다시 저장한 뒤 그 JSON을 반환합니다.
+        """
+        if not Config.ITEM_RESULTS_CACHE_ENABLED:
+            return json.dumps(load(), ensure_ascii=False)
+
+        try:
+            versions = self.invalidate(image_id)
+        except Exception as e:
+            # 무효화하지 못하면 이전 결과가 TTL 동안 남을 수 있으므로 로그를 남깁니다.
+            print(f"[ITEM RESULTS CACHE] Failed to invalidate image {image_id}: {e}")
+            return json.dumps(load(), ensure_ascii=False)
+
+        payload = json.dumps(load(), ensure_ascii=False)
+        self._store(image_id, payload, versions)
+        return payload
+
+    def invalidate(self, image_id: int) -> tuple:
+        """항목을 지우고 세대를 올립니다. 새 (세대, 전체 세대)를 반환합니다."""
+        generation_key = GENERATION_KEY.format(image_id=image_id)
+        pipe = self.redis.pipeline()
+        pipe.incr(generation_key)
+        # 세대 키는 값보다 오래 남아야 하므로 TTL의 두 배로 둡니다.
+        pipe.expire(generation_key, Config.ITEM_RESULTS_CACHE_TTL * 2)
+        pipe.delete(VALUE_KEY.format(image_id=image_id))
+        pipe.get(EPOCH_KEY)
+        generation, _, _, epoch = pipe.execute()
+        return generation, _version(epoch)
+
+    def clear(self):
+        """모든 이미지의 항목을 무효화합니다. (규정 정보 변경 시)"""
+        try:
+            self.redis.incr(EPOCH_KEY)
+            keys = list(self.redis.scan_iter(match=VALUE_KEY.format(image_id="*"), count=500))
+            for i in range(0, len(keys), 500):
+                self.redis.delete(*keys[i:i + 500])
+            print(f"[ITEM RESULTS CACHE] Cleared {len(keys)} entries")
+        except Exception as e:
+            print(f"[ITEM RESULTS CACHE] Failed to clear: {e}")
+
+    def _load_uncached(self, load, start: float) -> str:
+        payload = json.dumps(load(), ensure_ascii=False)
+        record_item_results_lookup("bypass", time.perf_counter() - start)
+        return payload
+
+    def _acquire(self, image_id: int, token: str) -> bool:
+        try:
+            return bool(self.redis.set(LOCK_KEY.format(image_id=image_id), token, nx=True,
+                                       px=int(Config.ITEM_RESULTS_CACHE_LOCK_TIMEOUT * 1000)))
+        except Exception as e:
+            print(f"[ITEM RESULTS CACHE] Failed to acquire lock: {e}")
+            # 잠금을 확인할 수 없으면 직접 계산합니다. (저장은 세대 확인으로 보호됨)
+            return True
+
+    def _release(self, image_id: int, token: str):
+        try:
+            self.redis.eval(RELEASE_LOCK_SCRIPT, 1, LOCK_KEY.format(image_id=image_id), token)
+        except Exception as e:
+            print(f"[ITEM RESULTS CACHE] Failed to release lock: {e}")
+
+    def _wait_for(self, image_id: int):
+        """다른 워커가 계산한 값을 기다립니다. 잠금이 풀렸는데 값이 없거나 시간이 지나면 None."""
+        value_key = VALUE_KEY.format(image_id=image_id)
+        lock_key = LOCK_KEY.format(image_id=image_id)
+        deadline = time.monotonic() + Config.ITEM_RESULTS_CACHE_LOCK_TIMEOUT
+        try:
+            while time.monotonic() < deadline:
+                time.sleep(WAIT_INTERVAL)
+                cached, locked = self.redis.mget(value_key, lock_key)
+                if cached is not None:
+                    return _text(cached)
+                if locked is None:
+                    return None
+        except Exception as e:
+            print(f"[ITEM RESULTS CACHE] Redis wait failed: {e}")
+        return None
+
+    def _store(self, image_id: int, payload: str, versions: tuple):
+        """계산을 시작한 뒤 세대가 바뀌지 않았을 때만 저장합니다."""
+        if payload == EMPTY_RESULTS:
+            return
+        generation_key = GENERATION_KEY.format(image_id=image_id)
+        try:
+            with self.redis.pipeline() as pipe:
+                pipe.watch(generation_key, EPOCH_KEY)
+                current = tuple(_version(v) for v in pipe.mget(generation_key, EPOCH_KEY))
+                if current != tuple(versions):
+                    return
+                pipe.multi()
+                pipe.set(VALUE_KEY.format(image_id=image_id), payload, ex=Config.ITEM_RESULTS_CACHE_TTL)
+                pipe.execute()
+        except redis.WatchError:
+            # 확인과 저장 사이에 쓰기가 있었으면 다음 조회에서 다시 계산합니다.
+            pass
+        except Exception as e:
+            print(f"[ITEM RESULTS CACHE] Redis store failed: {e}")
+
+
+# 싱글톤 인스턴스
+item_results_cache = ItemResultsCache()
@@ -0,0 +1,134 @@
+# app/cache/items_snapshot.py
+"""
+/api/items/all 응답용 규정 목록 스냅샷입니다.
+
+- 전체 목록을 메모리에 두고, 응답 본문(JSON)과 gzip/brotli 압축본을 미리 만들어 둡니다.
+- 버전은 DB의 items_catalog_version(items 트리거가 추가/수정/삭제마다 증가)이므로 모든 워커에서 같고,
+  ETag(W/"items-v<버전>")와 ?since=<버전> 증분 조회에 사용합니다.
+- 이 프로세스에서 items를 커밋하면 바로, 그 밖의 변경은 최대 Config.ITEMS_SNAPSHOT_CHECK_INTERVAL초 뒤에
+  버전을 확인하고 바뀐 행만 다시 읽어 스냅샷을 갱신합니다. (본문과 압축본은 다시 만듦)
+- v0006 마이그레이션 전(버전 테이블 없음)에는 확인 주기마다 전체 목록을 다시 읽고, ETag는 본문 해시로 만들며
+  ?since= 요청에도 전체 목록을 제공합니다.
+- brotli는 선택 의존성입니다. (Brotli 패키지가 없으면 gzip만 제공)
+"""
+import gzip
+import hashlib
+import json
+import threading
+import time
+from config import Config
+from app.db.database import get_engine, fetch_catalog_version, fetch_catalog_changes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 응답에 포함하는 컬럼 (row_version은 내부 관리용)
+PUBLIC_COLUMNS = ("id", "item_name", "item_name_EN", "carry_on_allowed", "checked_baggage_allowed",
+                  "notes", "notes_EN", "source")
+
+# 스냅샷은 요청 안에서(잠금을 잡은 채) 다시 만들므로 최고 압축률 대신 빠른 수준을 사용합니다.
+# (크기는 몇 % 커지지만 brotli 11보다 수십 배, gzip 9보다 수 배 빠름)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def _public(row: dict) -> dict:
+    return {column: row[column] for column in PUBLIC_COLUMNS}
+
+
+class _Snapshot:
+    """한 버전의 목록과 미리 인코딩된 본문 (만든 뒤에는 바꾸지 않음)"""
+
+    def __init__(self, version, rows: dict, removed: dict):
+        self.version = version  # None이면 버전 관리 전 (증분 조회 불가)
+        self.rows = rows  # {id: 행 dict (버전 관리 중이면 row_version 포함)}
+        self.removed = removed  # {삭제된 id: 삭제 버전}
+        self.body = json.dumps([_public(rows[item_id]) for item_id in sorted(rows)],
+                               ensure_ascii=False).encode("utf-8")
+        if version is None:
+            self.etag = f"items-h{hashlib.sha1(self.body).hexdigest()[:16]}"
+        else:
+            self.etag = f"items-v{version}"
+        self.encoded = {"gzip": gzip.compress(self.body, compresslevel=GZIP_LEVEL)}
+        if brotli is not None:
+            self.encoded["br"] = brotli.compress(self.body, quality=BROTLI_QUALITY)
+
+    def delta(self, since: int):
+        """since 버전 이후 추가/수정된 행과 삭제된 id. 버전 관리 전이면 None (전체 목록을 제공해야 함)"""
+        if self.version is None:
+            return None
+        return {
+            "version": self.version,
+            "since": since,
+            "items": [_public(self.rows[item_id]) for item_id in sorted(self.rows)
+                      if self.rows[item_id]["row_version"] > since],
+            "removed_ids": sorted(item_id for item_id, version in self.removed.items() if version > since),
+        }
+
+
+class ItemsSnapshot:
+    def __init__(self):
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._stale = False
+
+    def get(self) -> _Snapshot:
+        """현재 스냅샷을 반환합니다. 처음 호출되거나 확인 주기가 지났으면 DB 버전을 확인해 갱신합니다."""
+        snapshot = self._snapshot
+        if snapshot is not None and not self._stale \
+                and time.monotonic() - self._checked_at < Config.ITEMS_SNAPSHOT_CHECK_INTERVAL:
+            return snapshot
+
+        with self._lock:
+            # 기다리는 동안 다른 스레드가 갱신했을 수 있습니다.
+            if self._snapshot is not snapshot:
+                return self._snapshot
+            try:
+                self._snapshot = self._refresh(snapshot)
+            except Exception as e:
+                if snapshot is None:
+                    raise
+                # 갱신에 실패하면 이전 스냅샷을 계속 제공하고 다음 주기에 다시 시도합니다.
+                print(f"[ITEMS SNAPSHOT] Refresh failed: {e}")
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def mark_stale(self):
+        """이 프로세스에서 items 변경이 커밋되었을 때 호출합니다. 다음 요청에서 바로 갱신합니다."""
+        self._stale = True
+
+    def _refresh(self, snapshot: _Snapshot) -> _Snapshot:
+        self._stale = False
+        with get_engine().connect() as conn, conn.begin():
+            version = fetch_catalog_version(conn)
+            if snapshot is not None and version is not None and version == snapshot.version:
+                return snapshot
+            # 처음이거나 버전 관리 전(마이그레이션 전)에는 전체 목록을 다시 읽습니다.
+            full = snapshot is None or version is None or snapshot.version is None
+            changes = fetch_catalog_changes(conn, since_version=None if full else snapshot.version)
+
+        if full:
+            rows = {row["id"]: row for row in changes["rows"]}
+            if snapshot is not None and snapshot.version == changes["version"] and snapshot.rows == rows:
+                return snapshot
+            print(f"[ITEMS SNAPSHOT] Built version {changes['version']} ({len(rows)} items)")
+            return _Snapshot(changes["version"], rows, changes["removed"])
+
+        rows = dict(snapshot.rows)
+        removed = dict(snapshot.removed)
+        for row in changes["rows"]:
+            rows[row["id"]] = row
+            removed.pop(row["id"], None)
+        for item_id, version in changes["removed"].items():
+            rows.pop(item_id, None)
+            removed[item_id] = version
+        print(f"[ITEMS SNAPSHOT] Updated to version {changes['version']} "
+              f"({len(changes['rows'])} changed, {len(changes['removed'])} removed)")
+        return _Snapshot(changes["version"], rows, removed)
+
+
+# 싱글톤 인스턴스
+items_snapshot = ItemsSnapshot()
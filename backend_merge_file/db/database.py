@@ -1,50 +1,58 @@
 from flask_sqlalchemy import SQLAlchemy
+import db_pool
 
-db = SQLAlchemy()
+
+class SharedEngineSQLAlchemy(SQLAlchemy):
+    """기본 bind에 별도 엔진을 만들지 않고 db_pool의 공유 풀 엔진을 사용하는 Flask-SQLAlchemy"""
+
+    def _make_engine(self, bind_key, options, app):
+        if bind_key is None:
+            return db_pool.get_engine()
+        return super()._make_engine(bind_key, options, app)
+
+
+db = SharedEngineSQLAlchemy()
+
+
+def _register_pool_metrics():
+    from app.monitoring import metrics
+
+    db_pool.add_wait_observer(metrics.record_db_pool_wait)
+    for key, metric_type, documentation in (
+        ("checkouts", "counter", "Connections checked out from the shared DB pool."),
+        ("timeouts", "counter", "Checkouts that failed waiting for a pooled connection."),
+        ("connects", "counter", "New DB connections opened by the shared pool."),
+        ("checked_out", "gauge", "Connections currently checked out from the shared DB pool."),
+        ("overflow", "gauge", "Current overflow of the shared DB pool beyond pool_size."),
+    ):
+        suffix = "_total" if metric_type == "counter" else ""
+        metrics.register_collected(f"passcheckers_db_pool_{key}{suffix}", documentation, metric_type,
+                                   lambda key=key: db_pool.pool_stats().get(key))
+
+
+_register_pool_metrics()
 
 # app/db/database.py
-import pandas as pd
-from sqlalchemy import create_engine, exc, text
-from datetime import datetime
-from config import Config
-import pymysql
-import os
-from urllib.parse import urlparse
+from sqlalchemy import bindparam, column, exc, insert, table, text
+from datetime import datetime, timedelta
+from app.storage.blob_store import get_blob_store, sniff_content_type
 
 def get_engine():
     """
-    DB 연결 엔진 생성
+    프로세스 공유 DB 엔진 반환 (연결 풀은 db_pool에서 관리)
     """
     try:
-        engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
-        return engine
+        return db_pool.get_engine()
     except exc.SQLAlchemyError as e:
         print(f"[DB ERROR] {e}")
         return None
 
 def get_db_connection():
     """
-    PyMySQL 연결을 생성하여 반환합니다.
-    환경 변수 'DATABASE_URL'이 있으면 사용하고, 없으면 config 파일의 값을 사용합니다.
+    공유 풀에서 PyMySQL 연결을 빌려 반환합니다. (커서는 DictCursor)
+    close()를 호출하면 연결이 닫히지 않고 풀로 돌아갑니다.
     """
-    url = os.environ.get('DATABASE_URL')
-    if url is None:
-        url = Config.SQLALCHEMY_DATABASE_URI
-
-    # SQLAlchemy의 URI 형식(mysql+pymysql://)을 urlparse가 이해할 수 있도록 변경
-    if 'mysql+pymysql://' in url:
-        url = url.replace('mysql+pymysql://', 'mysql://')
-
-    parsed = urlparse(url)
-    return pymysql.connect(
-        host=parsed.hostname,
-        user=parsed.username,
-        password=parsed.password,
-        database=parsed.path.lstrip('/'),
-        port=parsed.port or 3306,
-        charset='utf8mb4',
-        cursorclass=pymysql.cursors.DictCursor
-    )
+    return db_pool.raw_connection()
 
 def fetch_item_info(item_name_en: str):
     """
@@ -56,7 +64,7 @@ def fetch_item_info(item_name_en: str):
 
     try:
         query = text("""
-            SELECT item_name, item_name_EN, carry_on_allowed, checked_baggage_allowed, notes
+            SELECT id, item_name, item_name_EN, carry_on_allowed, checked_baggage_allowed, notes
             FROM items
             WHERE item_name_EN = :item_name_en
             LIMIT 1
@@ -72,18 +80,105 @@ def fetch_item_info(item_name_en: str):
         return None
 
 
+def fetch_items_by_english_names(item_names_en):
+    """
+    여러 물품 영어 이름의 규정 정보를 한 번의 쿼리로 조회합니다.
+    {소문자 item_name_EN: 정보 dict}를 반환합니다. (MySQL 기본 collation처럼 대소문자를 구분하지 않음)
+    같은 이름이 여러 행이면 id가 가장 작은 행을 사용합니다.
+    """
+    names = sorted(set(item_names_en))
+    if not names:
+        return {}
+
+    query = text("""
+        SELECT id, item_name, item_name_EN, carry_on_allowed, checked_baggage_allowed, notes
+        FROM items
+        WHERE item_name_EN IN :names
+        ORDER BY id
+    """).bindparams(bindparam("names", expanding=True))
+    with get_engine().connect() as conn:
+        rows = conn.execute(query, {"names": names}).mappings().fetchall()
+
+    items = {}
+    for row in rows:
+        items.setdefault(row["item_name_EN"].lower(), dict(row))
+    return items
+
+
+# --- 규정 목록 버전 (items 트리거가 row_version과 items_catalog_version을 갱신) ---
+ITEM_COLUMNS = "id, item_name, item_name_EN, carry_on_allowed, checked_baggage_allowed, notes, notes_EN, source"
+CATALOG_COLUMNS = ITEM_COLUMNS + ", row_version"
+
+# v0006 마이그레이션 적용 여부 (한 번 확인되면 다시 조회하지 않음)
+_catalog_versioned = False
+
+
+def catalog_versioning_ready(conn) -> bool:
+    """items_catalog_version 테이블과 items.row_version 컬럼(v0006 마이그레이션)이 있는지"""
+    global _catalog_versioned
+    if not _catalog_versioned:
+        _catalog_versioned = conn.execute(text("""
+            SELECT (SELECT COUNT(*) FROM information_schema.TABLES
+                    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'items_catalog_version')
+                 + (SELECT COUNT(*) FROM information_schema.COLUMNS
+                    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'items' AND COLUMN_NAME = 'row_version')
+        """)).scalar() == 2
+    return _catalog_versioned
+
+
+def fetch_catalog_version(conn):
+    """
+    items 전체의 현재 버전 (행이 추가/수정/삭제될 때마다 증가)
+    v0006 마이그레이션 전이면 None (버전으로 변경을 알 수 없음)
+    """
+    if not catalog_versioning_ready(conn):
+        return None
+    return conn.execute(text("SELECT version FROM items_catalog_version WHERE id = 1")).scalar() or 0
+
+
+def fetch_catalog_changes(conn, since_version: int = None) -> dict:
+    """
+    since_version 이후 추가/수정된 items 행과 삭제된 id를 조회합니다. (None이면 전체)
+    {"version", "rows": [행 dict], "removed": {id: 삭제 버전}}
+    호출하는 쪽의 트랜잭션 안에서 실행하면 버전과 행이 같은 시점의 스냅샷에서 읽힙니다.
+    v0006 마이그레이션 전이면 since_version과 관계없이 전체 행을 version None으로 반환합니다.
+    """
+    version = fetch_catalog_version(conn)
+    if version is None:
+        rows = conn.execute(text(f"SELECT {ITEM_COLUMNS} FROM items ORDER BY id")).mappings().fetchall()
+        return {"version": None, "rows": [dict(row) for row in rows], "removed": {}}
+
+    params = {"since": since_version or 0}
+    if since_version is None:
+        rows = conn.execute(text(f"SELECT {CATALOG_COLUMNS} FROM items ORDER BY id")).mappings().fetchall()
+    else:
+        rows = conn.execute(text(f"SELECT {CATALOG_COLUMNS} FROM items WHERE row_version > :since ORDER BY id"),
+                            params).mappings().fetchall()
+    removed = conn.execute(text("SELECT id, row_version FROM items_tombstones WHERE row_version > :since"),
+                           params).fetchall()
+    return {
+        "version": version,
+        "rows": [dict(row) for row in rows],
+        "removed": {item_id: row_version for item_id, row_version in removed},
+    }
+
+
 # --- 이미지 저장 ---
 def insert_image(conn, user_id: str, image_bytes: bytes, width: int, height: int):
     """
-    이미지 데이터와 크기를 DB에 저장하고 image_id 반환.
+    이미지 원본은 blob 저장소에 저장하고, DB에는 blob 키와 크기/형식 메타데이터만 저장한 뒤 image_id 반환.
+    (같은 내용은 같은 blob을 공유합니다. 트랜잭션이 롤백되면 blob만 남을 수 있으며, 다음 같은 업로드가 재사용합니다.)
     """
+    blob_key = get_blob_store().put(image_bytes)
     image_query = text("""
-        INSERT INTO images (user_id, image_data, created_at, width, height)
-        VALUES (:user_id, :image_data, :created_at, :width, :height)
+        INSERT INTO images (user_id, blob_key, byte_size, content_type, created_at, width, height)
+        VALUES (:user_id, :blob_key, :byte_size, :content_type, :created_at, :width, :height)
     """)
     result = conn.execute(image_query, {
         "user_id": user_id,
-        "image_data": image_bytes,
+        "blob_key": blob_key,
+        "byte_size": len(image_bytes),
+        "content_type": sniff_content_type(image_bytes),
         "created_at": datetime.now(),
         "width": width,
         "height": height
@@ -92,29 +187,103 @@ def insert_image(conn, user_id: str, image_bytes: bytes, width: int, height: int
 
 
 # --- 탐지된 아이템 저장 ---
-def insert_detected_item(conn, image_id: int, item_name_en: str, item_name: str, bbox: list):
+detected_items_table = table(
+    "detected_items",
+    column("image_id"), column("item_name_EN"), column("item_name"),
+    column("bbox_x_min"), column("bbox_y_min"), column("bbox_x_max"), column("bbox_y_max"),
+    column("packing_info"), column("model_version"), column("regulation_item_id"),
+)
+
+
+def detected_item_row(image_id: int, item_name_en: str, item_name: str, bbox: list,
+                      model_version: str = None, packing_info: str = None, regulation_item_id: int = None) -> dict:
     """
-    탐지된 아이템을 DB에 저장.
+    insert_detected_items()에 넘길 행 하나를 만듭니다. packing_info가 없으면 테이블 기본값을 사용합니다.
+    regulation_item_id: 규정 정보 행(items.id). 상세 조회는 이 정수 키로 조인합니다. (규정이 없으면 None)
     """
-    insert_query = text("""
-        INSERT INTO detected_items (image_id, item_name_EN, item_name,
-                                    bbox_x_min, bbox_y_min, bbox_x_max, bbox_y_max)
-        VALUES (:image_id, :item_name_en, :item_name, :bbox_x_min, :bbox_y_min, :bbox_x_max, :bbox_y_max)
-    """)
-    conn.execute(insert_query, {
+    row = {
         "image_id": image_id,
-        "item_name_en": item_name_en,
+        "item_name_EN": item_name_en,
         "item_name": item_name,
         "bbox_x_min": bbox[0],
         "bbox_y_min": bbox[1],
         "bbox_x_max": bbox[2],
-        "bbox_y_max": bbox[3]
-    })
+        "bbox_y_max": bbox[3],
+        "model_version": model_version,
+        "regulation_item_id": regulation_item_id,
+    }
+    if packing_info is not None:
+        row["packing_info"] = packing_info
+    return row
+
+
+def insert_detected_items(conn, rows: list) -> list:
+    """
+    탐지된 아이템 여러 개를 한 번의 multi-row INSERT로 저장하고, 할당된 item_id 목록을 순서대로 반환합니다.
+    커밋은 호출하는 쪽에서 요청당 한 번 수행합니다.
+    (InnoDB는 한 INSERT 문에서 행 수가 정해진 경우 연속된 AUTO_INCREMENT 값을 할당하며,
+     lastrowid는 첫 번째 행의 id입니다. auto_increment_increment=1 기준)
+    """
+    if not rows:
+        return []
+    # 일부 행에만 있는 컬럼은 multi-row VALUES에서 모든 행에 필요하므로 기본값을 채웁니다.
+    if any("packing_info" in row for row in rows):
+        rows = [{"packing_info": "none", **row} for row in rows]
+    result = conn.execute(insert(detected_items_table).values(rows))
+    first_id = result.lastrowid
+    return list(range(first_id, first_id + len(rows)))
+
+
+def insert_detected_item(conn, image_id: int, item_name_en: str, item_name: str, bbox: list,
+                         model_version: str = None, regulation_item_id: int = None):
+    """
+    탐지된 아이템 하나를 DB에 저장하고 item_id를 반환합니다.
+    model_version: 탐지에 사용된 모델 버전 (예: 'sku:v1,yolo:v2')
+    """
+    row = detected_item_row(image_id, item_name_en, item_name, bbox, model_version,
+                            regulation_item_id=regulation_item_id)
+    return insert_detected_items(conn, [row])[0]
+
+
+def fetch_image_owner(conn, image_id: int):
+    """이미지 행의 user_id를 반환합니다. 행이 없으면 None."""
+    return conn.execute(text("SELECT user_id FROM images WHERE image_id = :image_id"),
+                        {"image_id": image_id}).scalar()
+
+
+def fetch_detected_items_with_regulations(conn, image_id: int) -> list:
+    """이미지의 현재 탐지 아이템과 규정 정보 (regulation_item_id로 조인, item_id 순)"""
+    query = text("""
+        SELECT d.item_id, d.item_name_EN, d.item_name, d.bbox_x_min, d.bbox_y_min, d.bbox_x_max, d.bbox_y_max,
+               d.regulation_item_id, i.carry_on_allowed, i.checked_baggage_allowed, i.notes
+        FROM detected_items d
+        LEFT OUTER JOIN items i ON d.regulation_item_id = i.id
+        WHERE d.image_id = :image_id
+        ORDER BY d.item_id
+    """)
+    return [dict(row) for row in conn.execute(query, {"image_id": image_id}).mappings()]
+
+
+def fetch_items_by_names(conn, item_names) -> dict:
+    """여러 물품(한글 이름)의 규정 정보를 한 번의 IN 쿼리로 조회합니다. {item_name: 정보 dict}"""
+    names = sorted(set(item_names))
+    if not names:
+        return {}
+
+    query = text("""
+        SELECT id, item_name, item_name_EN, carry_on_allowed, checked_baggage_allowed, notes
+        FROM items
+        WHERE item_name IN :names
+    """).bindparams(bindparam("names", expanding=True))
+    rows = conn.execute(query, {"names": names}).mappings().fetchall()
+    return {row["item_name"]: dict(row) for row in rows}
 
 
 def get_image_details_by_id(image_id: int):
     """
-    ID로 이미지 데이터와 크기를 DB에서 조회합니다.
+    ID로 이미지 메타데이터(blob 키, 크기, 형식, 가로/세로)를 DB에서 조회합니다.
+    원본 바이트는 읽지 않습니다. blob_key가 없으면 아직 옮기지 않은 기존 행이며(has_inline_data),
+    fetch_inline_image_data()로 DB의 원본을 읽습니다.
     """
     engine = get_engine()
     if not engine:
@@ -122,9 +291,10 @@ def get_image_details_by_id(image_id: int):
 
     try:
         query = text("""
-            SELECT image_data, width, height
+            SELECT image_id, blob_key, byte_size, content_type, width, height,
+                   image_data IS NOT NULL AS has_inline_data
             FROM images
-            WHERE id = :image_id
+            WHERE image_id = :image_id
             LIMIT 1
         """)
         with engine.connect() as conn:
@@ -135,4 +305,92 @@ def get_image_details_by_id(image_id: int):
                 return None
     except Exception as e:
         print(f"[DB QUERY ERROR] {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def fetch_inline_image_data(image_id: int):
+    """blob 저장소로 옮기지 않은 기존 행의 images.image_data를 읽습니다."""
+    query = text("SELECT image_data FROM images WHERE image_id = :image_id")
+    with get_engine().connect() as conn:
+        return conn.execute(query, {"image_id": image_id}).scalar()
+
+
+def fetch_inline_images(conn, after_image_id: int, limit: int):
+    """image_data가 DB에 남아 있는 행을 image_id 순으로 limit개 조회합니다. (blob 이전 도구용)"""
+    query = text("""
+        SELECT image_id, image_data
+        FROM images
+        WHERE image_id > :after_image_id AND blob_key IS NULL AND image_data IS NOT NULL
+        ORDER BY image_id
+        LIMIT :limit
+    """)
+    return conn.execute(query, {"after_image_id": after_image_id, "limit": limit}).mappings().fetchall()
+
+
+def set_image_blob(conn, image_id: int, blob_key: str, byte_size: int, content_type: str, clear_inline: bool = True):
+    """행을 blob 저장소의 원본과 연결하고, clear_inline이면 DB의 image_data를 비웁니다."""
+    query = text(f"""
+        UPDATE images
+        SET blob_key = :blob_key, byte_size = :byte_size, content_type = :content_type
+            {", image_data = NULL" if clear_inline else ""}
+        WHERE image_id = :image_id
+    """)
+    conn.execute(query, {"image_id": image_id, "blob_key": blob_key, "byte_size": byte_size,
+                         "content_type": content_type})
+
+
+# --- 탐지 결과 캐시 ---
+def fetch_cached_result(conn, cache_key: str, ttl_seconds: int):
+    """
+    캐시 키로 저장된 탐지 결과를 조회하고, 적중 시 마지막 사용 시각을 갱신합니다.
+    TTL이 지난 항목은 없는 것으로 처리합니다.
+    """
+    query = text("""
+        SELECT image_id, payload
+        FROM detection_result_cache
+        WHERE cache_key = :cache_key AND created_at >= :cutoff
+        LIMIT 1
+    """)
+    cutoff = datetime.now() - timedelta(seconds=ttl_seconds)
+    result = conn.execute(query, {"cache_key": cache_key, "cutoff": cutoff}).mappings().fetchone()
+    if not result:
+        return None
+
+    conn.execute(text("""
+        UPDATE detection_result_cache SET last_hit_at = :now WHERE cache_key = :cache_key
+    """), {"cache_key": cache_key, "now": datetime.now()})
+    return dict(result)
+
+
+def insert_cached_result(conn, cache_key: str, content_hash: str, image_id: int, payload: str):
+    """탐지 결과를 캐시 테이블에 저장합니다. (같은 키가 있으면 덮어씀)"""
+    now = datetime.now()
+    conn.execute(text("""
+        INSERT INTO detection_result_cache (cache_key, content_hash, image_id, payload, created_at, last_hit_at)
+        VALUES (:cache_key, :content_hash, :image_id, :payload, :now, :now)
+        ON DUPLICATE KEY UPDATE image_id = VALUES(image_id), payload = VALUES(payload),
+                                created_at = VALUES(created_at), last_hit_at = VALUES(last_hit_at)
+    """), {
+        "cache_key": cache_key,
+        "content_hash": content_hash,
+        "image_id": image_id,
+        "payload": payload,
+        "now": now
+    })
+
+
+def delete_cached_result(conn, cache_key: str):
+    conn.execute(text("DELETE FROM detection_result_cache WHERE cache_key = :cache_key"), {"cache_key": cache_key})
+
+
+def prune_cached_results(conn, ttl_seconds: int, max_entries: int):
+    """만료된 캐시 항목을 지우고, 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 지웁니다."""
+    cutoff = datetime.now() - timedelta(seconds=ttl_seconds)
+    conn.execute(text("DELETE FROM detection_result_cache WHERE created_at < :cutoff"), {"cutoff": cutoff})
+
+    count = conn.execute(text("SELECT COUNT(*) FROM detection_result_cache")).scalar()
+    overflow = count - max_entries
+    if overflow > 0:
+        conn.execute(text("""
+            DELETE FROM detection_result_cache ORDER BY last_hit_at ASC LIMIT :overflow
+        """), {"overflow": overflow})
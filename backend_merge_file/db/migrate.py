@@ -0,0 +1,133 @@
+# app/db/migrate.py
+"""
+버전별 스키마 마이그레이션 실행기입니다.
+
+- 마이그레이션은 app/db/migrations/v<번호>_<설명>.py 모듈이며, DESCRIPTION과 upgrade(engine)를 정의합니다.
+- 적용 기록은 schema_migrations 테이블에 남기고, 아직 적용하지 않은 버전만 번호 순으로 실행합니다.
+- MySQL DDL은 암묵적으로 커밋되므로 각 마이그레이션은 이미 적용된 부분을 확인하고 건너뛰도록(재실행 가능하게) 작성합니다.
+  (mysql 스키마 파일로 새로 만든 DB에서도 그대로 실행할 수 있습니다.)
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.db.migrate --status
+    python -m app.db.migrate
+    python -m app.db.migrate --target 3
+"""
+import argparse
+import importlib
+import os
+import re
+from sqlalchemy import text
+from app.db.database import get_engine
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+MIGRATION_PATTERN = re.compile(r"^v(\d+)_\w+\.py$")
+
+
+# --- 마이그레이션에서 사용하는 스키마 확인 함수 ---
+def column_exists(conn, table: str, column: str) -> bool:
+    return bool(conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = :column
+    """), {"table": table, "column": column}).scalar())
+
+
+def index_exists(conn, table: str, index: str) -> bool:
+    return bool(conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND INDEX_NAME = :index
+    """), {"table": table, "index": index}).scalar())
+
+
+def leading_index_exists(conn, table: str, column: str) -> bool:
+    """column을 첫 번째 컬럼으로 하는 인덱스(PK, UNIQUE, FK가 만든 인덱스 포함)가 있는지 확인합니다."""
+    return bool(conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = :column AND SEQ_IN_INDEX = 1
+    """), {"table": table, "column": column}).scalar())
+
+
+def foreign_key_exists(conn, table: str, constraint: str) -> bool:
+    return bool(conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.TABLE_CONSTRAINTS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table
+          AND CONSTRAINT_NAME = :constraint AND CONSTRAINT_TYPE = 'FOREIGN KEY'
+    """), {"table": table, "constraint": constraint}).scalar())
+
+
+def add_index(conn, table: str, index: str, columns: str):
+    """같은 컬럼으로 시작하는 인덱스가 없을 때만 인덱스를 추가합니다."""
+    first_column = columns.split(",")[0].strip().strip("`")
+    if index_exists(conn, table, index) or leading_index_exists(conn, table, first_column):
+        print(f"[MIGRATE]   {table}({columns}) is already indexed")
+        return
+    print(f"[MIGRATE]   CREATE INDEX {index} ON {table}({columns})")
+    conn.execute(text(f"CREATE INDEX `{index}` ON `{table}` ({columns})"))
+
+
+# --- 실행기 ---
+def discover_migrations() -> list:
+    """[(버전, 모듈 이름)] (버전 순)"""
+    migrations = []
+    for filename in os.listdir(MIGRATIONS_DIR):
+        match = MIGRATION_PATTERN.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), filename[:-3]))
+    return sorted(migrations)
+
+
+def _ensure_history_table(engine):
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT NOT NULL PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
+
+
+def applied_versions(engine) -> set:
+    _ensure_history_table(engine)
+    with engine.connect() as conn:
+        return set(conn.execute(text("SELECT version FROM schema_migrations")).scalars().all())
+
+
+def migrate(target: int = None, engine=None) -> list:
+    """
+    적용하지 않은 마이그레이션을 target 버전까지 실행하고, 실행한 버전 목록을 반환합니다.
+    engine을 주지 않으면 앱의 공유 엔진을 사용합니다. (테스트는 일회용 DB 엔진을 넘김)
+    """
+    engine = engine or get_engine()
+    applied = applied_versions(engine)
+    executed = []
+    for version, name in discover_migrations():
+        if version in applied or (target is not None and version > target):
+            continue
+        module = importlib.import_module(f"app.db.migrations.{name}")
+        print(f"[MIGRATE] Applying {name}: {module.DESCRIPTION}")
+        module.upgrade(engine)
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                         {"version": version, "name": name})
+        executed.append(version)
+    return executed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 스키마 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="적용 상태만 출력")
+    parser.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    args = parser.parse_args()
+
+    if args.status:
+        applied = applied_versions(get_engine())
+        for version, name in discover_migrations():
+            print(f"{'applied' if version in applied else 'pending':>8}  {name}")
+        return
+
+    executed = migrate(args.target)
+    print(f"[MIGRATE] Applied {len(executed)} migrations" + (f": {executed}" if executed else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+# app/db/migrations/v0001_detected_items_model_version.py
+from sqlalchemy import text
+from app.db.migrate import column_exists
+
+DESCRIPTION = "detected_items.model_version (탐지에 사용된 모델 버전)"
+
+
+def upgrade(engine):
+    with engine.begin() as conn:
+        if not column_exists(conn, "detected_items", "model_version"):
+            conn.execute(text("ALTER TABLE `detected_items` ADD COLUMN `model_version` VARCHAR(128) NULL"))
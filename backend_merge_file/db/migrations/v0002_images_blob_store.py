@@ -0,0 +1,14 @@
+# app/db/migrations/v0002_images_blob_store.py
+from sqlalchemy import text
+from app.db.migrate import column_exists
+
+DESCRIPTION = "images의 blob 저장소 컬럼 (원본 이전은 python -m app.storage.migrate_image_blobs)"
+
+
+def upgrade(engine):
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE `images` MODIFY `image_data` LONGBLOB NULL"))
+        for column, definition in (("blob_key", "CHAR(64) NULL"), ("byte_size", "INT NULL"),
+                                   ("content_type", "VARCHAR(64) NULL")):
+            if not column_exists(conn, "images", column):
+                conn.execute(text(f"ALTER TABLE `images` ADD COLUMN `{column}` {definition}"))
@@ -0,0 +1,16 @@
+# app/db/migrations/v0003_hot_query_indexes.py
+from app.db.migrate import add_index
+
+DESCRIPTION = "자주 실행되는 조회의 인덱스 (detected_items.image_id, items.item_name_EN, items.item_name, detection_result_cache.created_at)"
+
+
+def upgrade(engine):
+    with engine.begin() as conn:
+        # 이미지별 탐지 결과 조회 (get_detailed_by_image_id, /api/items/results)
+        add_index(conn, "detected_items", "idx_detected_items_image_id", "`image_id`")
+        # 규정 정보 조회 (fetch_item_info, 규정 조회 테이블 생성)
+        add_index(conn, "items", "idx_items_item_name_en", "`item_name_EN`")
+        # 한글 이름 조회 (/api/items/add, ItemModel.get_by_name)
+        add_index(conn, "items", "idx_items_item_name", "`item_name`")
+        # 만료된 탐지 결과 캐시 정리 (prune_cached_results)
+        add_index(conn, "detection_result_cache", "idx_detection_result_cache_created_at", "`created_at`")
@@ -0,0 +1,18 @@
+# app/db/migrations/v0004_detected_items_regulation_item_id.py
+from sqlalchemy import text
+from app.db.migrate import column_exists, add_index, foreign_key_exists
+
+DESCRIPTION = "detected_items.regulation_item_id (items.id 정수 외래 키)"
+
+
+def upgrade(engine):
+    with engine.begin() as conn:
+        if not column_exists(conn, "detected_items", "regulation_item_id"):
+            conn.execute(text("ALTER TABLE `detected_items` ADD COLUMN `regulation_item_id` INT NULL"))
+        add_index(conn, "detected_items", "idx_detected_items_regulation_item_id", "`regulation_item_id`")
+        if not foreign_key_exists(conn, "detected_items", "fk_detected_items_regulation_item"):
+            conn.execute(text("""
+                ALTER TABLE `detected_items`
+                ADD CONSTRAINT `fk_detected_items_regulation_item`
+                FOREIGN KEY (`regulation_item_id`) REFERENCES `items`(`id`) ON DELETE SET NULL
+            """))
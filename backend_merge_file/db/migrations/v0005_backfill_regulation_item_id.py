@@ -0,0 +1,30 @@
+# app/db/migrations/v0005_backfill_regulation_item_id.py
+"""
+기존 detected_items 행의 regulation_item_id를 채웁니다.
+이전 상세 조회와 같은 기준(item_name = items.item_name)으로 연결하며,
+잠금 시간을 줄이기 위해 item_id 구간별로 나누어 배치마다 커밋합니다.
+"""
+from sqlalchemy import text
+
+DESCRIPTION = "detected_items.regulation_item_id 채우기 (배치)"
+
+BATCH_SIZE = 5000
+
+
+def upgrade(engine, batch_size: int = BATCH_SIZE):
+    with engine.connect() as conn:
+        low, high = conn.execute(text("SELECT MIN(item_id), MAX(item_id) FROM detected_items")).one()
+    if low is None:
+        return
+
+    updated = 0
+    for start in range(low, high + 1, batch_size):
+        with engine.begin() as conn:
+            result = conn.execute(text("""
+                UPDATE detected_items d
+                JOIN items i ON i.item_name = d.item_name
+                SET d.regulation_item_id = i.id
+                WHERE d.item_id >= :start AND d.item_id < :stop AND d.regulation_item_id IS NULL
+            """), {"start": start, "stop": start + batch_size})
+            updated += result.rowcount
+        print(f"[MIGRATE]   backfilled up to item_id {min(start + batch_size, high + 1) - 1} ({updated} rows)")
@@ -0,0 +1,76 @@
+# app/db/migrations/v0006_items_catalog_versioning.py
+"""
+items 행마다 변경 버전(row_version)을 기록합니다. (/api/items/all 스냅샷의 ETag와 ?since= 증분 조회용)
+버전은 items_catalog_version의 단일 카운터에서 트리거가 할당하므로 앱 밖에서 직접 수정한 행도 반영되고,
+카운터 행 잠금 때문에 커밋 순서와 버전 순서가 같습니다.
+삭제된 행은 items_tombstones에 삭제 버전과 함께 남깁니다.
+이미 있던 행(row_version = 0)은 카운터를 한 번 올린 버전으로 채웁니다. (since=0 증분 조회에 포함되도록)
+"""
+from sqlalchemy import text
+from app.db.migrate import column_exists, add_index
+
+DESCRIPTION = "items.row_version, items_catalog_version, items_tombstones와 버전 트리거"
+
+BUMP_VERSION = """
+    UPDATE items_catalog_version SET version = version + 1 WHERE id = 1;
+"""
+
+TRIGGERS = {
+    "items_version_before_insert": f"""
+        CREATE TRIGGER items_version_before_insert BEFORE INSERT ON items FOR EACH ROW
+        BEGIN
+            {BUMP_VERSION}
+            SET NEW.row_version = (SELECT version FROM items_catalog_version WHERE id = 1);
+        END
+    """,
+    "items_version_before_update": f"""
+        CREATE TRIGGER items_version_before_update BEFORE UPDATE ON items FOR EACH ROW
+        BEGIN
+            {BUMP_VERSION}
+            SET NEW.row_version = (SELECT version FROM items_catalog_version WHERE id = 1);
+        END
+    """,
+    "items_version_after_delete": f"""
+        CREATE TRIGGER items_version_after_delete AFTER DELETE ON items FOR EACH ROW
+        BEGIN
+            {BUMP_VERSION}
+            REPLACE INTO items_tombstones (id, row_version)
+            SELECT OLD.id, version FROM items_catalog_version WHERE id = 1;
+        END
+    """,
+}
+
+
+def upgrade(engine):
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS items_catalog_version (
+                id TINYINT NOT NULL PRIMARY KEY,
+                version BIGINT NOT NULL DEFAULT 0
+            )
+        """))
+        conn.execute(text("INSERT IGNORE INTO items_catalog_version (id, version) VALUES (1, 0)"))
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS items_tombstones (
+                id INT NOT NULL PRIMARY KEY,
+                row_version BIGINT NOT NULL,
+                INDEX idx_items_tombstones_row_version (row_version)
+            )
+        """))
+        if not column_exists(conn, "items", "row_version"):
+            conn.execute(text("ALTER TABLE `items` ADD COLUMN `row_version` BIGINT NOT NULL DEFAULT 0"))
+        add_index(conn, "items", "idx_items_row_version", "`row_version`")
+
+        # 기존 행을 채우는 동안 트리거가 행마다 버전을 올리지 않도록 트리거를 지운 뒤 채웁니다.
+        for name in TRIGGERS:
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+        conn.execute(text("""
+            UPDATE items_catalog_version SET version = version + 1
+            WHERE id = 1 AND EXISTS (SELECT 1 FROM items WHERE row_version = 0)
+        """))
+        conn.execute(text("""
+            UPDATE items SET row_version = (SELECT version FROM items_catalog_version WHERE id = 1)
+            WHERE row_version = 0
+        """))
+        for ddl in TRIGGERS.values():
+            conn.execute(text(ddl))
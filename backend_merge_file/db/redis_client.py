@@ -0,0 +1,35 @@
+# app/db/redis_client.py
+import os
+import redis
+from config import Config
+
+_redis_client = None
+
+
+def get_redis():
+    """
+    프로세스 공용 Redis 클라이언트를 반환합니다. (최초 호출 시 생성)
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(Config.REDIS_URL)
+    return _redis_client
+
+
+def set_redis(client):
+    """
+    Redis 클라이언트를 교체합니다. 테스트에서 fakeredis 인스턴스를 주입할 때 사용합니다.
+    None을 넘기면 다음 get_redis() 호출 시 Config.REDIS_URL로 다시 연결합니다.
+    """
+    global _redis_client
+    _redis_client = client
+
+
+def _reset_after_fork():
+    # 부모 프로세스의 소켓을 자식 프로세스가 공유하지 않도록 연결을 버립니다.
+    global _redis_client
+    if isinstance(_redis_client, redis.Redis):
+        _redis_client = None
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
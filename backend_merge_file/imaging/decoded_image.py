@@ -0,0 +1,104 @@
+# app/imaging/decoded_image.py
+
+import io
+import numpy as np
+from PIL import Image, ImageOps
+
+# EXIF Orientation 태그와, 가로/세로가 뒤바뀌는 회전 값
+EXIF_ORIENTATION_TAG = 0x0112
+TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+class DecodedImage:
+    """
+    요청 단위로 한 번만 디코딩된 이미지 버퍼입니다.
+    EXIF 회전이 적용된 (H, W, 3) uint8 RGB 배열을 보관하며,
+    SKU 탐지와 YOLO 분류가 같은 버퍼를 공유합니다.
+
+    추론 프로필에 따라 배열은 원본보다 작게 디코딩될 수 있습니다.
+    width/height와 바운딩 박스 좌표는 항상 원본(EXIF 회전 적용) 기준이며,
+    배열 좌표와의 변환은 scale_x/scale_y로 처리합니다.
+    """
+
+    def __init__(self, array: np.ndarray, format: str = None, original_size=None):
+        # 여러 단계가 공유하는 버퍼이므로 실수로 수정되지 않도록 읽기 전용으로 둡니다.
+        array.setflags(write=False)
+        self.array = array
+        self.format = format
+        array_height, array_width = array.shape[:2]
+        self.original_size = tuple(original_size) if original_size else (array_width, array_height)
+        self.scale_x = array_width / self.original_size[0]
+        self.scale_y = array_height / self.original_size[1]
+
+    @classmethod
+    def from_bytes(cls, image_bytes: bytes, max_dim: int = None, draft: bool = False):
+        """
+        업로드 바이트를 디코딩하고 EXIF 회전을 적용합니다.
+        max_dim: 긴 변이 이 크기를 넘으면 비율을 유지하며 축소합니다.
+        draft: JPEG이면 디코딩 단계에서 DCT 스케일링으로 축소하여 디코딩 비용을 줄입니다.
+        """
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            image_format = image.format
+            width, height = image.size
+            if image.getexif().get(EXIF_ORIENTATION_TAG, 1) in TRANSPOSED_ORIENTATIONS:
+                width, height = height, width
+
+            if draft and max_dim and image_format == "JPEG":
+                # 요청 크기 이상이 되는 가장 작은 1/2, 1/4, 1/8 스케일로 디코딩됩니다.
+                image.draft("RGB", (max_dim, max_dim))
+
+            oriented = ImageOps.exif_transpose(image).convert("RGB")
+            if max_dim and max(oriented.size) > max_dim:
+                ratio = max_dim / max(oriented.size)
+                target = (max(1, round(oriented.width * ratio)), max(1, round(oriented.height * ratio)))
+                oriented = oriented.resize(target, Image.BILINEAR)
+            array = np.asarray(oriented)
+        return cls(array, image_format, (width, height))
+
+    @classmethod
+    def ensure(cls, image_data):
+        """DecodedImage면 그대로, 바이트면 디코딩하여 반환합니다."""
+        if isinstance(image_data, cls):
+            return image_data
+        return cls.from_bytes(image_data)
+
+    @property
+    def width(self) -> int:
+        """원본 이미지 너비 (EXIF 회전 적용)"""
+        return self.original_size[0]
+
+    @property
+    def height(self) -> int:
+        """원본 이미지 높이 (EXIF 회전 적용)"""
+        return self.original_size[1]
+
+    @property
+    def size(self):
+        """PIL과 동일한 (width, height) 튜플 (원본 기준)"""
+        return self.original_size
+
+    def to_original_coords(self, bbox) -> list:
+        """배열 좌표의 박스를 원본 이미지 좌표로 변환합니다."""
+        x_min, y_min, x_max, y_max = bbox
+        return [x_min / self.scale_x, y_min / self.scale_y, x_max / self.scale_x, y_max / self.scale_y]
+
+    def to_original_boxes(self, boxes: np.ndarray) -> np.ndarray:
+        """(N, 4) 배열 좌표 박스 전체를 한 번에 원본 이미지 좌표로 변환합니다."""
+        return boxes / np.array([self.scale_x, self.scale_y, self.scale_x, self.scale_y], dtype=np.float32)
+
+    def crop(self, bbox) -> np.ndarray:
+        """
+        원본 좌표의 바운딩 박스 영역을 복사 없이 배열 뷰로 반환합니다.
+        좌표는 이미지 범위로 잘라내며, 최소 1픽셀 크기를 보장합니다.
+        """
+        array_height, array_width = self.array.shape[:2]
+        x_min, y_min, x_max, y_max = bbox
+        x0 = min(max(int(x_min * self.scale_x), 0), array_width - 1)
+        y0 = min(max(int(y_min * self.scale_y), 0), array_height - 1)
+        x1 = min(max(int(round(x_max * self.scale_x)), x0 + 1), array_width)
+        y1 = min(max(int(round(y_max * self.scale_y)), y0 + 1), array_height)
+        return self.array[y0:y1, x0:x1]
+
+    def to_bgr(self) -> np.ndarray:
+        """ultralytics 모델 입력용 연속(contiguous) BGR 배열을 생성합니다."""
+        return np.ascontiguousarray(self.array[..., ::-1])
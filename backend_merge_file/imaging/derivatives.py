@@ -0,0 +1,140 @@
+# app/imaging/derivatives.py
+"""
+업로드 원본에서 크기별 파생 이미지(썸네일, 중간 크기, 선택적으로 WebP)를 만듭니다.
+
+- 크기 목록은 Config.DERIVATIVE_SIZES ('이름:긴 변 최대 크기', 쉼표 구분)입니다.
+- 원본을 한 번 디코딩(EXIF 회전 적용, JPEG는 DCT 축소)한 뒤 큰 크기부터 차례로 줄여 만듭니다.
+- 파생 이미지는 '<원본 blob 키>.<이름>.<확장자>' 키로 원본과 같은 위치에 저장됩니다.
+  크기는 원본 가로/세로(images 테이블)에서 계산되므로 별도 메타데이터 없이 선택할 수 있습니다.
+- 원본보다 크거나 같은 크기는 만들지 않습니다. (그 크기가 필요하면 원본을 사용)
+- /classify 응답의 bbox는 0~1 정규화 좌표이므로 어느 파생 이미지에 그려도 위치가 맞습니다.
+"""
+import io
+from PIL import Image, ImageOps
+from config import Config
+from app.imaging.decoded_image import EXIF_ORIENTATION_TAG, TRANSPOSED_ORIENTATIONS
+
+# 출력 형식: (PIL 형식 이름, 확장자, MIME)
+JPEG = ("JPEG", "jpg", "image/jpeg")
+WEBP = ("WEBP", "webp", "image/webp")
+
+
+def parse_sizes(spec: str = None) -> list:
+    """'thumb:320,medium:1280' → [('thumb', 320), ('medium', 1280)] (작은 크기부터)"""
+    sizes = []
+    for part in (spec or Config.DERIVATIVE_SIZES).split(","):
+        name, _, max_dim = part.strip().partition(":")
+        if name and max_dim:
+            sizes.append((name, int(max_dim)))
+    return sorted(sizes, key=lambda size: size[1])
+
+
+def output_formats() -> list:
+    return [JPEG, WEBP] if Config.DERIVATIVE_WEBP else [JPEG]
+
+
+def derivative_key(blob_key: str, name: str, extension: str) -> str:
+    return f"{blob_key}.{name}.{extension}"
+
+
+def fitted_size(width: int, height: int, max_dim: int):
+    """긴 변을 max_dim에 맞춘 (width, height). 원본이 이미 작으면 None."""
+    if max(width, height) <= max_dim:
+        return None
+    ratio = max_dim / max(width, height)
+    return max(1, round(width * ratio)), max(1, round(height * ratio))
+
+
+def planned_derivatives(blob_key: str, width: int, height: int) -> list:
+    """
+    원본 크기에서 만들어질 파생 이미지 목록 (작은 크기부터).
+    [{"name", "key", "width", "height", "mimetype"}]
+    """
+    planned = []
+    for name, max_dim in parse_sizes():
+        size = fitted_size(width, height, max_dim)
+        if size is None:
+            continue
+        for _, extension, mimetype in output_formats():
+            planned.append({
+                "name": name,
+                "key": derivative_key(blob_key, name, extension),
+                "width": size[0],
+                "height": size[1],
+                "mimetype": mimetype,
+            })
+    return planned
+
+
+def render_derivatives(image_data, width: int, height: int) -> dict:
+    """
+    원본으로 파생 이미지를 만듭니다. {(이름, 확장자): 인코딩된 바이트}
+    image_data: 원본 바이트 또는 읽기 가능한 파일 객체(메모리 매핑된 blob 등)
+    width/height: 원본(EXIF 회전 적용) 크기
+    """
+    targets = [(name, fitted_size(width, height, max_dim)) for name, max_dim in parse_sizes()]
+    targets = [(name, size) for name, size in targets if size is not None]
+    if not targets:
+        return {}
+
+    outputs = {}
+    source = io.BytesIO(image_data) if isinstance(image_data, (bytes, bytearray)) else image_data
+    with Image.open(source) as image:
+        if image.format == "JPEG":
+            # 가장 큰 파생 크기 이상이 되는 가장 작은 1/2, 1/4, 1/8 스케일로 디코딩합니다.
+            # (draft는 EXIF 회전 전 크기 기준이므로 가로/세로가 바뀌는 회전이면 목표 크기도 바꿉니다.)
+            target_w, target_h = targets[-1][1]
+            if image.getexif().get(EXIF_ORIENTATION_TAG, 1) in TRANSPOSED_ORIENTATIONS:
+                target_w, target_h = target_h, target_w
+            image.draft("RGB", (target_w, target_h))
+        current = ImageOps.exif_transpose(image).convert("RGB")
+
+    # 큰 크기부터 이전 결과를 다시 줄여 리샘플링 비용을 줄입니다.
+    for name, size in reversed(targets):
+        current = current.resize(size, Image.LANCZOS, reducing_gap=2.0)
+        for pil_format, extension, _ in output_formats():
+            buffer = io.BytesIO()
+            if pil_format == "JPEG":
+                current.save(buffer, "JPEG", quality=Config.DERIVATIVE_JPEG_QUALITY, optimize=True, progressive=True)
+            else:
+                current.save(buffer, "WEBP", quality=Config.DERIVATIVE_JPEG_QUALITY, method=4)
+            outputs[(name, extension)] = buffer.getvalue()
+    return outputs
+
+
+def generate_derivatives(store, blob_key: str, width: int, height: int) -> int:
+    """
+    저장소의 원본으로 아직 없는 파생 이미지를 만들어 저장하고, 새로 저장한 개수를 반환합니다.
+    이미 모두 있으면 원본을 읽지 않습니다.
+    """
+    planned = planned_derivatives(blob_key, width, height)
+    if all(store.exists(item["key"]) for item in planned):
+        return 0
+
+    with store.view(blob_key) as original:
+        outputs = render_derivatives(original, width, height)
+
+    stored = 0
+    for (name, extension), data in outputs.items():
+        key = derivative_key(blob_key, name, extension)
+        if not store.exists(key):
+            store.put(data, key=key)
+            stored += 1
+    return stored
+
+
+def select_derivative(planned: list, width: int = None, height: int = None, accept_webp: bool = False):
+    """
+    요청 크기(width, height 중 지정된 값)를 만족하는 가장 작은 파생 이미지를 고릅니다.
+    만족하는 것이 없으면 None (원본 사용). WebP를 받을 수 있으면 같은 크기에서 WebP를 우선합니다.
+    """
+    candidates = [
+        item for item in planned
+        if (width is None or item["width"] >= width) and (height is None or item["height"] >= height)
+        and (accept_webp or item["mimetype"] != WEBP[2])
+    ]
+    if not candidates:
+        return None
+    smallest = min(item["width"] for item in candidates)
+    same_size = [item for item in candidates if item["width"] == smallest]
+    return next((item for item in same_size if item["mimetype"] == WEBP[2]), same_size[0])
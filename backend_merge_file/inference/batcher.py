@@ -0,0 +1,189 @@
+# app/inference/batcher.py
+"""
+동시에 들어온 요청들의 추론 입력(이미지, 크롭)을 모아 한 번의 forward로 처리하는 마이크로 배치 스케줄러입니다.
+
+- 첫 입력이 들어온 뒤 max_wait_ms가 지나거나 입력이 max_batch_size개 모이면 배치를 실행합니다.
+- 같은 key(모델 버전, 입력 크기 등)를 가진 입력끼리만 한 배치로 묶습니다.
+- 결과는 입력 순서대로 각 요청에 돌려줍니다. 배치 실행 중 오류가 나면 해당 배치의 모든 요청에 전달됩니다.
+- 요청은 최대 Config.MICRO_BATCH_TIMEOUT초까지 기다리며, 배치 스레드가 죽었으면 다음 요청 때 다시 시작합니다.
+- 배치 크기와 대기 시간 히스토그램을 stats()와 /metrics로 조회할 수 있습니다. (튜닝용)
+
+Config.MICRO_BATCHING이 꺼져 있으면 요청 스레드에서 바로 실행합니다.
+"""
+import os
+import queue
+import threading
+import time
+from config import Config
+from app.monitoring.metrics import Histogram
+
+# 히스토그램 버킷 상한
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+WAIT_MS_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+# 이름 -> MicroBatcher (통계 조회용)
+_batchers = {}
+
+MICRO_BATCH_SIZE = Histogram(
+    "passcheckers_micro_batch_size",
+    "Number of inputs per micro-batched forward pass.",
+    BATCH_SIZE_BUCKETS, labelnames=("batcher",),
+)
+MICRO_BATCH_WAIT_MS = Histogram(
+    "passcheckers_micro_batch_wait_milliseconds",
+    "Time a request waited in the micro-batch queue before dispatch.",
+    WAIT_MS_BUCKETS, labelnames=("batcher",),
+)
+
+
+class _Pending:
+    """배치를 기다리는 요청 하나 (입력 목록과 결과 자리)"""
+    __slots__ = ("key", "items", "enqueued_at", "done", "results", "error")
+
+    def __init__(self, key, items):
+        self.key = key
+        self.items = items
+        self.enqueued_at = time.monotonic()
+        self.done = threading.Event()
+        self.results = [None] * len(items)
+        self.error = None
+
+
+class MicroBatcher:
+    """
+    run_batch(key, items) -> results 함수 앞에서 여러 요청의 입력을 모아 실행합니다.
+    run_batch는 입력과 같은 길이, 같은 순서의 결과 목록을 반환해야 합니다.
+    """
+
+    def __init__(self, name: str, run_batch, max_batch_size: int, max_wait_ms: float = None):
+        self.name = name
+        self.run_batch = run_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = (Config.MICRO_BATCH_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms) / 1000
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        _batchers[name] = self
+
+    def submit(self, key, items: list) -> list:
+        """입력을 배치 큐에 넣고, 배치가 실행되어 결과가 나올 때까지 기다립니다."""
+        if not items:
+            return []
+        if not Config.MICRO_BATCHING:
+            return self.run_now(key, items)
+
+        pending = _Pending(key, items)
+        self._ensure_thread()
+        self._queue.put(pending)
+        if not pending.done.wait(Config.MICRO_BATCH_TIMEOUT):
+            raise TimeoutError(f"{self.name} micro-batch did not finish within {Config.MICRO_BATCH_TIMEOUT}s")
+        if pending.error is not None:
+            raise pending.error
+        return pending.results
+
+    def run_now(self, key, items: list, max_batch_size: int = None) -> list:
+        """다른 요청을 기다리지 않고 현재 스레드에서 max_batch_size개씩 나누어 실행합니다."""
+        batch_size = max(1, max_batch_size or self.max_batch_size)
+        results = []
+        for start in range(0, len(items), batch_size):
+            chunk = items[start:start + batch_size]
+            outputs = self.run_batch(key, chunk)
+            if len(outputs) != len(chunk):
+                raise RuntimeError(f"{self.name} batch returned {len(outputs)} results for {len(chunk)} inputs")
+            results.extend(outputs)
+        return results
+
+    def stats(self) -> dict:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batch_size": MICRO_BATCH_SIZE.snapshot(batcher=self.name),
+            "wait_ms": MICRO_BATCH_WAIT_MS.snapshot(batcher=self.name),
+        }
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                if self._thread is not None:
+                    print(f"[MICRO BATCHER] {self.name} batch thread is not running. Restarting.")
+                self._thread = threading.Thread(target=self._loop, name=f"micro-batcher-{self.name}", daemon=True)
+                self._thread.start()
+
+    def _loop(self):
+        while True:
+            first = self._queue.get()
+            pending = [first]
+            size = len(first.items)
+            deadline = first.enqueued_at + self.max_wait
+
+            # 최대 크기가 차거나 첫 입력의 대기 시간이 끝날 때까지 모읍니다.
+            while size < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                pending.append(item)
+                size += len(item.items)
+
+            try:
+                self._dispatch(pending)
+            except Exception as e:
+                # 배치 실행 밖(지표 기록 등)의 오류로 스레드가 멈추지 않도록 남은 요청을 실패로 끝냅니다.
+                print(f"[MICRO BATCHER] {self.name} dispatch failed: {e}")
+                for request in pending:
+                    if not request.done.is_set():
+                        request.error = e
+                        request.done.set()
+
+    def _dispatch(self, pending: list):
+        dispatched_at = time.monotonic()
+        groups = {}
+        for request in pending:
+            groups.setdefault(request.key, []).append(request)
+            MICRO_BATCH_WAIT_MS.observe((dispatched_at - request.enqueued_at) * 1000, batcher=self.name)
+
+        for key, requests in groups.items():
+            # (요청, 요청 내 인덱스) 순서로 입력을 펼친 뒤 max_batch_size개씩 실행합니다.
+            slots = [(request, i) for request in requests for i in range(len(request.items))]
+            try:
+                for start in range(0, len(slots), self.max_batch_size):
+                    chunk = slots[start:start + self.max_batch_size]
+                    results = self.run_batch(key, [request.items[i] for request, i in chunk])
+                    if len(results) != len(chunk):
+                        raise RuntimeError(f"{self.name} batch returned {len(results)} results for {len(chunk)} inputs")
+                    MICRO_BATCH_SIZE.observe(len(chunk), batcher=self.name)
+                    for (request, i), result in zip(chunk, results):
+                        request.results[i] = result
+            except Exception as e:
+                print(f"[MICRO BATCHER] {self.name} batch failed: {e}")
+                for request in requests:
+                    request.error = e
+            for request in requests:
+                request.done.set()
+
+    def _after_fork(self):
+        # fork된 자식 프로세스에는 배치 스레드가 없으므로 첫 요청 때 다시 시작합니다.
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+
+def batching_stats() -> dict:
+    """이 프로세스의 배치 스케줄러별 배치 크기 / 대기 시간 히스토그램"""
+    return {
+        "enabled": Config.MICRO_BATCHING,
+        "batchers": {name: batcher.stats() for name, batcher in _batchers.items()},
+    }
+
+
+def _after_fork():
+    for batcher in _batchers.values():
+        batcher._after_fork()
+
+
+os.register_at_fork(after_in_child=_after_fork)
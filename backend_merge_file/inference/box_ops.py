@@ -0,0 +1,72 @@
+# app/inference/box_ops.py
+"""
+(N, 4) xyxy 박스 배열에 대한 NumPy 연산입니다.
+모든 연산은 박스 전체를 한 번에 처리하며, torch 없이 동작합니다.
+"""
+import numpy as np
+
+
+def box_area(boxes: np.ndarray) -> np.ndarray:
+    """(N, 4) xyxy 박스의 넓이"""
+    return np.clip(boxes[:, 2] - boxes[:, 0], 0, None) * np.clip(boxes[:, 3] - boxes[:, 1], 0, None)
+
+
+def box_intersection(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(N, 4) x (M, 4) xyxy 박스의 교집합 넓이 행렬"""
+    top_left = np.maximum(a[:, None, :2], b[None, :, :2])
+    bottom_right = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    return np.clip(bottom_right - top_left, 0, None).prod(axis=2)
+
+
+def box_iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(N, 4) x (M, 4) xyxy 박스의 IoU 행렬"""
+    inter = box_intersection(a, b)
+    return inter / (box_area(a)[:, None] + box_area(b)[None, :] - inter + 1e-9)
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """
+    클래스 구분 없는 NMS. 남길 박스의 인덱스를 점수 내림차순으로 반환합니다.
+    IoU 행렬을 한 번에 계산한 뒤, 이미 억제된 박스는 건너뛰며 억제 마스크만 갱신합니다.
+    """
+    if len(boxes) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    order = np.argsort(-scores, kind="stable")
+    return order[_suppress(box_iou(boxes[order], boxes[order]) > iou_threshold)]
+
+
+def prune_boxes(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float, min_area: float = 0.0,
+                containment_threshold: float = None, max_boxes: int = None) -> np.ndarray:
+    """
+    2단계 분류 전에 크롭 후보를 줄입니다. 남길 박스의 인덱스를 점수 내림차순으로 반환합니다.
+    - min_area 미만의 작은 박스 제거
+    - IoU가 iou_threshold를 넘는 중복 박스 제거 (클래스 구분 없는 NMS)
+    - 넓이의 containment_threshold 이상이 더 높은 점수의 박스 안에 포함된 박스 제거
+    - 점수 상위 max_boxes개까지만 유지
+    """
+    candidates = np.flatnonzero(box_area(boxes) >= min_area)
+    order = candidates[np.argsort(-scores[candidates], kind="stable")]
+    ranked = boxes[order]
+
+    overlaps = box_iou(ranked, ranked) > iou_threshold
+    if containment_threshold is not None:
+        # [i, j]: 박스 j의 넓이 중 박스 i와 겹치는 비율
+        contained = box_intersection(ranked, ranked) / (box_area(ranked)[None, :] + 1e-9)
+        overlaps |= contained >= containment_threshold
+
+    keep = order[_suppress(overlaps)]
+    return keep[:max_boxes] if max_boxes else keep
+
+
+def _suppress(overlaps: np.ndarray) -> np.ndarray:
+    """
+    점수 순으로 정렬된 박스의 (N, N) 억제 조건 행렬에서 남길 박스의 마스크를 구합니다.
+    자신보다 점수가 높은 박스와의 조건(상삼각)만 사용하며, 이미 억제된 박스는 다른 박스를 억제하지 않습니다.
+    """
+    overlaps = np.triu(overlaps, k=1)
+    suppressed = np.zeros(len(overlaps), dtype=bool)
+    for i in range(len(overlaps)):
+        if not suppressed[i]:
+            suppressed |= overlaps[i]
+    return ~suppressed
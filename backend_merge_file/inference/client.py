@@ -0,0 +1,129 @@
+# app/inference/client.py
+"""
+추론 데몬(app.inference.daemon)용 얇은 클라이언트입니다.
+app.sku.detect / app.yolo.detect와 같은 시그니처를 제공하므로 그대로 교체해서 사용할 수 있으며,
+이 모듈을 import해도 모델이나 torch는 로드되지 않습니다.
+"""
+import socket
+import threading
+import weakref
+from contextlib import contextmanager
+from config import Config
+from app.imaging.decoded_image import DecodedImage
+from app.inference.protocol import send_message, recv_message, create_shared_array
+from app.inference.outcome import record_failure
+
+# 같은 DecodedImage를 두 모델에 넘길 때 공유 메모리로 한 번만 복사하기 위한 캐시
+_shared_images = weakref.WeakKeyDictionary()
+
+# pin_models() 블록 안에서 데몬이 알려준 모델 버전을 모읍니다.
+_local = threading.local()
+
+
+class InferenceDaemonError(Exception):
+    pass
+
+
+def _release_shared_memory(shm):
+    shm.close()
+    shm.unlink()
+
+
+def _share_image(image: DecodedImage):
+    """이미지를 공유 메모리에 올리고 디스크립터를 반환합니다. 이미지가 해제되면 블록도 해제됩니다."""
+    descriptor = _shared_images.get(image)
+    if descriptor is None:
+        shm, descriptor = create_shared_array(image.array)
+        descriptor["format"] = image.format
+        descriptor["original_size"] = list(image.original_size)
+        weakref.finalize(image, _release_shared_memory, shm)
+        _shared_images[image] = descriptor
+    return descriptor
+
+
+@contextmanager
+def pin_models():
+    """
+    model_registry.pin()과 같은 형태로, 블록 안의 요청에 사용된 모델 버전 dict를 반환합니다.
+    (버전은 데몬 응답을 받은 뒤 채워집니다.)
+    """
+    versions = {}
+    _local.versions = versions
+    try:
+        yield versions
+    finally:
+        _local.versions = None
+
+
+def call_daemon(message: dict, socket_path: str = None, timeout: float = None):
+    """데몬에 요청을 보내고 결과를 반환합니다. 실패 시 InferenceDaemonError를 발생시킵니다."""
+    socket_path = socket_path or Config.INFERENCE_DAEMON_SOCKET
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout or Config.INFERENCE_DAEMON_TIMEOUT)
+            sock.connect(socket_path)
+            send_message(sock, message)
+            response = recv_message(sock)
+    except OSError as e:
+        # 소켓이 없거나 연결 거부/시간 초과 (데몬이 내려간 경우)
+        raise InferenceDaemonError(f"Inference daemon unavailable: {e}") from e
+
+    if response is None:
+        raise InferenceDaemonError("Inference daemon closed the connection")
+    if not response.get("ok"):
+        raise InferenceDaemonError(response.get("error", "Unknown inference daemon error"))
+
+    versions = getattr(_local, "versions", None)
+    if versions is not None:
+        versions.update(response.get("model_versions", {}))
+    for stage, reason in response.get("failures", ()):
+        record_failure(stage, reason)
+    return response.get("result")
+
+
+def predict_bbox_with_sku(image_data, conf_threshold: float = 0.10, imgsz: int = None, tiled: bool = None,
+                          prune: bool = True):
+    """
+    app.sku.detect.predict_bbox_with_sku와 동일한 시그니처로 데몬에 탐지를 요청합니다.
+    데몬을 호출할 수 없으면 빈 목록 대신 InferenceDaemonError를 발생시킵니다. ("물품 없음"과 구분)
+    """
+    image = DecodedImage.ensure(image_data)
+    return call_daemon({
+        "op": "predict_bbox",
+        "image": _share_image(image),
+        "conf_threshold": conf_threshold,
+        "imgsz": imgsz,
+        "tiled": tiled,
+        "prune": prune,
+    })
+
+
+def predict_name_with_yolo(image_data, bboxes: list, batched: bool = True, max_batch_size: int = None,
+                           crop_imgsz: int = None):
+    """
+    app.yolo.detect.predict_name_with_yolo와 동일한 시그니처로 데몬에 분류를 요청합니다.
+    데몬을 호출할 수 없으면 InferenceDaemonError를 발생시킵니다.
+    """
+    if not bboxes:
+        return []
+    image = DecodedImage.ensure(image_data)
+    return call_daemon({
+        "op": "predict_name",
+        "image": _share_image(image),
+        "bboxes": bboxes,
+        "batched": batched,
+        "max_batch_size": max_batch_size,
+        "crop_imgsz": crop_imgsz,
+    })
+
+
+def get_class_names(model: str = "yolo"):
+    """데몬에 로드된 모델의 클래스 이름 {클래스 id: 이름}을 조회합니다. (규정 조회 테이블용)"""
+    names = call_daemon({"op": "class_names", "model": model})
+    # JSON 전송으로 문자열이 된 키를 다시 정수로 변환합니다.
+    return {int(cls_id): name for cls_id, name in names.items()} if names else None
+
+
+def get_daemon_status():
+    """데몬 워커 하나의 모델 로드 상태와 배치 통계를 조회합니다. (readiness / 튜닝용)"""
+    return call_daemon({"op": "ping"}, timeout=2)
@@ -0,0 +1,168 @@
+# app/inference/daemon.py
+"""
+SKU/YOLO 모델을 소유하는 로컬 추론 데몬입니다.
+웹 워커는 모델을 직접 로드하지 않고 app.inference.client를 통해 Unix 소켓으로 요청합니다.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.inference.daemon --socket /tmp/passcheckers-inference.sock --processes 2
+"""
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from config import Config
+from app.inference.protocol import send_message, recv_message, attach_shared_array
+from app.inference.outcome import track_failures
+
+
+def configure_torch_threads(intra_op_threads: int, inter_op_threads: int):
+    """
+    torch 스레드 수를 고정합니다. 모델 로드 및 첫 연산 전에 호출해야 합니다.
+    (프로세스 수 x intra-op 스레드 수가 CPU 코어 수를 넘지 않도록 설정하세요.)
+    """
+    import torch
+    torch.set_num_threads(intra_op_threads)
+    torch.set_num_interop_threads(inter_op_threads)
+
+
+def handle_request(message: dict):
+    """요청 메시지 하나를 처리하고 응답 dict를 반환합니다."""
+    from app.imaging.decoded_image import DecodedImage
+    from app.inference.registry import model_registry
+    from app.inference.batcher import batching_stats
+    from app.sku.detect import predict_bbox_with_sku
+    from app.yolo.detect import predict_name_with_yolo
+
+    op = message.get("op")
+    if op == "ping":
+        return {"ok": True, "result": {
+            "pid": os.getpid(),
+            "models": model_registry.status(),
+            "batching": batching_stats(),
+        }}
+
+    if op == "class_names":
+        with model_registry.acquire(message.get("model", "yolo")) as handle:
+            names = handle.model.names if handle else None
+        return {"ok": True, "result": {int(k): v for k, v in names.items()} if names else None}
+
+    shm, array = attach_shared_array(message["image"])
+    image = None
+    try:
+        image = DecodedImage(array, message["image"].get("format"), message["image"].get("original_size"))
+        with track_failures() as failures, model_registry.pin() as versions:
+            if op == "predict_bbox":
+                result = predict_bbox_with_sku(image, conf_threshold=message.get("conf_threshold", 0.10),
+                                               imgsz=message.get("imgsz"), tiled=message.get("tiled"),
+                                               prune=message.get("prune", True))
+                versions = {"sku": versions.get("sku")}
+            elif op == "predict_name":
+                result = predict_name_with_yolo(image, message.get("bboxes", []),
+                                                batched=message.get("batched", True),
+                                                max_batch_size=message.get("max_batch_size"),
+                                                crop_imgsz=message.get("crop_imgsz"))
+                versions = {"yolo": versions.get("yolo")}
+            else:
+                return {"ok": False, "error": f"Unknown op: {op}"}
+        # 모델 미로드 등으로 빈 결과를 반환했다면 클라이언트가 같은 요청의 실패로 기록합니다.
+        return {"ok": True, "result": result, "model_versions": versions, "failures": failures}
+    finally:
+        # 공유 메모리 뷰를 모두 해제한 뒤 블록을 닫아야 합니다.
+        image = array = None
+        shm.close()
+
+
+def serve_connection(conn):
+    with conn:
+        while True:
+            message = recv_message(conn)
+            if message is None:
+                return
+            try:
+                response = handle_request(message)
+            except Exception as e:
+                print(f"[INFERENCE DAEMON] Request failed: {e}")
+                response = {"ok": False, "error": str(e)}
+            send_message(conn, response)
+
+
+def _worker_main(listener, intra_op_threads, inter_op_threads):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    configure_torch_threads(intra_op_threads, inter_op_threads)
+
+    # 이 프로세스에서 모델을 로드합니다. (MODEL_LOAD_MODE와 관계없이 요청을 받기 전에 로드)
+    import app.sku.detect  # noqa: F401
+    import app.yolo.detect  # noqa: F401
+    from app.inference.registry import model_registry
+    model_registry.load("sku")
+    model_registry.load("yolo")
+    print(f"[INFERENCE DAEMON] Worker {os.getpid()} ready "
+          f"(intra-op={intra_op_threads}, inter-op={inter_op_threads})")
+
+    # 모든 워커가 같은 리스닝 소켓에서 accept하고, 커널이 연결을 분배합니다.
+    # 마이크로 배치가 켜져 있으면 연결마다 스레드로 처리하여 동시 요청을 한 배치로 묶습니다.
+    while True:
+        conn, _ = listener.accept()
+        if Config.MICRO_BATCHING:
+            threading.Thread(target=_serve_safely, args=(conn,), daemon=True).start()
+        else:
+            _serve_safely(conn)
+
+
+def _serve_safely(conn):
+    try:
+        serve_connection(conn)
+    except Exception as e:
+        print(f"[INFERENCE DAEMON] Connection error: {e}")
+
+
+def run_daemon(socket_path: str, processes: int, intra_op_threads: int, inter_op_threads: int):
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    os.chmod(socket_path, 0o660)
+    listener.listen(128)
+    print(f"[INFERENCE DAEMON] Listening on {socket_path} with {processes} process(es)")
+
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(
+            target=_worker_main,
+            args=(listener, intra_op_threads, inter_op_threads),
+            name=f"inference-worker-{i}",
+            daemon=True,
+        )
+        for i in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    def _shutdown(signum, frame):
+        print("[INFERENCE DAEMON] Shutting down...")
+        for worker in workers:
+            worker.terminate()
+
+    signal.signal(signal.SIGINT, _shutdown)
+    signal.signal(signal.SIGTERM, _shutdown)
+
+    try:
+        for worker in workers:
+            worker.join()
+    finally:
+        listener.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PassCheckers 로컬 추론 데몬")
+    parser.add_argument("--socket", default=Config.INFERENCE_DAEMON_SOCKET or "/tmp/passcheckers-inference.sock")
+    parser.add_argument("--processes", type=int, default=Config.INFERENCE_DAEMON_PROCESSES)
+    parser.add_argument("--intra-op-threads", type=int, default=Config.TORCH_INTRA_OP_THREADS)
+    parser.add_argument("--inter-op-threads", type=int, default=Config.TORCH_INTER_OP_THREADS)
+    args = parser.parse_args()
+    run_daemon(args.socket, args.processes, args.intra_op_threads, args.inter_op_threads)
@@ -0,0 +1,107 @@
+# app/inference/engines.py
+"""
+모델별 추론 엔진 계층입니다. 모델마다 Config에서 엔진을 고를 수 있습니다.
+
+- torch:     ultralytics PyTorch 가중치 (.pt), 기본값
+- onnx:      ONNX Runtime (.onnx)
+- onnx-int8: 동적 INT8 양자화된 ONNX Runtime (.int8.onnx)
+
+어떤 엔진이든 ultralytics Results 형식(boxes.xyxy / conf / cls, names)으로 결과를 돌려주므로
+탐지 파이프라인의 출력 구조는 엔진과 무관하게 같습니다.
+ONNX 가중치는 `python -m app.inference.export`로 .pt에서 생성합니다.
+"""
+import numpy as np
+from config import Config
+
+
+class InferenceEngine:
+    """ultralytics 모델을 감싸는 엔진 기본 클래스"""
+    engine_name = None
+    suffix = None
+    task = None
+
+    def __init__(self, path: str):
+        self.path = path
+        self.model = self._load(path)
+
+    def _load(self, path: str):
+        from ultralytics import YOLO
+        return YOLO(path, task=self.task) if self.task else YOLO(path)
+
+    @property
+    def names(self) -> dict:
+        return self.model.names
+
+    def __call__(self, source, **kwargs):
+        """ultralytics 예측 (전처리/NMS 포함), Results 리스트를 반환합니다."""
+        return self.model(source, **kwargs)
+
+    def warmup(self, imgsz: int):
+        """더미 추론으로 예측기(전처리/백엔드)를 초기화합니다."""
+        self(np.zeros((imgsz, imgsz, 3), dtype=np.uint8), verbose=False)
+
+    def forward(self, batch):
+        """
+        전처리된 (B, 3, H, W) float 텐서를 한 번에 추론하여
+        NMS 이전의 원시 예측 (B, 4 + num_classes, num_anchors)을 반환합니다.
+        """
+        import torch
+
+        if self.model.predictor is None:
+            self.warmup(batch.shape[-1])
+        backend = self.model.predictor.model  # ultralytics AutoBackend (엔진별 실행 담당)
+        with torch.inference_mode():
+            preds = backend(batch.to(backend.device))
+        if isinstance(preds, (list, tuple)):
+            preds = preds[0]
+        return preds
+
+
+class TorchEngine(InferenceEngine):
+    engine_name = "torch"
+    suffix = ".pt"
+
+    def _load(self, path: str):
+        from torch.serialization import add_safe_globals
+        from ultralytics.nn.tasks import DetectionModel
+
+        # PyTorch 보안 업데이트로 인한 오류 방지
+        add_safe_globals([DetectionModel])
+        model = super()._load(path)
+        model.model.eval()
+        return model
+
+
+class OnnxEngine(InferenceEngine):
+    engine_name = "onnx"
+    suffix = ".onnx"
+    task = "detect"
+
+
+class OnnxInt8Engine(OnnxEngine):
+    engine_name = "onnx-int8"
+    suffix = ".int8.onnx"
+
+
+ENGINES = {engine.engine_name: engine for engine in (TorchEngine, OnnxEngine, OnnxInt8Engine)}
+
+
+def engine_name_for(model_name: str) -> str:
+    """Config에 설정된 모델별 엔진 이름"""
+    engine_name = {
+        "sku": Config.SKU_INFERENCE_ENGINE,
+        "yolo": Config.YOLO_INFERENCE_ENGINE,
+    }.get(model_name, "torch")
+    if engine_name not in ENGINES:
+        raise ValueError(f"Unknown inference engine for {model_name}: {engine_name}")
+    return engine_name
+
+
+def engine_weights_path(pt_path: str, engine_name: str) -> str:
+    """.pt 가중치 경로를 엔진별 가중치 경로로 바꿉니다. (weights.pt -> weights.int8.onnx 등)"""
+    base = pt_path[:-len(".pt")] if pt_path.endswith(".pt") else pt_path
+    return base + ENGINES[engine_name].suffix
+
+
+def load_engine(pt_path: str, engine_name: str) -> InferenceEngine:
+    return ENGINES[engine_name](engine_weights_path(pt_path, engine_name))
@@ -0,0 +1,73 @@
+# app/inference/export.py
+"""
+.pt 가중치를 ONNX / INT8 동적 양자화 ONNX로 변환합니다.
+결과 파일은 원본 옆에 엔진별 이름으로 저장됩니다. (weights.onnx, weights.int8.onnx)
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.inference.export --model all --formats onnx onnx-int8
+    python -m app.inference.export --model sku --version 2025-10-01 --formats onnx
+"""
+import argparse
+from app.inference.engines import engine_weights_path
+from app.inference.model_versions import MODEL_NAMES, resolve_model_weights, weights_path_for
+
+# 내보내기 입력 크기 (배치/해상도는 동적 축으로 내보냅니다)
+EXPORT_IMGSZ = 640
+
+
+def export_onnx(pt_path: str, imgsz: int = EXPORT_IMGSZ) -> str:
+    """
+    .pt를 ONNX로 내보냅니다. 배치 크롭 분류를 위해 배치/입력 크기를 동적 축으로 둡니다.
+    """
+    from torch.serialization import add_safe_globals
+    from ultralytics import YOLO
+    from ultralytics.nn.tasks import DetectionModel
+
+    # PyTorch 보안 업데이트로 인한 오류 방지
+    add_safe_globals([DetectionModel])
+    exported = YOLO(pt_path).export(format="onnx", dynamic=True, simplify=True, imgsz=imgsz)
+    expected = engine_weights_path(pt_path, "onnx")
+    if str(exported) != expected:
+        import shutil
+        shutil.move(str(exported), expected)
+    return expected
+
+
+def quantize_int8(onnx_path: str, output_path: str) -> str:
+    """ONNX 모델의 가중치를 INT8로 동적 양자화합니다."""
+    import onnx
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    quantize_dynamic(onnx_path, output_path, weight_type=QuantType.QInt8)
+
+    # ultralytics는 클래스 이름(names) 등을 ONNX 메타데이터에서 읽으므로 원본에서 복사합니다.
+    source = onnx.load(onnx_path)
+    quantized = onnx.load(output_path)
+    del quantized.metadata_props[:]
+    quantized.metadata_props.extend(source.metadata_props)
+    onnx.save(quantized, output_path)
+    return output_path
+
+
+def export_model(name: str, version: str = None, formats=("onnx", "onnx-int8")):
+    pt_path = weights_path_for(name, version) if version else resolve_model_weights(name)[1]
+    onnx_path = engine_weights_path(pt_path, "onnx")
+
+    if "onnx" in formats or "onnx-int8" in formats:
+        print(f"[EXPORT] {name}: {pt_path} -> {onnx_path}")
+        export_onnx(pt_path)
+    if "onnx-int8" in formats:
+        int8_path = engine_weights_path(pt_path, "onnx-int8")
+        print(f"[EXPORT] {name}: {onnx_path} -> {int8_path}")
+        quantize_int8(onnx_path, int8_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="모델 가중치를 ONNX / INT8 ONNX로 변환")
+    parser.add_argument("--model", choices=list(MODEL_NAMES) + ["all"], default="all")
+    parser.add_argument("--version", default=None, help="레지스트리 버전 (생략 시 활성 버전)")
+    parser.add_argument("--formats", nargs="+", choices=["onnx", "onnx-int8"], default=["onnx", "onnx-int8"])
+    args = parser.parse_args()
+
+    for model_name in (MODEL_NAMES if args.model == "all" else [args.model]):
+        export_model(model_name, args.version, args.formats)
@@ -0,0 +1,109 @@
+# app/inference/model_versions.py
+"""
+모델 가중치 파일과 버전을 파일 시스템에서 찾습니다. (모델이나 torch를 로드하지 않음)
+
+MODEL_REGISTRY_DIR가 설정되면 다음 구조에서 버전을 찾습니다.
+    <MODEL_REGISTRY_DIR>/<모델 이름>/<버전>/weights.pt
+    <MODEL_REGISTRY_DIR>/<모델 이름>/ACTIVE   (사용할 버전 이름, 없으면 가장 큰 버전)
+설정되지 않으면 Config의 고정 경로를 사용하고, 파일 내용 해시를 버전으로 사용합니다.
+"""
+import hashlib
+import os
+from config import Config
+from app.inference.engines import engine_name_for
+
+MODEL_NAMES = ("sku", "yolo")
+WEIGHTS_FILENAME = "weights.pt"
+ACTIVE_FILENAME = "ACTIVE"
+
+# (경로, 수정 시각, 크기) -> 가중치 파일 해시 캐시
+_fingerprints = {}
+
+
+def weights_fingerprint(path: str) -> str:
+    """
+    가중치 파일 내용의 SHA-256 앞 12자리를 버전으로 사용합니다.
+    파일이 바뀌지 않는 한 다시 해시하지 않으며, 모델을 로드하지 않고도 계산할 수 있습니다.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+
+    cache_key = (path, stat.st_mtime_ns, stat.st_size)
+    fingerprint = _fingerprints.get(cache_key)
+    if fingerprint is None:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        fingerprint = digest.hexdigest()[:12]
+        _fingerprints[cache_key] = fingerprint
+    return fingerprint
+
+
+def _default_weights_path(name: str) -> str:
+    return {"sku": Config.SKU_MODEL_PATH, "yolo": Config.YOLO_MODEL_PATH}[name]
+
+
+def list_versions(name: str) -> list:
+    """레지스트리 디렉토리에 있는 모델 버전 목록 (오름차순)"""
+    if not Config.MODEL_REGISTRY_DIR:
+        return []
+    model_dir = os.path.join(Config.MODEL_REGISTRY_DIR, name)
+    if not os.path.isdir(model_dir):
+        return []
+    return sorted(
+        entry for entry in os.listdir(model_dir)
+        if os.path.isfile(os.path.join(model_dir, entry, WEIGHTS_FILENAME))
+    )
+
+
+def weights_path_for(name: str, version: str) -> str:
+    return os.path.join(Config.MODEL_REGISTRY_DIR, name, version, WEIGHTS_FILENAME)
+
+
+def resolve_model_weights(name: str):
+    """현재 활성화된 (버전, 가중치 경로)를 반환합니다."""
+    versions = list_versions(name)
+    if not versions:
+        path = _default_weights_path(name)
+        return weights_fingerprint(path), path
+
+    active_file = os.path.join(Config.MODEL_REGISTRY_DIR, name, ACTIVE_FILENAME)
+    version = None
+    if os.path.isfile(active_file):
+        with open(active_file, encoding="utf-8") as f:
+            version = f.read().strip() or None
+    if version not in versions:
+        version = versions[-1]
+    return version, weights_path_for(name, version)
+
+
+def set_active_version(name: str, version: str):
+    """ACTIVE 파일을 원자적으로 갱신합니다. (다른 프로세스의 파일 감시가 이를 감지합니다.)"""
+    if version not in list_versions(name):
+        raise ValueError(f"Unknown {name} model version: {version}")
+    active_file = os.path.join(Config.MODEL_REGISTRY_DIR, name, ACTIVE_FILENAME)
+    tmp_file = f"{active_file}.tmp.{os.getpid()}"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(tmp_file, active_file)
+
+
+def engine_version_label(version: str, engine_name: str) -> str:
+    """가중치 버전에 추론 엔진을 붙인 버전 이름 (torch는 그대로)"""
+    return version if engine_name == "torch" else f"{version}+{engine_name}"
+
+
+def get_model_versions() -> dict:
+    """현재 배포된 SKU/YOLO 모델 버전(가중치 버전 + 추론 엔진)을 반환합니다."""
+    return {
+        name: engine_version_label(resolve_model_weights(name)[0], engine_name_for(name))
+        for name in MODEL_NAMES
+    }
+
+
+def format_model_version(versions: dict) -> str:
+    """{'sku': 'v1', 'yolo': 'v2'} -> 'sku:v1,yolo:v2' (detected_items.model_version 저장 형식)"""
+    return ",".join(f"{name}:{version}" for name, version in sorted(versions.items()))
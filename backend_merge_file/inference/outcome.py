@@ -0,0 +1,31 @@
+# app/inference/outcome.py
+"""
+요청 안에서 추론 단계가 실제로 수행되었는지 기록합니다. (모델이나 torch를 로드하지 않음)
+
+모델이 로드되지 않았거나 예외를 삼키고 빈 결과를 반환한 단계는 record_failure()로 기록합니다.
+track_failures() 블록이 끝났을 때 기록이 없으면 모든 단계가 정상 수행된 것이므로,
+"물품 없음" 결과와 일시적인 추론 실패를 구분하여 결과 캐시에는 정상 결과만 저장할 수 있습니다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# 현재 요청에서 정상 수행되지 않은 추론 단계 [(stage, reason)]
+_failures = ContextVar("inference_failures", default=None)
+
+
+def record_failure(stage: str, reason: str):
+    """현재 요청의 추론 단계 하나가 정상 수행되지 않았음을 기록합니다. (track_failures() 밖이면 무시)"""
+    failures = _failures.get()
+    if failures is not None:
+        failures.append((stage, reason))
+
+
+@contextmanager
+def track_failures():
+    """블록 안에서 기록된 추론 실패 목록 [(stage, reason)]을 반환합니다."""
+    failures = []
+    token = _failures.set(failures)
+    try:
+        yield failures
+    finally:
+        _failures.reset(token)
@@ -0,0 +1,41 @@
+# app/inference/profiles.py
+
+# 추론 프로필: 정확도와 지연 시간 사이의 절충을 요청 단위로 선택합니다.
+# - sku_imgsz: SKU 탐지 입력 크기 (32의 배수)
+# - crop_imgsz: 크롭 분류 입력 크기 (32의 배수)
+# - max_upload_dim: 탐지 전 업로드 이미지의 긴 변 최대 크기 (None이면 원본 해상도)
+# - jpeg_draft: JPEG를 디코딩할 때 DCT 스케일링(draft 모드)으로 축소 디코딩할지 여부
+INFERENCE_PROFILES = {
+    "fast": {
+        "sku_imgsz": 480,
+        "crop_imgsz": 224,
+        "max_upload_dim": 1280,
+        "jpeg_draft": True,
+    },
+    "balanced": {
+        "sku_imgsz": 640,
+        "crop_imgsz": 320,
+        "max_upload_dim": 2048,
+        "jpeg_draft": True,
+    },
+    # 기존 동작과 동일 (원본 해상도, 기본 입력 크기)
+    "accurate": {
+        "sku_imgsz": 640,
+        "crop_imgsz": 640,
+        "max_upload_dim": None,
+        "jpeg_draft": False,
+    },
+}
+
+
+def get_profile(name: str = None) -> dict:
+    """
+    이름으로 추론 프로필을 찾습니다. 이름이 없으면 Config.DEFAULT_INFERENCE_PROFILE을 사용합니다.
+    반환값에는 프로필 이름('name')이 포함됩니다. 알 수 없는 이름이면 ValueError를 발생시킵니다.
+    """
+    from config import Config
+
+    name = name or Config.DEFAULT_INFERENCE_PROFILE
+    if name not in INFERENCE_PROFILES:
+        raise ValueError(f"알 수 없는 추론 프로필입니다: {name} (가능한 값: {', '.join(INFERENCE_PROFILES)})")
+    return {"name": name, **INFERENCE_PROFILES[name]}
@@ -0,0 +1,73 @@
+# app/inference/protocol.py
+"""
+추론 데몬과 클라이언트가 공유하는 Unix 소켓 메시지 형식과 공유 메모리 헬퍼입니다.
+
+메시지: 4바이트 big-endian 길이 + UTF-8 JSON 헤더
+이미지: 픽셀 데이터는 소켓으로 보내지 않고 multiprocessing.shared_memory 블록 이름만 전달합니다.
+"""
+import json
+import struct
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+
+HEADER_STRUCT = struct.Struct(">I")
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+def send_message(sock, message: dict):
+    payload = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    sock.sendall(HEADER_STRUCT.pack(len(payload)) + payload)
+
+
+def recv_message(sock):
+    """메시지 하나를 읽어 dict로 반환합니다. 상대가 연결을 닫았으면 None."""
+    header = _recv_exact(sock, HEADER_STRUCT.size)
+    if header is None:
+        return None
+    (length,) = HEADER_STRUCT.unpack(header)
+    if length > MAX_MESSAGE_SIZE:
+        raise ValueError(f"Message too large: {length} bytes")
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        raise ConnectionError("Connection closed in the middle of a message")
+    return json.loads(payload.decode("utf-8"))
+
+
+def _recv_exact(sock, size: int):
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(remaining)
+        if not chunk:
+            if remaining == size:
+                return None
+            raise ConnectionError("Connection closed in the middle of a message")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def create_shared_array(array: np.ndarray):
+    """
+    배열을 새 공유 메모리 블록에 복사하고 (SharedMemory, 디스크립터)를 반환합니다.
+    블록은 생성한 쪽(클라이언트)이 close()/unlink()로 해제해야 합니다.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    descriptor = {"name": shm.name, "shape": list(array.shape), "dtype": str(array.dtype)}
+    return shm, descriptor
+
+
+def attach_shared_array(descriptor: dict):
+    """
+    디스크립터가 가리키는 공유 메모리 블록에 연결하고 (SharedMemory, 배열 뷰)를 반환합니다.
+    연결한 쪽은 블록을 소유하지 않으므로 resource_tracker가 해제하지 않도록 등록을 해제합니다.
+    """
+    try:
+        shm = shared_memory.SharedMemory(name=descriptor["name"], track=False)
+    except TypeError:
+        # Python 3.13 미만에는 track 인자가 없습니다.
+        shm = shared_memory.SharedMemory(name=descriptor["name"])
+        resource_tracker.unregister(shm._name, "shared_memory")
+    array = np.ndarray(tuple(descriptor["shape"]), dtype=np.dtype(descriptor["dtype"]), buffer=shm.buf)
+    return shm, array
@@ -0,0 +1,303 @@
+# app/inference/registry.py
+"""
+버전별 모델 가중치를 로드하고, 서비스 중단 없이 교체(hot-swap)하는 모델 레지스트리입니다.
+
+- 새 버전은 로드 후 더미 추론으로 워밍업한 다음 원자적으로 교체됩니다.
+- 교체 전에 시작된 요청은 이전 버전을 끝까지 사용하며(drain),
+  마지막 요청이 끝나면 이전 버전의 메모리를 해제합니다.
+- 한 요청의 SKU/YOLO 단계가 같은 버전 조합을 쓰도록 pin()으로 고정할 수 있습니다.
+- Config.MODEL_LOAD_MODE에 따라 등록 즉시(eager), 첫 사용 시(lazy),
+  또는 백그라운드 스레드(background)에서 로드합니다.
+  torch/ultralytics는 실제 로드 시점에만 import됩니다.
+- 요청 경로의 로드가 실패하면 MODEL_LOAD_RETRY_INTERVAL 동안 다시 시도하지 않고
+  바로 None을 반환합니다. (관리자 API의 reload는 언제든 다시 시도)
+"""
+import gc
+import os
+import threading
+import time
+from contextlib import contextmanager
+from config import Config
+from app.inference.engines import engine_name_for, load_engine
+from app.inference.model_versions import resolve_model_weights, weights_path_for, engine_version_label
+
+# 워밍업 더미 입력 크기
+WARMUP_IMGSZ = 640
+
+# 모델 로드 상태
+STATE_NOT_LOADED = "not_loaded"
+STATE_LOADING = "loading"
+STATE_READY = "ready"
+STATE_FAILED = "failed"
+
+
+class ModelHandle:
+    """로드된 모델(추론 엔진) 한 버전과 사용 중인 요청 수(refcount)를 관리합니다."""
+
+    def __init__(self, name: str, version: str, model):
+        self.name = name
+        self.version = version
+        self.model = model
+        self.loaded_at = time.time()
+        self._refcount = 0
+        self._retired = False
+        self._lock = threading.Lock()
+
+    def retain(self):
+        with self._lock:
+            self._refcount += 1
+
+    def release(self):
+        with self._lock:
+            self._refcount -= 1
+            free = self._retired and self._refcount == 0
+        if free:
+            self._free()
+
+    def retire(self):
+        """교체된 버전으로 표시하고, 사용 중인 요청이 없으면 바로 해제합니다."""
+        with self._lock:
+            self._retired = True
+            free = self._refcount == 0
+        if free:
+            self._free()
+
+    @property
+    def in_flight(self) -> int:
+        return self._refcount
+
+    def _free(self):
+        print(f"[MODEL REGISTRY] Releasing {self.name} model version {self.version}")
+        self.model = None
+        gc.collect()
+
+
+class ModelRegistry:
+    def __init__(self):
+        self._handles = {}
+        self._states = {}
+        self._failed_at = {}
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._local = threading.local()
+        self._watcher = None
+        self._listeners = {}
+
+    def register(self, name: str):
+        """
+        모델을 등록하고 Config.MODEL_LOAD_MODE에 따라 로드를 시작합니다.
+        - eager: 지금 바로 로드 (기존 동작)
+        - background: 백그라운드 스레드에서 로드
+        - lazy: 첫 acquire() 시점에 로드
+        """
+        with self._lock:
+            self._states.setdefault(name, STATE_NOT_LOADED)
+
+        mode = Config.MODEL_LOAD_MODE
+        if mode == "eager":
+            self._safe_load(name)
+        elif mode == "background":
+            threading.Thread(target=self._safe_load, args=(name,), name=f"model-warmup-{name}", daemon=True).start()
+
+    def _safe_load(self, name: str):
+        try:
+            return self.load(name)
+        except Exception as e:
+            print(f"[MODEL REGISTRY] Error loading {name} model: {e}")
+            return None
+
+    def _load_on_demand(self, name: str):
+        """
+        요청 경로에서 아직 로드되지 않은 모델을 로드합니다.
+        최근에 로드에 실패했으면 매 요청마다 로드 지연을 겪지 않도록 다시 시도하지 않습니다.
+        재시도 간격이 지나면 한 요청만 다시 시도하고, 나머지 요청은 그동안 바로 실패합니다.
+        """
+        with self._lock:
+            failed_at = self._failed_at.get(name)
+            if failed_at is not None:
+                now = time.monotonic()
+                interval = Config.MODEL_LOAD_RETRY_INTERVAL
+                if interval <= 0 or now - failed_at < interval:
+                    return None
+                self._failed_at[name] = now
+        return self._safe_load(name)
+
+    def state(self, name: str) -> str:
+        return self._states.get(name, STATE_NOT_LOADED)
+
+    def load(self, name: str, version: str = None):
+        """
+        모델을 로드하고 워밍업한 뒤 활성 버전으로 교체합니다.
+        version이 없으면 레지스트리의 활성 버전을 사용합니다. 이미 같은 버전이면 아무것도 하지 않습니다.
+        """
+        with self._load_lock:
+            if version is None:
+                version, path = resolve_model_weights(name)
+            else:
+                path = weights_path_for(name, version)
+            # 같은 가중치라도 엔진이 다르면 다른 버전으로 취급합니다. (예: 'v3+onnx-int8')
+            engine_name = engine_name_for(name)
+            version = engine_version_label(version, engine_name)
+
+            current = self._handles.get(name)
+            if current is not None and current.version == version:
+                return current
+
+            print(f"[MODEL REGISTRY] Loading {name} model version {version} from {path} ({engine_name})")
+            if current is None:
+                self._states[name] = STATE_LOADING
+            try:
+                model = load_engine(path, engine_name)
+                # 첫 요청이 초기화 비용을 떠안지 않도록 더미 추론으로 워밍업합니다.
+                model.warmup(WARMUP_IMGSZ)
+            except Exception:
+                # 교체 실패 시 기존 버전은 그대로 서비스합니다.
+                if current is None:
+                    self._states[name] = STATE_FAILED
+                    self._failed_at[name] = time.monotonic()
+                raise
+
+            handle = self._activate(name, version, model)
+            self._ensure_watcher()
+            return handle
+
+    def install(self, name: str, model, version: str = "stub"):
+        """
+        이미 만들어진 모델(추론 엔진과 같은 인터페이스의 객체)을 활성 버전으로 설치합니다.
+        가중치 파일 없이 파이프라인을 실행하는 벤치마크에서 사용합니다.
+        """
+        with self._load_lock:
+            return self._activate(name, version, model)
+
+    def _activate(self, name: str, version: str, model):
+        handle = ModelHandle(name, version, model)
+        with self._lock:
+            previous = self._handles.get(name)
+            self._handles[name] = handle
+            self._states[name] = STATE_READY
+            self._failed_at.pop(name, None)
+        if previous is not None:
+            previous.retire()
+
+        print(f"[MODEL REGISTRY] {name} model version {version} is now active")
+        for callback in self._listeners.get(name, ()):
+            self._notify(callback, name, model)
+        return handle
+
+    def add_activation_listener(self, name: str, callback):
+        """
+        모델이 로드/교체될 때마다 callback(model)을 호출합니다.
+        이미 활성 버전이 있으면 등록 시점에 한 번 바로 호출합니다.
+        """
+        self._listeners.setdefault(name, []).append(callback)
+        handle = self._handles.get(name)
+        if handle is not None and handle.model is not None:
+            self._notify(callback, name, handle.model)
+
+    @staticmethod
+    def _notify(callback, name: str, model):
+        try:
+            callback(model)
+        except Exception as e:
+            print(f"[MODEL REGISTRY] Activation listener for {name} failed: {e}")
+
+    def reload(self):
+        """모든 모델에 대해 레지스트리의 활성 버전을 다시 확인하고, 바뀐 모델만 교체합니다."""
+        for name in list(self._handles):
+            try:
+                self.load(name)
+            except Exception as e:
+                print(f"[MODEL REGISTRY] Failed to reload {name} model: {e}")
+
+    def get(self, name: str):
+        return self._handles.get(name)
+
+    @contextmanager
+    def acquire(self, name: str):
+        """
+        요청 동안 사용할 모델 핸들을 반환합니다. (로드에 실패했으면 None)
+        pin()으로 고정된 스레드에서는 고정된 핸들을 그대로 사용합니다.
+        아직 로드되지 않은 등록 모델은 이 시점에 로드합니다. (백그라운드 로드 중이면 완료까지 대기,
+        최근에 로드에 실패했으면 재시도 간격 동안 바로 None)
+        """
+        pinned = getattr(self._local, "pinned", None)
+        if pinned and name in pinned:
+            yield pinned[name]
+            return
+
+        if name not in self._handles and name in self._states:
+            self._load_on_demand(name)
+
+        with self._lock:
+            handle = self._handles.get(name)
+            if handle is not None:
+                handle.retain()
+        try:
+            yield handle
+        finally:
+            if handle is not None:
+                handle.release()
+
+    @contextmanager
+    def pin(self):
+        """
+        현재 활성 버전들을 한 번에 고정하여, 블록 안의 모든 추론이 같은 버전 조합을 쓰도록 합니다.
+        고정된 버전 정보 dict {모델 이름: 버전}을 반환합니다.
+        """
+        if getattr(self._local, "pinned", None):
+            yield {name: handle.version for name, handle in self._local.pinned.items()}
+            return
+
+        for name in list(self._states):
+            if name not in self._handles:
+                self._load_on_demand(name)
+
+        with self._lock:
+            pinned = dict(self._handles)
+            for handle in pinned.values():
+                handle.retain()
+        self._local.pinned = pinned
+        try:
+            yield {name: handle.version for name, handle in pinned.items()}
+        finally:
+            self._local.pinned = None
+            for handle in pinned.values():
+                handle.release()
+
+    def status(self) -> dict:
+        status = {}
+        for name, state in list(self._states.items()):
+            handle = self._handles.get(name)
+            status[name] = {
+                "state": state,
+                "version": handle.version if handle else None,
+                "loaded_at": handle.loaded_at if handle else None,
+                "in_flight": handle.in_flight if handle else 0,
+            }
+        return status
+
+    def _ensure_watcher(self):
+        """MODEL_REGISTRY_WATCH_INTERVAL이 설정되면 ACTIVE 파일 변경을 주기적으로 확인합니다."""
+        if self._watcher is not None or not Config.MODEL_REGISTRY_DIR or Config.MODEL_REGISTRY_WATCH_INTERVAL <= 0:
+            return
+        self._watcher = threading.Thread(target=self._watch, name="model-registry-watcher", daemon=True)
+        self._watcher.start()
+
+    def _after_fork(self):
+        # fork된 자식 프로세스에는 감시 스레드가 없으므로 다시 시작합니다.
+        self._watcher = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        if self._handles:
+            self._ensure_watcher()
+
+    def _watch(self):
+        while True:
+            time.sleep(Config.MODEL_REGISTRY_WATCH_INTERVAL)
+            self.reload()
+
+
+# 싱글톤 인스턴스
+model_registry = ModelRegistry()
+os.register_at_fork(after_in_child=model_registry._after_fork)
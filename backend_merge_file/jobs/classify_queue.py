@@ -0,0 +1,186 @@
+# app/jobs/classify_queue.py
+import json
+import os
+import socket
+import time
+import uuid
+from config import Config
+from app.db.redis_client import get_redis
+
+# Redis 키 구성
+QUEUE_KEY = "classify:queue"
+PROCESSING_KEY = "classify:processing:{worker_id}"  # 워커가 꺼내 처리 중인 job_id (완료 시 ack로 제거)
+WORKERS_KEY = "classify:workers"  # worker_id → 마지막 하트비트 시각 (sorted set)
+JOB_KEY = "classify:job:{job_id}"
+UPLOAD_KEY = "classify:upload:{job_id}"
+
+# 작업 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class ClassifyJobQueue:
+    """
+    /classify 비동기 처리를 위한 Redis 기반 작업 큐입니다.
+    업로드 원본, 작업 상태, 결과를 모두 Redis에 TTL과 함께 보관합니다.
+    꺼낸 작업은 워커별 처리 중 목록으로 원자적으로 옮기고, 처리가 끝나면 ack로 제거합니다.
+    워커가 죽으면 하트비트가 끊긴 워커의 처리 중 목록을 다른 워커가 큐로 되돌립니다. (requeue_stale)
+    redis_client에 fakeredis 인스턴스를 넘기면 로컬 Redis 없이 동작합니다.
+    """
+
+    def __init__(self, redis_client=None, result_ttl: int = None):
+        self._redis = redis_client
+        self.result_ttl = result_ttl or Config.CLASSIFY_JOB_RESULT_TTL
+
+    @property
+    def redis(self):
+        return self._redis if self._redis is not None else get_redis()
+
+    def enqueue(self, image_bytes: bytes, user_id: str, profile: str = None) -> str:
+        """업로드를 저장하고 작업을 큐에 넣은 뒤 job_id를 반환합니다."""
+        job_id = uuid.uuid4().hex
+        job_key = JOB_KEY.format(job_id=job_id)
+
+        fields = {
+            "status": STATUS_QUEUED,
+            "user_id": user_id,
+            "created_at": time.time(),
+        }
+        if profile:
+            fields["profile"] = profile
+
+        pipe = self.redis.pipeline()
+        pipe.set(UPLOAD_KEY.format(job_id=job_id), image_bytes, ex=self.result_ttl)
+        pipe.hset(job_key, mapping=fields)
+        pipe.expire(job_key, self.result_ttl)
+        pipe.lpush(QUEUE_KEY, job_id)
+        pipe.execute()
+        return job_id
+
+    def dequeue(self, worker_id: str, timeout: int = 5):
+        """
+        대기 중인 작업 하나를 worker_id의 처리 중 목록으로 옮기고 job_id를 반환합니다.
+        timeout초 동안 없으면 None을 반환합니다. 처리가 끝나면 ack를 호출해야 합니다.
+        """
+        self.heartbeat(worker_id)
+        job_id = self.redis.brpoplpush(QUEUE_KEY, PROCESSING_KEY.format(worker_id=worker_id), timeout=timeout)
+        if not job_id:
+            return None
+        return job_id.decode() if isinstance(job_id, bytes) else job_id
+
+    def ack(self, worker_id: str, job_id: str):
+        """처리가 끝난(성공/실패 기록 완료) 작업을 처리 중 목록에서 제거합니다."""
+        self.redis.lrem(PROCESSING_KEY.format(worker_id=worker_id), 0, job_id)
+
+    def heartbeat(self, worker_id: str):
+        self.redis.zadd(WORKERS_KEY, {worker_id: time.time()})
+
+    def retire(self, worker_id: str):
+        """정상 종료하는 워커의 등록을 지우고, 남은 처리 중 작업을 큐로 되돌립니다."""
+        self._requeue_processing(worker_id)
+        self.redis.zrem(WORKERS_KEY, worker_id)
+
+    def requeue_stale(self, stale_after: int = None) -> int:
+        """
+        stale_after초 넘게 하트비트가 없는 워커의 처리 중 작업을 큐로 되돌립니다. 되돌린 작업 수를 반환합니다.
+        같은 작업이 Config.CLASSIFY_JOB_MAX_ATTEMPTS번 넘게 되돌려지면 (워커를 계속 죽이는 입력) 실패로 기록합니다.
+        """
+        stale_after = stale_after or Config.CLASSIFY_WORKER_STALE_AFTER
+        stale_workers = self.redis.zrangebyscore(WORKERS_KEY, "-inf", time.time() - stale_after)
+        requeued = 0
+        for worker_id in stale_workers:
+            worker_id = worker_id.decode() if isinstance(worker_id, bytes) else worker_id
+            requeued += self._requeue_processing(worker_id)
+            self.redis.zrem(WORKERS_KEY, worker_id)
+        if requeued:
+            print(f"[CLASSIFY QUEUE] Requeued {requeued} jobs from {len(stale_workers)} stale workers")
+        return requeued
+
+    def _requeue_processing(self, worker_id: str) -> int:
+        processing_key = PROCESSING_KEY.format(worker_id=worker_id)
+        requeued = 0
+        while True:
+            # 한 항목씩 원자적으로 옮기므로 여러 워커가 동시에 정리해도 중복되지 않습니다.
+            job_id = self.redis.rpoplpush(processing_key, QUEUE_KEY)
+            if job_id is None:
+                return requeued
+            job_id = job_id.decode() if isinstance(job_id, bytes) else job_id
+            attempts = self.redis.hincrby(JOB_KEY.format(job_id=job_id), "attempts", 1)
+            if attempts >= Config.CLASSIFY_JOB_MAX_ATTEMPTS:
+                self.redis.lrem(QUEUE_KEY, 0, job_id)
+                self.mark_failed(job_id, "작업을 처리하던 워커가 반복해서 중단되었습니다.")
+                continue
+            self.redis.hset(JOB_KEY.format(job_id=job_id), "status", STATUS_QUEUED)
+            requeued += 1
+
+    def get_upload(self, job_id: str):
+        """작업에 저장된 업로드 원본 바이트를 반환합니다."""
+        return self.redis.get(UPLOAD_KEY.format(job_id=job_id))
+
+    def get_user_id(self, job_id: str):
+        return self._get_field(job_id, "user_id")
+
+    def get_profile(self, job_id: str):
+        """작업에 지정된 추론 프로필 이름 (없으면 None → 서버 기본값)"""
+        return self._get_field(job_id, "profile")
+
+    def mark_running(self, job_id: str):
+        self._update(job_id, {"status": STATUS_RUNNING, "started_at": time.time()})
+
+    def mark_done(self, job_id: str, result: dict):
+        """결과를 JSON으로 저장하고, 더 이상 필요 없는 업로드 원본을 삭제합니다."""
+        self._update(job_id, {
+            "status": STATUS_DONE,
+            "finished_at": time.time(),
+            "result": json.dumps(result, ensure_ascii=False),
+        })
+        self.redis.delete(UPLOAD_KEY.format(job_id=job_id))
+
+    def mark_failed(self, job_id: str, error: str, status_code: int = 500):
+        self._update(job_id, {
+            "status": STATUS_FAILED,
+            "finished_at": time.time(),
+            "error": error,
+            "status_code": status_code,
+        })
+        self.redis.delete(UPLOAD_KEY.format(job_id=job_id))
+
+    def get_status(self, job_id: str):
+        """작업 상태 딕셔너리를 반환합니다. 작업이 없거나 만료되었으면 None."""
+        raw = self.redis.hgetall(JOB_KEY.format(job_id=job_id))
+        if not raw:
+            return None
+        job = {
+            (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+            for k, v in raw.items()
+        }
+
+        status = {"job_id": job_id, "status": job["status"]}
+        if job["status"] == STATUS_DONE:
+            status["result"] = json.loads(job["result"])
+        elif job["status"] == STATUS_FAILED:
+            status["error"] = job.get("error")
+            status["status_code"] = int(job.get("status_code") or 500)
+        return status
+
+    def _get_field(self, job_id: str, field: str):
+        value = self.redis.hget(JOB_KEY.format(job_id=job_id), field)
+        return value.decode() if isinstance(value, bytes) else value
+
+    def _update(self, job_id: str, fields: dict):
+        job_key = JOB_KEY.format(job_id=job_id)
+        pipe = self.redis.pipeline()
+        pipe.hset(job_key, mapping=fields)
+        pipe.expire(job_key, self.result_ttl)
+        pipe.execute()
+
+
+def default_worker_id() -> str:
+    """호스트 이름과 프로세스 id로 만든 워커 식별자"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+# 싱글톤 인스턴스
+classify_queue = ClassifyJobQueue()
@@ -0,0 +1,54 @@
+# app/jobs/derivative_queue.py
+from config import Config
+from app.db.redis_client import get_redis
+
+# Redis 키 구성
+QUEUE_KEY = "images:derivatives:queue"
+PENDING_KEY = "images:derivatives:pending"  # 큐에 들어 있는 image_id (중복 등록 방지)
+
+
+class DerivativeQueue:
+    """
+    업로드 이미지의 파생 이미지(썸네일 등) 생성 작업 큐입니다. (Redis 리스트)
+    같은 image_id가 처리 전에 여러 번 등록되어도 한 번만 큐에 들어갑니다.
+    """
+
+    def __init__(self, redis_client=None):
+        self._redis = redis_client
+
+    @property
+    def redis(self):
+        return self._redis if self._redis is not None else get_redis()
+
+    def enqueue(self, image_id: int) -> bool:
+        """작업을 등록합니다. 이미 대기 중이면 False."""
+        if not self.redis.sadd(PENDING_KEY, image_id):
+            return False
+        self.redis.lpush(QUEUE_KEY, image_id)
+        return True
+
+    def dequeue(self, timeout: int = 5):
+        """대기 중인 image_id 하나를 꺼냅니다. timeout초 동안 없으면 None을 반환합니다."""
+        item = self.redis.brpop(QUEUE_KEY, timeout=timeout)
+        if not item:
+            return None
+        _, image_id = item
+        self.redis.srem(PENDING_KEY, image_id)
+        return int(image_id)
+
+
+def enqueue_derivatives(image_id: int):
+    """
+    /classify 이후 파생 이미지 생성을 요청합니다.
+    업로드 응답을 늦추지 않도록 실패해도 예외를 던지지 않습니다. (파생 이미지가 없으면 원본을 제공)
+    """
+    if not Config.DERIVATIVES_ENABLED or image_id is None:
+        return
+    try:
+        derivative_queue.enqueue(image_id)
+    except Exception as e:
+        print(f"[DERIVATIVES] Failed to enqueue image {image_id}: {e}")
+
+
+# 싱글톤 인스턴스
+derivative_queue = DerivativeQueue()
@@ -0,0 +1,101 @@
+# app/jobs/derivative_worker.py
+"""
+업로드 이미지의 파생 이미지(썸네일 등)를 만드는 백그라운드 워커입니다.
+모델을 로드하지 않으므로 /classify 워커와 별도로 가볍게 실행합니다.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.jobs.derivative_worker --processes 1
+    python -m app.jobs.derivative_worker --backfill   # 파생 이미지가 없을 수 있는 기존 이미지를 모두 등록
+"""
+import argparse
+import multiprocessing
+import signal
+from sqlalchemy import text
+from config import Config
+from app.db.database import get_engine, get_image_details_by_id
+from app.imaging.derivatives import generate_derivatives
+from app.jobs.derivative_queue import DerivativeQueue
+from app.storage.blob_store import get_blob_store, BlobNotFound
+
+
+def process_image(image_id: int):
+    """image_id 하나의 파생 이미지를 만듭니다. 원본이 아직 DB에 있으면(blob 이전 전) 건너뜁니다."""
+    details = get_image_details_by_id(image_id)
+    if not details or not details["blob_key"] or not details["width"] or not details["height"]:
+        print(f"[DERIVATIVE WORKER] Image {image_id} has no stored blob. Skipping.")
+        return
+    try:
+        stored = generate_derivatives(get_blob_store(), details["blob_key"], details["width"], details["height"])
+    except BlobNotFound:
+        print(f"[DERIVATIVE WORKER] Blob for image {image_id} is missing. Skipping.")
+        return
+    if stored:
+        print(f"[DERIVATIVE WORKER] Stored {stored} derivatives for image {image_id}")
+
+
+def run_worker(stop_event=None, queue: DerivativeQueue = None, poll_timeout: int = 5):
+    """stop_event가 설정될 때까지 큐에서 작업을 꺼내 처리합니다."""
+    queue = queue or DerivativeQueue()
+    print(f"[DERIVATIVE WORKER] Worker started ({multiprocessing.current_process().name})")
+
+    while stop_event is None or not stop_event.is_set():
+        try:
+            image_id = queue.dequeue(timeout=poll_timeout)
+        except Exception as e:
+            print(f"[DERIVATIVE WORKER] Failed to poll queue: {e}")
+            if stop_event is not None:
+                stop_event.wait(poll_timeout)
+            continue
+
+        if image_id is None:
+            continue
+        try:
+            process_image(image_id)
+        except Exception as e:
+            print(f"[DERIVATIVE WORKER] Image {image_id} failed: {e}")
+
+
+def backfill(queue: DerivativeQueue = None) -> int:
+    """blob 저장소에 원본이 있는 모든 이미지를 큐에 등록합니다. (이미 있는 파생 이미지는 다시 만들지 않음)"""
+    queue = queue or DerivativeQueue()
+    with get_engine().connect() as conn:
+        image_ids = conn.execute(text("SELECT image_id FROM images WHERE blob_key IS NOT NULL")).scalars().all()
+    return sum(queue.enqueue(image_id) for image_id in image_ids)
+
+
+def _worker_main(stop_event):
+    # 종료는 부모 프로세스가 stop_event로 관리합니다.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    run_worker(stop_event)
+
+
+def run_worker_pool(num_processes: int = None):
+    num_processes = num_processes or Config.DERIVATIVE_WORKER_PROCESSES
+    stop_event = multiprocessing.Event()
+    workers = [
+        multiprocessing.Process(target=_worker_main, args=(stop_event,), name=f"derivative-worker-{i}")
+        for i in range(num_processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    def _shutdown(signum, frame):
+        print("[DERIVATIVE WORKER] Shutting down workers...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, _shutdown)
+    signal.signal(signal.SIGTERM, _shutdown)
+
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="파생 이미지 생성 워커")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--backfill", action="store_true", help="기존 이미지를 큐에 등록하고 종료")
+    args = parser.parse_args()
+    if args.backfill:
+        print(f"[DERIVATIVE WORKER] Queued {backfill()} images")
+    else:
+        run_worker_pool(args.processes)
@@ -0,0 +1,106 @@
+# app/jobs/worker.py
+"""
+비동기 /classify 작업을 처리하는 워커 풀입니다.
+모델은 각 워커 프로세스가 직접 로드합니다. 부모 프로세스는 모델(torch/OpenMP 스레드 풀)을 import하지 않고,
+워커는 spawn으로 시작하므로 fork 이후 공유된 스레드 풀 상태를 물려받지 않습니다.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.jobs.worker --processes 2
+"""
+import argparse
+import multiprocessing
+import signal
+from config import Config
+from app.jobs.classify_queue import ClassifyJobQueue, default_worker_id
+
+
+def process_job(queue: ClassifyJobQueue, job_id: str):
+    """작업 하나를 처리하고 결과 또는 오류를 큐에 기록합니다."""
+    # 모델 로드는 이 import에서 일어나므로 워커 프로세스 안에서만 import합니다.
+    from app.routes.classify import process_upload, ClassifyError
+
+    image_bytes = queue.get_upload(job_id)
+    if image_bytes is None:
+        queue.mark_failed(job_id, "업로드 데이터가 만료되었습니다.", 410)
+        return
+
+    queue.mark_running(job_id)
+    try:
+        result = process_upload(image_bytes, user_id=queue.get_user_id(job_id) or "custom1",
+                                profile_name=queue.get_profile(job_id))
+        queue.mark_done(job_id, result)
+    except ClassifyError as e:
+        queue.mark_failed(job_id, str(e), e.status_code)
+    except Exception as e:
+        print(f"[CLASSIFY WORKER] Job {job_id} failed: {e}")
+        queue.mark_failed(job_id, str(e))
+
+
+def run_worker(stop_event=None, queue: ClassifyJobQueue = None, poll_timeout: int = 5, worker_id: str = None):
+    """
+    stop_event가 설정될 때까지 큐에서 작업을 꺼내 처리합니다.
+    꺼낸 작업은 결과를 기록한 뒤 ack하므로, 처리 중에 프로세스가 죽으면 다른 워커가 다시 큐에 넣습니다.
+    """
+    queue = queue or ClassifyJobQueue()
+    worker_id = worker_id or default_worker_id()
+    print(f"[CLASSIFY WORKER] Worker started ({multiprocessing.current_process().name}, {worker_id})")
+
+    while stop_event is None or not stop_event.is_set():
+        try:
+            queue.requeue_stale()
+            job_id = queue.dequeue(worker_id, timeout=poll_timeout)
+        except Exception as e:
+            print(f"[CLASSIFY WORKER] Failed to poll queue: {e}")
+            if stop_event is not None:
+                stop_event.wait(poll_timeout)
+            continue
+
+        if job_id:
+            process_job(queue, job_id)
+            queue.ack(worker_id, job_id)
+
+    try:
+        queue.retire(worker_id)
+    except Exception as e:
+        print(f"[CLASSIFY WORKER] Failed to unregister worker {worker_id}: {e}")
+
+
+def _worker_main(stop_event):
+    # 종료는 부모 프로세스가 stop_event로 관리합니다.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # 작업을 받기 전에 이 프로세스에서 모델을 로드합니다. (MODEL_LOAD_MODE를 따름)
+    import app.routes.classify  # noqa: F401
+    run_worker(stop_event)
+
+
+def run_worker_pool(num_processes: int = None):
+    """
+    num_processes개의 워커 프로세스를 띄우고 종료 신호를 받을 때까지 대기합니다.
+    각 워커는 spawn으로 새 인터프리터에서 시작해 모델을 따로 로드합니다.
+    """
+    num_processes = num_processes or Config.CLASSIFY_WORKER_PROCESSES
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+    workers = [
+        context.Process(target=_worker_main, args=(stop_event,), name=f"classify-worker-{i}")
+        for i in range(num_processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    def _shutdown(signum, frame):
+        print("[CLASSIFY WORKER] Shutting down workers...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, _shutdown)
+    signal.signal(signal.SIGTERM, _shutdown)
+
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="/classify 비동기 작업 워커")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+    run_worker_pool(args.processes)
@@ -0,0 +1,242 @@
+# app/matching/autocomplete.py
+"""
+한글을 고려한 자동완성 인덱스입니다. ItemsService.init_app에서 한 번 만들고 검색마다 재사용합니다.
+
+- 이름은 NFC 정규화, 소문자화, 공백 정리 후 색인합니다. (한글 item_name과 item_name_EN 모두)
+- 접두어: 자모로 분해한 이름(입력 중인 글자 '갑' → '가방'), 초성('ㅂㄷㄹ' → '보조배터리'),
+  영어 이름, 그리고 각 단어 시작 위치부터의 문자열을 정렬된 키 배열에 넣고 이진 탐색으로 찾습니다.
+- 부분 일치: 글자 2-gram 역색인으로 질의와 겹치는 2-gram이 많은 항목을 찾습니다. (한 글자 질의는 1-gram)
+- 위 두 후보 집합(수백 개 이하)만 rapidfuzz WRatio로 다시 점수를 매깁니다.
+  접두어로 찾은 항목은 점수와 관계없이 포함하고 먼저 보여줍니다.
+"""
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from rapidfuzz import fuzz
+
+# 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+            "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+# 겹받침/겹모음은 입력 순서대로 나눕니다. ('달' 다음 'ㄱ'을 치면 '닭'이 되므로 ㄺ = ㄹ + ㄱ)
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+CONSONANTS = frozenset(CHOSUNG) | frozenset("ㄳㄵㄶㄺㄻㄼㄽㄾㄿㅀㅄ")
+
+# 후보 수 제한 (재점수 비용 상한)
+PREFIX_CANDIDATES = 200
+NGRAM_CANDIDATES = 200
+NGRAM_SCAN_GRAMS = 4
+NGRAM_SCAN_POSTINGS = 2000
+# 접두어로 찾지 못한 후보의 최소 WRatio 점수 (기존 선형 검색과 같은 기준)
+SCORE_CUTOFF = 75
+
+
+def normalize(text: str) -> str:
+    """NFC 정규화, 소문자화, 연속 공백 정리"""
+    return " ".join(unicodedata.normalize("NFC", text or "").casefold().split())
+
+
+def _build_jamo_table() -> dict:
+    """음절/겹자모 → 호환 자모 문자열 변환표 (str.translate용)"""
+    table = {ord(jamo): split for jamo, split in COMPOUND_JAMO.items()}
+    for code in range(HANGUL_FIRST, HANGUL_LAST + 1):
+        cho, rest = divmod(code - HANGUL_FIRST, 588)
+        jung, jong = divmod(rest, 28)
+        jamo = CHOSUNG[cho] + JUNGSUNG[jung] + JONGSUNG[jong]
+        table[code] = "".join(COMPOUND_JAMO.get(char, char) for char in jamo)
+    return table
+
+
+JAMO_TABLE = _build_jamo_table()
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 호환 자모로 분해합니다. ('가방' → 'ㄱㅏㅂㅏㅇ', 다른 문자는 그대로)"""
+    return text.translate(JAMO_TABLE)
+
+
+CHOSUNG_TABLE = {code: CHOSUNG[(code - HANGUL_FIRST) // 588] for code in range(HANGUL_FIRST, HANGUL_LAST + 1)}
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 바꿉니다. ('보조 배터리' → 'ㅂㅈ ㅂㅌㄹ', 다른 문자는 그대로)"""
+    return text.translate(CHOSUNG_TABLE)
+
+
+def is_chosung_query(text: str) -> bool:
+    """공백을 제외하면 자음만으로 된 입력인지 ('ㅂㄷㄹ')"""
+    letters = text.replace(" ", "")
+    return bool(letters) and all(char in CONSONANTS for char in letters)
+
+
+def _word_starts(text: str) -> list:
+    """전체 문자열과 각 단어 시작 위치부터의 문자열, 공백을 뺀 전체 문자열 ('보조 배터리' → 보조 배터리, 배터리, 보조배터리)"""
+    starts = []
+    position = 0
+    for word in text.split(" "):
+        starts.append(text[position:])
+        position += len(word) + 1
+    compact = text.replace(" ", "")
+    if compact != text:
+        starts.append(compact)
+    return starts
+
+
+def _grams(text: str, n: int) -> set:
+    text = text.replace(" ", "")
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class AutocompleteIndex:
+    def __init__(self, items=()):
+        """
+        items: [{"item_name", "item_name_EN"(선택)}]
+        짧은 이름부터 번호를 매기므로 후보 수를 자를 때 짧은(더 일반적인) 이름이 남습니다.
+        """
+        entries = {}
+        for item in items:
+            name = item.get("item_name")
+            if name and name not in entries:
+                entries[name] = (normalize(name), normalize(item.get("item_name_EN")))
+        self.names = sorted(entries, key=lambda name: (len(entries[name][0]), entries[name][0]))
+        self._forms = [entries[name] for name in self.names]
+        self._chosung = [to_chosung(ko) for ko, _ in self._forms]
+        self._index_of = {name: idx for idx, name in enumerate(self.names)}
+        self._removed = frozenset()  # 삭제된 항목 번호 (키/역색인에는 남고 검색에서 제외)
+        self._write_lock = threading.Lock()  # add/remove 직렬화 (검색은 잠그지 않음)
+
+        self._postings = {}
+        keys = set()
+        for idx in range(len(self.names)):
+            entry_keys, grams = self._entry(idx)
+            keys.update(entry_keys)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(idx)
+        # (자모/초성/영어 키, 항목 번호) 정렬 배열 — 접두어가 같은 키는 연속 구간에 모입니다.
+        self._keys = sorted(keys)
+
+    def __len__(self):
+        return len(self._index_of)
+
+    def _entry(self, idx: int):
+        """항목 하나의 접두어 키와 역색인 gram을 반환합니다."""
+        keys = set()
+        grams = set()
+        ko, en = self._forms[idx]
+        for form in (ko, en):
+            if not form:
+                continue
+            for start in _word_starts(to_jamo(form)):
+                keys.add((start, idx))
+            # 1-gram은 한글 등 비ASCII 문자만 색인합니다. (영문 한 글자 질의는 접두어로 충분)
+            grams |= {gram for gram in _grams(form, 1) if not gram.isascii()}
+            grams |= _grams(form, 2)
+        for start in _word_starts(self._chosung[idx]):
+            keys.add((start, idx))
+        return keys, grams
+
+    def add(self, item: dict):
+        """
+        항목 하나를 추가합니다. (같은 이름이 있으면 영어 이름만 바뀐 경우 교체)
+        검색 스레드가 잠금 없이 읽으므로 정렬 배열과 역색인 목록은 제자리에서 바꾸지 않고,
+        키를 끼워 넣은 새 목록을 만들어 참조를 교체합니다. (항목 정보는 번호를 공개하기 전에 추가)
+        """
+        name = item.get("item_name")
+        if not name:
+            return
+        forms = (normalize(name), normalize(item.get("item_name_EN")))
+        with self._write_lock:
+            if name in self._index_of:
+                if self._forms[self._index_of[name]] == forms:
+                    return
+                self._remove(name)
+
+            idx = len(self.names)
+            self.names.append(name)
+            self._forms.append(forms)
+            self._chosung.append(to_chosung(forms[0]))
+            entry_keys, grams = self._entry(idx)
+            for gram in grams:
+                self._postings[gram] = self._postings.get(gram, []) + [idx]
+            keys = list(self._keys)
+            for key in entry_keys:
+                insort(keys, key)
+            self._keys = keys
+            self._index_of[name] = idx
+
+    def remove(self, name: str):
+        with self._write_lock:
+            self._remove(name)
+
+    def _remove(self, name: str):
+        idx = self._index_of.pop(name, None)
+        if idx is not None:
+            self._removed = self._removed | {idx}
+
+    def _prefix_candidates(self, query: str, removed: frozenset) -> list:
+        prefix = to_jamo(query)
+        keys = self._keys
+        found = []
+        seen = set()
+        position = bisect_left(keys, (prefix,))
+        while position < len(keys) and len(found) < PREFIX_CANDIDATES:
+            key, idx = keys[position]
+            if not key.startswith(prefix):
+                break
+            if idx not in seen and idx not in removed:
+                seen.add(idx)
+                found.append(idx)
+            position += 1
+        return found
+
+    def _ngram_candidates(self, query: str, removed: frozenset) -> list:
+        grams = _grams(query, 2) or _grams(query, 1)
+        if not grams:
+            return []
+        if len(grams) == 1:
+            posting = self._postings.get(next(iter(grams)), [])
+            return [idx for idx in posting[:NGRAM_CANDIDATES + len(removed)] if idx not in removed]
+        # 드문 2-gram부터 최대 NGRAM_SCAN_GRAMS개만, 각 목록은 앞쪽(짧은 이름) NGRAM_SCAN_POSTINGS개만 셉니다.
+        # (흔한 단어가 들어간 질의도 비용이 목록 크기와 관계없이 일정)
+        postings = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+        counts = Counter()
+        for posting in postings[:NGRAM_SCAN_GRAMS]:
+            counts.update(posting[:NGRAM_SCAN_POSTINGS])
+        # 센 2-gram의 절반 이상이 겹치는 항목만 후보로 사용합니다.
+        min_overlap = max(1, min(len(grams), NGRAM_SCAN_GRAMS) // 2)
+        ranked = sorted(
+            (idx for idx, count in counts.items() if count >= min_overlap and idx not in removed),
+            key=lambda idx: (-counts[idx], idx),
+        )
+        return ranked[:NGRAM_CANDIDATES]
+
+    def search(self, query: str, limit: int = 5) -> list:
+        """질의와 가장 비슷한 이름(한글 item_name)을 최대 limit개 반환합니다."""
+        query = normalize(query)
+        if not query or not self._index_of:
+            return []
+
+        removed = self._removed
+        prefix_hits = set(self._prefix_candidates(query, removed))
+        candidates = prefix_hits | set(self._ngram_candidates(query, removed))
+        chosung_query = is_chosung_query(query)
+
+        scored = []
+        for idx in candidates:
+            ko, en = self._forms[idx]
+            if chosung_query:
+                score = fuzz.WRatio(query, self._chosung[idx])
+            else:
+                score = max(fuzz.WRatio(query, ko), fuzz.WRatio(query, en) if en else 0)
+            if idx in prefix_hits or score >= SCORE_CUTOFF:
+                scored.append((idx not in prefix_hits, -score, idx))
+        scored.sort()
+        return [self.names[idx] for _, _, idx in scored[:limit]]
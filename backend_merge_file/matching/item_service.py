@@ -1,13 +1,31 @@
-from app.models.item_model import ItemModel
+import os
+import threading
+import time
+from config import Config
+from app.db.database import get_engine, fetch_catalog_version, fetch_catalog_changes
+from app.db.redis_client import get_redis
+from app.models.item_model import ItemModel, add_items_changed_listener
+from app.matching.autocomplete import AutocompleteIndex
+from app.matching.regulation_table import regulation_table
+from app.cache.items_snapshot import items_snapshot
 from rapidfuzz import process, fuzz
 
+# 다른 워커에 items 변경을 알리는 Redis 채널 (메시지 내용은 사용하지 않고 DB 버전으로 변경분을 읽음)
+CHANGES_CHANNEL = "items:catalog:changes"
+
+
 class ItemsService:
     def __init__(self):
         # __init__에서는 캐시를 비어있는 상태로 초기화만 합니다.
         # 실제 데이터 로딩은 init_app에서 수행됩니다.
-        self._cached_items = []
+        self._items_by_id = {}
         self.item_names = []
         self._name_to_id_map = {}
+        self._autocomplete = AutocompleteIndex()
+        self._version = None  # 캐시에 반영된 규정 목록 버전 (items_catalog_version)
+        self._lock = threading.RLock()  # 캐시 갱신 직렬화 (읽기는 잠그지 않음)
+        self._listener_pid = None
+        self.initialized = False
 
     def init_app(self, app):
         """
@@ -15,34 +33,178 @@ class ItemsService:
         이 메서드는 create_app 팩토리 함수에서 호출되어야 합니다.
         """
         with app.app_context():
-            self._cached_items = self._load_items_for_matching()
-            self.item_names = [item['item_name'] for item in self._cached_items]
-            self._name_to_id_map = {item['item_name']: item['id'] for item in self._cached_items}
+            self.reload()
+            self.initialized = True
             print("✅ Item service cache initialized successfully.")
+        self._ensure_listener()
 
     def _load_items_for_matching(self):
-        """매칭용 아이템 데이터를 불러옵니다."""
-        return ItemModel.get_all_for_caching()
-    
+        """매칭용 아이템 데이터와 그 시점의 규정 목록 버전을 불러옵니다."""
+        with get_engine().connect() as conn, conn.begin():
+            changes = fetch_catalog_changes(conn)
+        return changes["version"], changes["rows"]
+
+    def reload(self):
+        """전체 목록을 다시 읽어 캐시를 새로 만듭니다."""
+        version, rows = self._load_items_for_matching()
+        items = [{'id': row['id'], 'item_name': row['item_name'], 'item_name_EN': row['item_name_EN']} for row in rows]
+        with self._lock:
+            self._items_by_id = {item['id']: item for item in items}
+            self.item_names = [item['item_name'] for item in items]
+            self._name_to_id_map = {item['item_name']: item['id'] for item in items}
+            self._autocomplete = AutocompleteIndex(items)
+            self._version = version
+
+    # --- 증분 갱신 ---
+    def apply_changes(self, rows, removed_ids=()):
+        """
+        추가/수정된 행과 삭제된 id를 캐시에 반영합니다. (전체를 다시 읽지 않음)
+        같은 행을 여러 번 반영해도 결과가 같습니다.
+        """
+        with self._lock:
+            for row in rows:
+                item = {'id': row['id'], 'item_name': row['item_name'], 'item_name_EN': row.get('item_name_EN')}
+                previous = self._items_by_id.get(item['id'])
+                if previous and previous['item_name'] != item['item_name']:
+                    self._forget(previous)
+                self._items_by_id[item['id']] = item
+                if item['item_name'] not in self._name_to_id_map:
+                    self.item_names.append(item['item_name'])
+                self._name_to_id_map[item['item_name']] = item['id']
+                self._autocomplete.add(item)
+            for item_id in removed_ids:
+                previous = self._items_by_id.pop(item_id, None)
+                if previous:
+                    self._forget(previous)
+
+    def _forget(self, item):
+        name = item['item_name']
+        if self._name_to_id_map.get(name) != item['id']:
+            return
+        del self._name_to_id_map[name]
+        # 다른 스레드가 순회 중일 수 있으므로 목록은 새로 만들어 교체합니다.
+        self.item_names = [other for other in self.item_names if other != name]
+        self._autocomplete.remove(name)
+
+    def sync(self):
+        """
+        DB 규정 목록 버전이 캐시보다 새로우면 그 이후 변경분만 읽어 반영합니다. 반영한 행 수를 반환합니다.
+        버전 관리 전(v0006 마이그레이션 전)에는 전체를 다시 읽고 바뀐 항목 수를 반환합니다.
+        """
+        if not self.initialized:
+            return 0
+        with self._lock:
+            with get_engine().connect() as conn, conn.begin():
+                version = fetch_catalog_version(conn)
+                if version is not None and version == self._version:
+                    return 0
+                if version is not None and self._version is not None:
+                    changes = fetch_catalog_changes(conn, since_version=self._version)
+                else:
+                    changes = None
+            if changes is None:
+                return self._reload_and_count()
+            self.apply_changes(changes['rows'], changes['removed'])
+            self._version = changes['version']
+        count = len(changes['rows']) + len(changes['removed'])
+        print(f"[ITEM SERVICE] Synced to version {self._version} ({count} changes)")
+        return count
+
+    def _reload_and_count(self):
+        previous = self._items_by_id
+        self.reload()
+        current = self._items_by_id
+        count = sum(1 for item_id in previous.keys() | current.keys() if previous.get(item_id) != current.get(item_id))
+        if count:
+            print(f"[ITEM SERVICE] Reloaded all items ({count} changes)")
+        return count
+
+    def _on_items_changed(self, change, new_items):
+        """이 프로세스에서 items 변경이 커밋되면 바로 반영하고 다른 워커에 알립니다."""
+        if not self.initialized:
+            return
+        # 새 행은 DB를 다시 읽지 않고 바로 넣습니다. (같은 요청 안의 다음 조회부터 매칭됨)
+        self.apply_changes(new_items)
+        if change == 'updated':
+            self.sync()
+        self._publish_change()
+
+    def _publish_change(self):
+        if not Config.ITEMS_CACHE_SYNC_ENABLED:
+            return
+        try:
+            get_redis().publish(CHANGES_CHANNEL, "changed")
+        except Exception as e:
+            # 알림이 실패해도 다른 워커는 주기적인 버전 확인으로 따라잡습니다.
+            print(f"[ITEM SERVICE] Failed to publish items change: {e}")
+
+    # --- 다른 워커의 변경 수신 ---
+    def _ensure_listener(self):
+        """
+        현재 프로세스에서 변경 수신 스레드를 시작합니다.
+        fork 전에 init_app이 실행되는 경우(gunicorn --preload)를 위해 조회 시에도 프로세스 id를 확인합니다.
+        """
+        if not Config.ITEMS_CACHE_SYNC_ENABLED or not self.initialized or self._listener_pid == os.getpid():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            threading.Thread(target=self._listen, name="items-cache-sync", daemon=True).start()
+
+    def _listen(self):
+        """
+        변경 알림을 받으면 바로, 알림이 없어도 ITEMS_CACHE_CHECK_INTERVAL마다 DB 버전을 확인합니다.
+        변경분이 있으면 규정 조회 테이블과 /api/items/all 스냅샷도 갱신합니다.
+        """
+        last_check = time.monotonic()
+        pubsub = None
+        while True:
+            try:
+                if pubsub is None:
+                    pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+                    pubsub.subscribe(CHANGES_CHANNEL)
+                message = pubsub.get_message(timeout=1.0)
+            except Exception as e:
+                print(f"[ITEM SERVICE] Items change subscription failed: {e}")
+                pubsub = None
+                message = None
+                time.sleep(1.0)
+
+            if message is None and time.monotonic() - last_check < Config.ITEMS_CACHE_CHECK_INTERVAL:
+                continue
+            last_check = time.monotonic()
+            try:
+                if self.sync():
+                    self._refresh_process_caches()
+            except Exception as e:
+                print(f"[ITEM SERVICE] Items cache sync failed: {e}")
+
+    def _refresh_process_caches(self):
+        """
+        다른 워커에서 커밋된 items 변경을 이 프로세스의 나머지 캐시에도 반영합니다.
+        (커밋한 프로세스에서는 item_model의 after_commit 훅이 같은 일을 합니다.
+         Redis에 있는 이미지별 상세 결과 캐시는 커밋한 프로세스가 이미 비웠습니다.)
+        """
+        regulation_table.refresh()
+        items_snapshot.mark_stale()
+
     def get_all_items_details(self):
         """프론트엔드 초기화를 위해 모든 아이템의 상세 정보를 DB에서 직접 조회합니다."""
         # 이 데이터는 크기가 클 수 있으므로, 요청 시에만 DB에서 가져옵니다.
         return ItemModel.get_all_details()
-    
-    def get_autocomplete_suggestions(self, query, limit=5):
-          if not query:
-              return []
 
-          # WRatio 스코어 75점 이상인 항목만 반환하도록 score_cutoff 값을 상향 조정합니다.
-          # limit은 여전히 5로 유지하여, 최대 5개의 가장 유사한 항목만 가져옵니다.
-          results = process.extract(query, self.item_names, scorer=fuzz.WRatio, limit=limit,
-  score_cutoff=75)
+    def get_autocomplete_suggestions(self, query, limit=5):
+        """
+        자동완성 후보를 반환합니다. 전체 이름을 선형으로 비교하지 않고,
+        init_app에서 만든 인덱스(접두어/초성/2-gram)로 후보를 좁힌 뒤 WRatio로 다시 정렬합니다.
+        """
+        self._ensure_listener()
+        return self._autocomplete.search(query, limit=limit)
 
-          # 결과는 (찾은문자열, 점수, 인덱스) 튜플의 리스트이므로, 문자열만 추출합니다.
-          return [result[0] for result in results]
-    
     def find_best_match(self, query):
         # 가장 유사한 항목 1개를 찾습니다.
+        self._ensure_listener()
         result = process.extractOne(query, self.item_names, scorer=fuzz.WRatio, score_cutoff=30)
         if result:
             match_name, score, _ = result # score는 0-100 스케일
@@ -54,6 +216,7 @@ class ItemsService:
                 "id": item_id
             }
         return None
-    
+
 # 싱글톤 인스턴스
 item_service = ItemsService()
+add_items_changed_listener(item_service._on_items_changed)
@@ -0,0 +1,119 @@
+# app/matching/regulation_table.py
+"""
+YOLO 클래스 id → 규정 정보(한글 이름, 기내/위탁 허용 여부, 비고) 조회 테이블입니다.
+
+- YOLO 클래스 집합은 모델의 names로 고정되므로, 모델 로드 시점에 클래스마다
+  map_yolo_name()과 items 테이블 조회를 한 번씩 미리 수행해 클래스 id로 인덱싱된 리스트에 저장합니다.
+  탐지 결과의 규정 정보 조회는 DB 호출 없이 리스트 인덱싱 한 번으로 끝납니다.
+- ItemModel 행이 바뀌면(예: add_item_from_api) refresh()로 같은 클래스 집합에 대해 다시 만듭니다.
+- 테이블은 통째로 교체되므로 조회 중인 요청은 잠금 없이 이전/새 테이블 중 하나를 일관되게 봅니다.
+- 테이블이 아직 없거나 클래스 id와 이름이 맞지 않으면(모델 교체 직후 등) lookup()은 None을 반환하고,
+  호출하는 쪽은 기존 방식(fetch_item_info)으로 조회합니다.
+"""
+import threading
+import time
+from app.db.database import fetch_items_by_english_names
+from app.matching.matcher import map_yolo_name
+
+# 클래스 이름 조회 함수(추론 데몬)로 테이블을 다시 만드는 최소 간격(초)
+SOURCE_RETRY_INTERVAL = 30
+
+
+class RegulationEntry:
+    """클래스 하나의 조회 결과. info는 items 행(dict)이며 DB에 규정이 없으면 None입니다."""
+    __slots__ = ("yolo_name", "item_name_en", "info")
+
+    def __init__(self, yolo_name: str, item_name_en: str, info):
+        self.yolo_name = yolo_name
+        self.item_name_en = item_name_en
+        self.info = info
+
+
+def _normalize_names(class_names) -> dict:
+    """ultralytics names(dict 또는 list)를 {클래스 id: 이름}으로 변환합니다."""
+    if isinstance(class_names, dict):
+        return {int(cls_id): name for cls_id, name in class_names.items()}
+    return dict(enumerate(class_names))
+
+
+class RegulationTable:
+    def __init__(self):
+        self._entries = ()
+        self._class_names = None
+        self._class_names_source = None
+        self._source_retry_at = 0.0
+        self._build_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._entries)
+
+    def set_class_names_source(self, source):
+        """
+        모델이 이 프로세스에 없을 때(추론 데몬 모드) 클래스 이름을 얻는 함수를 지정합니다.
+        테이블이 없거나 클래스 이름이 맞지 않으면(데몬의 모델 교체) lookup()에서 이 함수로
+        클래스 이름을 받아 테이블을 다시 만듭니다. (SOURCE_RETRY_INTERVAL마다 최대 한 번)
+        """
+        self._class_names_source = source
+
+    def build(self, class_names):
+        """클래스 이름 집합으로 테이블을 만듭니다. 실패하면 기존 테이블을 유지합니다."""
+        names = _normalize_names(class_names)
+        with self._build_lock:
+            try:
+                item_names_en = {cls_id: map_yolo_name(name) for cls_id, name in names.items()}
+                items = fetch_items_by_english_names(item_names_en.values())
+            except Exception as e:
+                print(f"[REGULATION TABLE] Failed to build table: {e}")
+                return False
+
+            entries = [None] * (max(names) + 1 if names else 0)
+            for cls_id, name in names.items():
+                item_name_en = item_names_en[cls_id]
+                entries[cls_id] = RegulationEntry(name, item_name_en, items.get(item_name_en.lower()))
+
+            self._entries = tuple(entries)
+            self._class_names = names
+        missing = sum(1 for entry in entries if entry is not None and entry.info is None)
+        print(f"[REGULATION TABLE] Built for {len(names)} classes ({missing} without regulation info)")
+        return True
+
+    def refresh(self):
+        """items 테이블이 바뀐 뒤 같은 클래스 집합으로 테이블을 다시 만듭니다."""
+        if self._class_names is not None:
+            self.build(self._class_names)
+
+    def lookup(self, class_id, yolo_name: str):
+        """
+        클래스 id의 RegulationEntry를 반환합니다.
+        테이블이 없거나 id와 이름이 맞지 않으면 None을 반환합니다.
+        """
+        entry = self._find(class_id, yolo_name)
+        if entry is None and self._class_names_source is not None and self._build_from_source():
+            entry = self._find(class_id, yolo_name)
+        return entry
+
+    def _find(self, class_id, yolo_name: str):
+        entries = self._entries
+        if class_id is None or not 0 <= class_id < len(entries):
+            return None
+        entry = entries[class_id]
+        if entry is None or entry.yolo_name != yolo_name:
+            return None
+        return entry
+
+    def _build_from_source(self) -> bool:
+        now = time.monotonic()
+        if now < self._source_retry_at:
+            return False
+        self._source_retry_at = now + SOURCE_RETRY_INTERVAL
+        try:
+            class_names = self._class_names_source()
+        except Exception as e:
+            print(f"[REGULATION TABLE] Failed to read class names: {e}")
+            return False
+        return bool(class_names) and self.build(class_names)
+
+
+# 싱글톤 인스턴스
+regulation_table = RegulationTable()
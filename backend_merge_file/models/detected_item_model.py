@@ -1,4 +1,4 @@
-from app.db.database import db
+from app.db.database import db, insert_detected_items
 from app.models.item_model import ItemModel
 
 class DetectedItemModel(db.Model):
@@ -8,6 +8,7 @@ class DetectedItemModel(db.Model):
     __tablename__ = 'detected_items'
 
     item_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    # 인덱스는 마이그레이션(v0003, v0004)과 mysql 스키마 파일이 관리합니다. (ORM에서 중복 선언하지 않음)
     image_id = db.Column(db.Integer, nullable=False)
     item_name_EN = db.Column(db.String(255), nullable=True)
     item_name = db.Column(db.String(255), nullable=False)
@@ -17,6 +18,10 @@ class DetectedItemModel(db.Model):
     bbox_y_max = db.Column(db.Float, nullable=False)
     # packing_info는 현재 스키마에 따라 문자열로 처리, 필요시 Enum으로 변경 가능
     packing_info = db.Column(db.String(50), default='none')
+    # 탐지에 사용된 모델 버전 (예: 'sku:v1,yolo:v2'), 사용자가 직접 추가한 항목은 NULL
+    model_version = db.Column(db.String(128), nullable=True)
+    # 규정 정보 행(items.id). 상세 조회는 문자열 이름 대신 이 정수 키로 조인합니다.
+    regulation_item_id = db.Column(db.Integer, db.ForeignKey('items.id', ondelete='SET NULL'), nullable=True)
 
     @classmethod
     def add_item(cls, image_id, item_name, bbox, item_name_EN=None, packing_info='none'):
@@ -38,6 +43,18 @@ class DetectedItemModel(db.Model):
         db.session.commit()
         return new_item
 
+    @classmethod
+    def add_items(cls, rows):
+        """
+        여러 탐지 아이템을 한 번의 multi-row INSERT로 추가하고, 할당된 item_id 목록을 순서대로 반환합니다.
+        rows: app.db.database.detected_item_row()로 만든 행 목록
+        세션의 트랜잭션 안에서 실행되며, 커밋은 호출하는 쪽에서 요청당 한 번 수행합니다.
+        """
+        for row in rows:
+            if not all([row.get("image_id"), row.get("item_name"), row.get("bbox_x_min") is not None]):
+                raise ValueError("필수 인자(image_id, item_name, bbox)가 누락되었거나 형식이 잘못되었습니다.")
+        return insert_detected_items(db.session.connection(), rows)
+
     def to_dict(self):
         """객체 데이터를 딕셔너리로 변환합니다."""
         return {
@@ -53,13 +70,19 @@ class DetectedItemModel(db.Model):
         return f"<DetectedItemModel {self.item_id}: {self.item_name}>"
 
     @classmethod
-    def delete_items(cls, item_ids):
-        """ID 목록을 받아 여러 탐지 아이템을 삭제합니다."""
+    def delete_items(cls, item_ids, image_id=None):
+        """
+        ID 목록을 받아 여러 탐지 아이템을 삭제합니다.
+        image_id를 지정하면 그 이미지의 아이템만 삭제합니다. (다른 이미지의 캐시된 결과가 바뀌지 않도록)
+        """
         if not item_ids:
             return 0
         
         try:
-            num_deleted = cls.query.filter(cls.item_id.in_(item_ids)).delete(synchronize_session='fetch')
+            query = cls.query.filter(cls.item_id.in_(item_ids))
+            if image_id is not None:
+                query = query.filter(cls.image_id == image_id)
+            num_deleted = query.delete(synchronize_session='fetch')
             db.session.commit()
             return num_deleted
         except Exception as e:
@@ -77,7 +100,7 @@ class DetectedItemModel(db.Model):
         results = db.session.query(
             cls, ItemModel
         ).outerjoin(
-            ItemModel, cls.item_name == ItemModel.item_name
+            ItemModel, cls.regulation_item_id == ItemModel.id
         ).filter(cls.image_id == image_id).all()
 
         detailed_items = []
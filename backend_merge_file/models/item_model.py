@@ -1,4 +1,9 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from app.db.database import db
+from app.matching.regulation_table import regulation_table
+from app.cache.item_results_cache import item_results_cache
+from app.cache.items_snapshot import items_snapshot
 
 class ItemModel(db.Model):
     """
@@ -8,19 +13,21 @@ class ItemModel(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     item_name = db.Column(db.String(255), nullable=False, unique=True)
-    item_name_EN = db.Column(db.String(255))
+    item_name_EN = db.Column(db.String(255))  # UNIQUE 인덱스는 스키마 파일이 관리
     carry_on_allowed = db.Column(db.String(50))
     checked_baggage_allowed = db.Column(db.String(50))
     notes = db.Column(db.Text)
     notes_EN = db.Column(db.Text)
     source = db.Column(db.String(50))
+    # row_version(규정 목록 버전)은 v0006 마이그레이션과 DB 트리거가 관리하고 app.db.database의 SQL로만 읽습니다.
+    # 마이그레이션 전 DB에서도 이 모델의 조회가 동작하도록 매핑하지 않습니다.
 
     @classmethod
     def get_all_for_caching(cls):
-        """매칭 서비스 캐싱을 위해 id와 이름만 조회합니다."""
-        items = cls.query.with_entities(cls.id, cls.item_name).all()
+        """매칭 서비스 캐싱을 위해 id와 이름(자동완성용 영어 이름 포함)만 조회합니다."""
+        items = cls.query.with_entities(cls.id, cls.item_name, cls.item_name_EN).all()
         # SQLAlchemy Core Row 객체를 dict로 변환
-        return [{'id': item.id, 'item_name': item.item_name} for item in items]
+        return [{'id': item.id, 'item_name': item.item_name, 'item_name_EN': item.item_name_EN} for item in items]
 
     @classmethod
     def get_all_details(cls):
@@ -43,8 +50,11 @@ class ItemModel(db.Model):
         return cls.query.filter_by(item_name=item_name).first()
 
     @classmethod
-    def add_item_from_api(cls, item_data):
-        """API (Gemini)로부터 받은 데이터를 기반으로 새 아이템을 추가합니다."""
+    def add_item_from_api(cls, item_data, commit=True):
+        """
+        API (Gemini)로부터 받은 데이터를 기반으로 새 아이템을 추가합니다.
+        commit=False면 flush만 하여 id를 할당하고, 커밋은 호출하는 쪽에서 수행합니다.
+        """
         # 허용된 값 목록
         allowed_carry_on = ["예", "아니요", "예 (특별 지침)", "예 (3.4oz/100 ml 이상 또는 동일)"]
         allowed_checked = ["예", "아니요", "예 (특별 지침)"]
@@ -69,7 +79,10 @@ class ItemModel(db.Model):
             source='API' # Gemini API를 통해 추가된 항목임을 명시
         )
         db.session.add(new_item)
-        db.session.commit()
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
         return new_item
 
     def to_dict(self):
@@ -88,4 +101,62 @@ class ItemModel(db.Model):
     @classmethod
     def get_by_id(cls, item_id):
         """ID로 특정 아이템의 상세 정보를 조회합니다."""
-        return cls.query.get(item_id)
\ No newline at end of file
+        return cls.query.get(item_id)
+
+
+# --- 규정 조회 테이블 갱신 ---
+# ItemModel 행이 추가/수정/삭제된 트랜잭션이 커밋되면 클래스 id → 규정 정보 테이블과 /api/items/all 스냅샷을
+# 다시 만들고, 규정 정보가 포함된 이미지별 상세 결과 캐시를 비웁니다.
+# 그 밖의 캐시(ItemsService 등)는 add_items_changed_listener로 등록해 같은 시점에 알림을 받습니다.
+# 다른 워커 프로세스는 ItemsService의 변경 수신 스레드가 규정 조회 테이블과 스냅샷을 갱신합니다.
+_items_changed_listeners = []
+
+
+def add_items_changed_listener(callback):
+    """
+    items 변경이 커밋될 때 callback(change, new_items)를 호출합니다.
+    change: 'added'(새 행만 추가) 또는 'updated'(수정/삭제 포함)
+    new_items: 이 트랜잭션에서 추가된 행 [{"id", "item_name", "item_name_EN"}]
+    """
+    _items_changed_listeners.append(callback)
+
+
+@event.listens_for(Session, "before_flush")
+def _track_item_changes(session, flush_context, instances):
+    if any(isinstance(obj, ItemModel) for obj in (*session.dirty, *session.deleted)):
+        session.info["items_changed"] = "updated"
+    elif any(isinstance(obj, ItemModel) for obj in session.new):
+        session.info.setdefault("items_changed", "added")
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_items(session, flush_context):
+    # flush 직후에는 id가 할당되어 있고 session.new에 아직 남아 있습니다. (커밋 후에는 속성이 만료됨)
+    session.info.setdefault("new_items", []).extend(
+        {"id": obj.id, "item_name": obj.item_name, "item_name_EN": obj.item_name_EN}
+        for obj in session.new if isinstance(obj, ItemModel)
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_regulation_table(session):
+    change = session.info.pop("items_changed", None)
+    new_items = session.info.pop("new_items", [])
+    if change:
+        regulation_table.refresh()
+        items_snapshot.mark_stale()
+    # 새 행만 추가된 경우에는 기존 결과가 참조하는 규정 정보가 바뀌지 않습니다.
+    if change == "updated":
+        item_results_cache.clear()
+    if change:
+        for listener in _items_changed_listeners:
+            try:
+                listener(change, new_items)
+            except Exception as e:
+                print(f"[ITEM MODEL] items change listener failed: {e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_item_changes(session):
+    session.info.pop("items_changed", None)
+    session.info.pop("new_items", None)
@@ -0,0 +1,271 @@
+# app/monitoring/metrics.py
+"""
+프로세스 내 지표(카운터, 히스토그램)와 Prometheus 텍스트 형식 출력입니다.
+
+- /classify 파이프라인 단계별 소요 시간은 timed(stage)로 측정합니다.
+  Config.METRICS_ENABLED가 꺼져 있고 Server-Timing 수집 중도 아니면 아무 일도 하지 않는
+  컨텍스트를 반환하므로 측정 비용이 거의 없습니다.
+- collect_timings() 블록 안에서 측정된 단계는 요청별로 합산되어 Server-Timing 헤더로 내보낼 수 있습니다.
+- 지표는 프로세스 단위입니다. (gunicorn 워커가 여러 개면 각 워커가 자신의 값을 보고합니다.)
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from config import Config
+
+# 등록된 지표 (렌더링 순서 유지)
+_metrics = []
+
+# 단계별 소요 시간 히스토그램 버킷 (초)
+STAGE_SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# 현재 요청의 단계별 소요 시간 {stage: [합계 초, 횟수]} (Server-Timing용)
+_request_timings = ContextVar("request_timings", default=None)
+
+_NULL_TIMER = nullcontext()
+
+
+def _format_labels(labelnames, values, extra=None) -> str:
+    pairs = list(zip(labelnames, values)) + (extra or [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+def _format_value(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    metric_type = None
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        _metrics.append(self)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        with self._lock:
+            lines.extend(self._samples())
+        return lines
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in self._values.items()]
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램. 버킷별 개수는 상한(le) 이하인 관측값 수입니다."""
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            series["counts"][bisect_left(self.buckets, value)] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def snapshot(self, **labels) -> dict:
+        """JSON 보고용 (버킷별 개수, 관측 수, 평균)"""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            counts = series["counts"] if series else [0] * (len(self.buckets) + 1)
+            count = series["count"] if series else 0
+            total = series["sum"] if series else 0.0
+        labels_out = [f"le_{bound}" for bound in self.buckets] + ["inf"]
+        return {
+            "buckets": dict(zip(labels_out, counts)),
+            "count": count,
+            "mean": total / count if count else None,
+        }
+
+    def _samples(self):
+        lines = []
+        for key, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series["counts"]):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [("le", bound)])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series['sum'])}")
+            lines.append(f"{self.name}_count{labels} {series['count']}")
+        return lines
+
+
+class _CollectedMetric(_Metric):
+    """렌더링 시점에 collect()를 호출해 값을 읽는 지표 (다른 모듈이 이미 집계하는 값을 노출할 때 사용)"""
+
+    def __init__(self, name: str, documentation: str, metric_type: str, collect):
+        super().__init__(name, documentation)
+        self.metric_type = metric_type
+        self.collect = collect
+
+    def _samples(self):
+        value = self.collect()
+        return [] if value is None else [f"{self.name} {_format_value(value)}"]
+
+
+def register_collected(name: str, documentation: str, metric_type: str, collect):
+    """collect()가 반환하는 현재 값을 gauge/counter로 노출합니다. (None이면 생략)"""
+    return _CollectedMetric(name, documentation, metric_type, collect)
+
+
+def render_prometheus() -> str:
+    """등록된 모든 지표를 Prometheus 텍스트 형식(0.0.4)으로 출력합니다."""
+    lines = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# /classify 파이프라인 지표
+CLASSIFY_STAGE_SECONDS = Histogram(
+    "passcheckers_classify_stage_seconds",
+    "Time spent in each /classify pipeline stage.",
+    STAGE_SECONDS_BUCKETS, labelnames=("stage",),
+)
+CLASSIFY_CROPS_PER_IMAGE = Histogram(
+    "passcheckers_classify_crops_per_image",
+    "Number of SKU boxes sent to crop classification per image.",
+    (0, 1, 2, 5, 10, 20, 40, 80),
+)
+CLASSIFY_CROPS_TOTAL = Counter(
+    "passcheckers_classify_crops_total",
+    "Total number of crops sent to crop classification.",
+)
+RESULT_CACHE_REQUESTS = Counter(
+    "passcheckers_result_cache_requests_total",
+    "Detection result cache lookups by result.",
+    labelnames=("result",),
+)
+
+ITEM_RESULTS_CACHE_REQUESTS = Counter(
+    "passcheckers_item_results_cache_requests_total",
+    "Per-image detailed result cache lookups by result (hit, miss, coalesced, bypass).",
+    labelnames=("result",),
+)
+ITEM_RESULTS_CACHE_SECONDS = Histogram(
+    "passcheckers_item_results_cache_seconds",
+    "Time to produce per-image detailed results by cache result.",
+    STAGE_SECONDS_BUCKETS, labelnames=("result",),
+)
+
+# DB 연결 풀 지표 (app.db.database가 db_pool에 연결)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "passcheckers_db_pool_wait_seconds",
+    "Time spent waiting for a connection from the shared DB pool.",
+    (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+
+def record_db_pool_wait(seconds: float):
+    if Config.METRICS_ENABLED:
+        DB_POOL_WAIT_SECONDS.observe(seconds)
+
+
+class _StageTimer:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        if Config.METRICS_ENABLED:
+            CLASSIFY_STAGE_SECONDS.observe(elapsed, stage=self.stage)
+        timings = _request_timings.get()
+        if timings is not None:
+            total = timings.setdefault(self.stage, [0.0, 0])
+            total[0] += elapsed
+            total[1] += 1
+        return False
+
+
+def timed(stage: str):
+    """파이프라인 단계 하나의 소요 시간을 측정하는 컨텍스트를 반환합니다."""
+    if not Config.METRICS_ENABLED and _request_timings.get() is None:
+        return _NULL_TIMER
+    return _StageTimer(stage)
+
+
+def record_crops(count: int):
+    if Config.METRICS_ENABLED:
+        CLASSIFY_CROPS_PER_IMAGE.observe(count)
+        CLASSIFY_CROPS_TOTAL.inc(count)
+
+
+def record_cache_lookup(hit: bool):
+    if Config.METRICS_ENABLED:
+        RESULT_CACHE_REQUESTS.inc(result="hit" if hit else "miss")
+
+
+def record_item_results_lookup(result: str, seconds: float):
+    if Config.METRICS_ENABLED:
+        ITEM_RESULTS_CACHE_REQUESTS.inc(result=result)
+        ITEM_RESULTS_CACHE_SECONDS.observe(seconds, result=result)
+
+
+@contextmanager
+def collect_timings():
+    """블록 안에서 측정된 단계별 소요 시간을 모읍니다. {stage: [합계 초, 횟수]}를 반환합니다."""
+    timings = {}
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def format_server_timing(timings: dict) -> str:
+    """단계별 소요 시간을 Server-Timing 헤더 값으로 변환합니다. (여러 번 실행된 단계는 합계와 횟수)"""
+    entries = []
+    for stage, (total, count) in timings.items():
+        entry = f"{stage};dur={total * 1000:.1f}"
+        if count > 1:
+            entry += f';desc="x{count}"'
+        entries.append(entry)
+    return ", ".join(entries)
+
+
+def _after_fork():
+    # 다른 스레드가 잡고 있던 잠금이 자식 프로세스에 남지 않도록 새로 만듭니다.
+    for metric in _metrics:
+        metric._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,109 @@
+# app/routes/admin.py
+import hmac
+import os
+from functools import wraps
+from flask import Blueprint, request, jsonify
+from config import Config
+from app.inference.model_versions import MODEL_NAMES, list_versions, get_model_versions, set_active_version
+
+admin_bp = Blueprint('admin_bp', __name__, url_prefix='/api/admin')
+
+
+def admin_required(func):
+    """X-Admin-Token 헤더가 Config.ADMIN_TOKEN과 일치해야 호출할 수 있습니다."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not Config.ADMIN_TOKEN:
+            return jsonify({"error": "관리자 API가 비활성화되어 있습니다."}), 403
+        # 비교 시간으로 토큰을 추측할 수 없도록 상수 시간 비교를 사용합니다. (비ASCII 헤더도 처리하도록 bytes로 비교)
+        if not hmac.compare_digest(request.headers.get('X-Admin-Token', '').encode(), Config.ADMIN_TOKEN.encode()):
+            return jsonify({"error": "관리자 인증에 실패했습니다."}), 401
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _loaded_models():
+    # 추론 데몬 모드에서는 이 프로세스에 모델이 없으므로 registry를 로드하지 않습니다.
+    if Config.INFERENCE_DAEMON_SOCKET:
+        return None
+    from app.inference.registry import model_registry
+    return model_registry
+
+
+@admin_bp.route('/models', methods=['GET'])
+@admin_required
+def get_models():
+    """배포 가능한 모델 버전, 활성 버전, 이 프로세스에 로드된 버전을 반환합니다."""
+    registry = _loaded_models()
+    return jsonify({
+        "active": get_model_versions(),
+        "available": {name: list_versions(name) for name in MODEL_NAMES},
+        "loaded": registry.status() if registry else None
+    })
+
+
+@admin_bp.route('/batching', methods=['GET'])
+@admin_required
+def get_batching_stats():
+    """
+    마이크로 배치 스케줄러의 배치 크기 / 대기 시간 히스토그램을 반환합니다.
+    추론 데몬 모드에서는 응답한 데몬 워커 한 프로세스의 통계입니다.
+    """
+    try:
+        if Config.INFERENCE_DAEMON_SOCKET:
+            from app.inference.client import get_daemon_status
+            status = get_daemon_status() or {}
+            return jsonify({"pid": status.get("pid"), **(status.get("batching") or {})})
+
+        import app.sku.detect  # noqa: F401  (배치 스케줄러 등록)
+        import app.yolo.detect  # noqa: F401
+        from app.inference.batcher import batching_stats
+        return jsonify(batching_stats())
+    except Exception as e:
+        print(f"[ADMIN API] Failed to read batching stats: {e}")
+        return jsonify({"error": "배치 통계를 조회할 수 없습니다."}), 503
+
+
+@admin_bp.route('/db-pool', methods=['GET'])
+@admin_required
+def get_db_pool_stats():
+    """이 프로세스의 공유 DB 연결 풀 상태 (사용 중 / 유휴 / 오버플로 연결 수, 체크아웃 횟수, 대기 시간)"""
+    import db_pool
+    return jsonify({"pid": os.getpid(), **db_pool.pool_stats()})
+
+
+@admin_bp.route('/models/reload', methods=['POST'])
+@admin_required
+def reload_models():
+    """
+    모델 가중치를 교체합니다.
+    요청 본문: {"model": "sku" | "yolo", "version": "<버전>"} (생략 시 ACTIVE 파일 기준으로 다시 로드)
+    버전을 지정하면 ACTIVE 파일을 갱신하므로, 다른 워커/데몬 프로세스도 파일 감시로 같은 버전으로 교체됩니다.
+    """
+    data = request.get_json(silent=True) or {}
+    name = data.get('model')
+    version = data.get('version')
+
+    if name is not None and name not in MODEL_NAMES:
+        return jsonify({"error": f"알 수 없는 모델입니다: {name}"}), 400
+    if version and not name:
+        return jsonify({"error": "version을 지정하려면 model이 필요합니다."}), 400
+
+    try:
+        if version:
+            set_active_version(name, version)
+
+        registry = _loaded_models()
+        if registry:
+            for model_name in ([name] if name else MODEL_NAMES):
+                registry.load(model_name)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception as e:
+        print(f"[ADMIN API] Model reload failed: {e}")
+        return jsonify({"error": "모델 교체에 실패했습니다."}), 500
+
+    return jsonify({
+        "active": get_model_versions(),
+        "loaded": registry.status() if registry else None
+    }), 200
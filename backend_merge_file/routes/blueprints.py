@@ -0,0 +1,34 @@
+# app/routes/blueprints.py
+"""
+이 패키지의 블루프린트를 Flask 앱에 등록합니다.
+새 라우트 모듈을 추가하면 BLUEPRINTS에도 추가해야 앱에 노출됩니다.
+
+앱 팩토리(create_app)에서 다음과 같이 호출합니다.
+    db.init_app(app)
+    register_blueprints(app)
+    item_service.init_app(app)
+
+팩토리가 이미 직접 등록한 블루프린트(classify, items 등)는 건너뛰므로 기존 등록 코드와 함께 사용할 수 있습니다.
+"""
+from app.routes.classify import classify_bp
+from app.routes.items import items_bp
+from app.routes.admin import admin_bp
+from app.routes.metrics import metrics_bp
+from app.routes.images import images_bp
+from app.routes.health import health_bp
+
+BLUEPRINTS = [
+    classify_bp,
+    items_bp,
+    admin_bp,  # /api/admin (Config.ADMIN_TOKEN이 없으면 403)
+    metrics_bp,  # /metrics (Prometheus, Config.METRICS_ENABLED)
+    images_bp,  # /api/images (원본/파생 이미지)
+    health_bp,  # /api/health (liveness/readiness)
+]
+
+
+def register_blueprints(app):
+    """BLUEPRINTS 중 아직 등록되지 않은 블루프린트를 등록합니다."""
+    for blueprint in BLUEPRINTS:
+        if blueprint.name not in app.blueprints:
+            app.register_blueprint(blueprint)
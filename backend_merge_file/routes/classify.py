@@ -1,86 +1,505 @@
 # app/routes/classify.py
-from flask import Blueprint, request, jsonify
-from app.sku.detect import predict_bbox_with_sku, save_cropped_images
-from app.yolo.detect import predict_name_with_yolo
-from app.db.database import get_engine, fetch_item_info, insert_image, insert_detected_item
+import json
+from contextlib import contextmanager, nullcontext
+from flask import Blueprint, Response, request, jsonify, url_for, stream_with_context
+from app.db.database import (get_engine, fetch_item_info, insert_image, insert_detected_items, detected_item_row,
+                             fetch_image_owner, fetch_detected_items_with_regulations)
 from app.matching.matcher import map_yolo_name
-from PIL import Image
-import io
+from app.matching.regulation_table import regulation_table
+from app.imaging.decoded_image import DecodedImage
+from app.jobs.classify_queue import classify_queue, STATUS_QUEUED, STATUS_FAILED
+from app.jobs.derivative_queue import enqueue_derivatives
+from app.cache.detection_cache import detection_cache, content_hash
+from app.inference.profiles import get_profile
+from app.inference.client import InferenceDaemonError
+from app.inference.outcome import track_failures
+from app.monitoring.metrics import timed, record_crops, record_cache_lookup, collect_timings, format_server_timing
+from config import Config
+
+from app.inference.model_versions import get_model_versions, format_model_version
+
+if Config.INFERENCE_DAEMON_SOCKET:
+    # 모델은 추론 데몬이 소유하고, 웹 워커는 같은 시그니처의 클라이언트로 호출합니다.
+    from app.inference.client import predict_bbox_with_sku, predict_name_with_yolo, pin_models, get_class_names
+    regulation_table.set_class_names_source(get_class_names)
+else:
+    from app.sku.detect import predict_bbox_with_sku
+    from app.yolo.detect import predict_name_with_yolo
+    from app.inference.registry import model_registry
+    pin_models = model_registry.pin
+    # YOLO 모델이 로드/교체될 때마다 클래스 id → 규정 정보 테이블을 다시 만듭니다.
+    # (로드 시점에 DB를 쓸 수 없었다면 첫 조회 때 현재 모델의 클래스 이름으로 다시 시도)
+    model_registry.add_activation_listener("yolo", lambda model: regulation_table.build(model.names))
+    regulation_table.set_class_names_source(lambda: getattr(model_registry.get("yolo"), "model", None).names)
 
 classify_bp = Blueprint("classify", __name__)
 
-def run_detection(img_bytes, conn, image_id, img_width, img_height):
+def run_detection(image, conn, image_id, img_width, img_height, profile=None):
     """
     YOLO + SKU 탐지 후 DB 저장 및 결과 조합.
     (수정됨: 이미지 크기를 인자로 받음)
+    image: 요청 단위로 한 번 디코딩된 DecodedImage (두 모델이 같은 버퍼를 공유)
+    profile: get_profile()로 얻은 추론 프로필 (None이면 서버 기본 프로필)
+    (results, complete)를 반환합니다. complete가 False면 모델 미로드나 추론 오류로
+    일부 단계가 빈 결과를 반환한 것이므로 결과 캐시에 저장하지 않습니다.
     """
-    bboxes = predict_bbox_with_sku(img_bytes)
-    yolo_predictions = predict_name_with_yolo(img_bytes, bboxes)
+    image = DecodedImage.ensure(image)
+    profile = profile or get_profile()
+
+    # 두 단계가 같은 모델 버전 조합을 사용하도록 고정하고, 그 버전을 탐지 결과와 함께 저장합니다.
+    with inference_errors_as_classify_error(), track_failures() as failures, pin_models() as versions:
+        with timed("sku"):
+            bboxes = predict_bbox_with_sku(image, imgsz=profile["sku_imgsz"])
+        record_crops(len(bboxes))
+        with timed("yolo"):
+            yolo_predictions = predict_name_with_yolo(image, bboxes, crop_imgsz=profile["crop_imgsz"])
+    model_version = format_model_version(versions)
+
+    results = [enrich_prediction(p, img_width, img_height) for p in yolo_predictions]
+    save_detected_items(conn, image_id, yolo_predictions, results, model_version)
+    return results, not failures
 
-    enriched_results = []
 
-    for p in yolo_predictions:
+def normalize_bbox(bbox, img_width, img_height):
+    """원본 픽셀 좌표 박스를 0~1 정규화 좌표로 변환합니다."""
+    x_min, y_min, x_max, y_max = bbox
+    return [
+        x_min / img_width,
+        y_min / img_height,
+        x_max / img_width,
+        y_max / img_height
+    ]
+
+
+def enrich_prediction(p, img_width, img_height):
+    """분류 결과 하나에 규정 정보를 붙여 응답 항목을 반환합니다. (저장은 save_detected_items에서 한 번에)"""
+    entry = regulation_table.lookup(p.get("class_id"), p["name"])
+    if entry is not None:
+        item_name_en, db_info = entry.item_name_en, entry.info
+    else:
+        # 규정 테이블이 없거나 클래스가 맞지 않으면 DB에서 직접 조회합니다.
         item_name_en = map_yolo_name(p["name"])
-        db_info = fetch_item_info(item_name_en)
-        item_name_ko = db_info["item_name"] if db_info else item_name_en
+        with timed("fetch_item_info"):
+            db_info = fetch_item_info(item_name_en)
+    item_name_ko = db_info["item_name"] if db_info else item_name_en
+
+    return {
+        "name_ko": item_name_ko,
+        "name_en": item_name_en,
+        "bbox": normalize_bbox(p["bbox"], img_width, img_height),
+        "confidence": p["confidence"],
+        "carry_on_allowed": db_info["carry_on_allowed"] if db_info else None,
+        "checked_baggage_allowed": db_info["checked_baggage_allowed"] if db_info else None,
+        "notes": db_info["notes"] if db_info else "DB에 규정 정보 없음",
+        "regulation_item_id": db_info["id"] if db_info else None
+    }
+
+
+def save_detected_items(conn, image_id, predictions, results, model_version):
+    """
+    요청의 모든 탐지 결과를 한 번의 multi-row INSERT로 저장하고, 할당된 item_id를 응답 항목에 채웁니다.
+    predictions: 원본 픽셀 좌표가 있는 분류 결과, results: enrich_prediction()의 응답 항목 (같은 순서)
+    """
+    rows = [
+        detected_item_row(image_id, result["name_en"], result["name_ko"], p["bbox"], model_version,
+                          regulation_item_id=result.get("regulation_item_id"))
+        for p, result in zip(predictions, results)
+    ]
+    with timed("insert_detected_items"):
+        item_ids = insert_detected_items(conn, rows)
+    for result, item_id in zip(results, item_ids):
+        result["item_id"] = item_id
+    return item_ids
+
+
+class ClassifyError(Exception):
+    """업로드 처리 실패. HTTP 상태 코드를 함께 전달합니다."""
+    def __init__(self, message, status_code=500):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@contextmanager
+def inference_errors_as_classify_error():
+    """추론 데몬을 호출할 수 없으면 빈 탐지 결과로 저장하지 않고 503으로 실패시킵니다."""
+    try:
+        yield
+    except InferenceDaemonError as e:
+        print(f"[CLASSIFY] Inference daemon error: {e}")
+        raise ClassifyError("Inference service unavailable", 503) from e
+
+
+def process_upload(img_bytes, user_id="custom1", profile_name=None):
+    """
+    업로드 이미지를 저장하고 탐지/분류를 수행하여 응답 페이로드를 반환합니다.
+    동기 /classify 요청과 비동기 작업 워커가 함께 사용합니다.
+    같은 내용의 업로드가 결과 캐시에 있으면 추론 없이 저장된 결과를 반환합니다.
+    profile_name: 추론 프로필 이름 (None이면 Config.DEFAULT_INFERENCE_PROFILE)
+    """
+    profile = _resolve_profile(profile_name)
+    engine = _require_engine()
+
+    # 커밋 소요 시간도 단계별 지표에 포함하기 위해 트랜잭션을 직접 관리합니다.
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            payload = _process_upload(conn, img_bytes, user_id, profile)
+        except BaseException:
+            transaction.rollback()
+            raise
+        with timed("commit"):
+            transaction.commit()
+
+    # 캐시 적중이면 같은 내용의 원본(blob)에 대한 파생 이미지가 이미 있습니다.
+    if not payload["cached"]:
+        enqueue_derivatives(payload["image_id"])
+    return payload
+
+
+def _process_upload(conn, img_bytes, user_id, profile):
+    image_hash = content_hash(img_bytes)
+
+    cache_key = None
+    if Config.RESULT_CACHE_ENABLED:
+        # 프로필마다 결과가 달라질 수 있으므로 캐시 키에 포함합니다.
+        cache_key = detection_cache.build_key(image_hash, profile=profile["name"])
+        cached = _lookup_cached_result(conn, cache_key)
+        if cached:
+            return _reuse_cached_result(conn, cache_key, cached, img_bytes, user_id)
+
+    image = _decode_upload(img_bytes, profile)
+    img_width, img_height = image.size
+
+    # (수정됨) 이미지 저장 시 크기 정보 전달
+    with timed("insert_image"):
+        image_id = insert_image(conn, user_id=user_id, image_bytes=img_bytes, width=img_width, height=img_height)
+
+    # (수정됨) 탐지 함수에 크기 정보 전달
+    results, complete = run_detection(image, conn, image_id, img_width, img_height, profile)
+
+    payload = {
+        "message": "Detection and classification complete.",
+        "image_id": image_id,
+        "image_size": {"width": img_width, "height": img_height},
+        "profile": profile["name"],
+        "results": results,
+        "cached": False
+    }
+
+    if cache_key:
+        _store_cached_result(conn, cache_key, image_hash, image_id, payload, complete)
+    return payload
+
+
+def stream_upload(img_bytes, user_id="custom1", profile_name=None):
+    """
+    process_upload의 스트리밍 버전입니다. (event, data) 튜플을 순서대로 생성합니다.
+    - boxes: SKU 탐지 직후 모든 박스 위치 (정규화 좌표)
+    - item: 크롭 분류와 규정 정보 조회가 끝난 물품 하나
+    - done: process_upload 응답과 같은 형식의 최종 결과 (image_id, 저장된 물품의 item_id 포함)
+    크롭은 Config.CLASSIFY_STREAM_CHUNK_SIZE개씩 분류하여 첫 물품을 빨리 보냅니다.
+    클라이언트가 중간에 연결을 끊으면 트랜잭션이 롤백되어 업로드가 저장되지 않습니다.
+    """
+    profile = _resolve_profile(profile_name)
+    engine = _require_engine()
+    image_hash = content_hash(img_bytes)
+
+    with engine.begin() as conn:
+        cache_key = None
+        if Config.RESULT_CACHE_ENABLED:
+            cache_key = detection_cache.build_key(image_hash, profile=profile["name"])
+            cached = _lookup_cached_result(conn, cache_key)
+            if cached:
+                payload = _reuse_cached_result(conn, cache_key, cached, img_bytes, user_id)
+                yield "boxes", {
+                    "image_id": payload["image_id"],
+                    "image_size": payload["image_size"],
+                    "boxes": [result["bbox"] for result in payload["results"]],
+                }
+                for index, result in enumerate(payload["results"]):
+                    yield "item", {"index": index, **result}
+                yield "done", payload
+                return
+
+        image = _decode_upload(img_bytes, profile)
+        img_width, img_height = image.size
+        with timed("insert_image"):
+            image_id = insert_image(conn, user_id=user_id, image_bytes=img_bytes, width=img_width, height=img_height)
+
+        results = []
+        predictions = []
+        with inference_errors_as_classify_error(), track_failures() as failures, pin_models() as versions:
+            with timed("sku"):
+                bboxes = predict_bbox_with_sku(image, imgsz=profile["sku_imgsz"])
+            record_crops(len(bboxes))
+            yield "boxes", {
+                "image_id": image_id,
+                "image_size": {"width": img_width, "height": img_height},
+                "boxes": [normalize_bbox(bbox, img_width, img_height) for bbox in bboxes],
+            }
+
+            chunk_size = max(1, Config.CLASSIFY_STREAM_CHUNK_SIZE)
+            for start in range(0, len(bboxes), chunk_size):
+                with timed("yolo"):
+                    chunk = predict_name_with_yolo(image, bboxes[start:start + chunk_size],
+                                                   crop_imgsz=profile["crop_imgsz"])
+                for p in chunk:
+                    result = enrich_prediction(p, img_width, img_height)
+                    yield "item", {"index": len(results), **result}
+                    predictions.append(p)
+                    results.append(result)
+        # 데몬 모드에서는 호출 결과로 버전이 채워지므로 모든 분류가 끝난 뒤 읽습니다.
+        model_version = format_model_version(versions)
+        save_detected_items(conn, image_id, predictions, results, model_version)
+
+        payload = {
+            "message": "Detection and classification complete.",
+            "image_id": image_id,
+            "image_size": {"width": img_width, "height": img_height},
+            "profile": profile["name"],
+            "results": results,
+            "cached": False
+        }
+        if cache_key:
+            _store_cached_result(conn, cache_key, image_hash, image_id, payload, not failures)
+
+    enqueue_derivatives(image_id)
+    yield "done", payload
+
+
+def _resolve_profile(profile_name):
+    try:
+        return get_profile(profile_name)
+    except ValueError as e:
+        raise ClassifyError(str(e), 400)
+
+
+def _require_engine():
+    engine = get_engine()
+    if not engine:
+        raise ClassifyError("Database connection failed", 500)
+    return engine
 
-        insert_detected_item(conn, image_id, item_name_en, item_name_ko, p["bbox"])
 
-        x_min, y_min, x_max, y_max = p["bbox"]
-        normalized_bbox = [
-            x_min / img_width,
-            y_min / img_height,
-            x_max / img_width,
-            y_max / img_height
-        ]
+def _decode_upload(img_bytes, profile):
+    """
+    업로드를 한 번만 디코딩(EXIF 회전 적용)하여 크기 조회와 두 모델 추론에 재사용합니다.
+    프로필에 따라 디코딩 단계에서 미리 축소하며, 크기와 박스 좌표는 원본 기준을 유지합니다.
+    """
+    try:
+        with timed("decode"):
+            return DecodedImage.from_bytes(img_bytes, max_dim=profile["max_upload_dim"], draft=profile["jpeg_draft"])
+    except Exception as e:
+        raise ClassifyError(f"Invalid image file: {e}", 400)
 
-        enriched_results.append({
-            "name_ko": item_name_ko,
-            "name_en": item_name_en,
-            "bbox": normalized_bbox,
-            "confidence": p["confidence"],
-            "carry_on_allowed": db_info["carry_on_allowed"] if db_info else None,
-            "checked_baggage_allowed": db_info["checked_baggage_allowed"] if db_info else None,
-            "notes": db_info["notes"] if db_info else "DB에 규정 정보 없음"
-        })
 
-    return enriched_results
+def _lookup_cached_result(conn, cache_key):
+    with timed("cache_lookup"):
+        cached = detection_cache.get(conn, cache_key)
+    record_cache_lookup(cached is not None)
+    return cached
+
+
+def _store_cached_result(conn, cache_key, image_hash, image_id, payload, complete=True):
+    """
+    정상 수행된 추론 결과만 캐시합니다.
+    일시적인 실패로 비어 있는 결과가 TTL 동안 같은 사진의 응답으로 재사용되지 않도록 합니다.
+    """
+    if not complete:
+        print(f"[RESULT CACHE] Inference did not complete. Not caching result for image {image_id}.")
+        return
+    try:
+        detection_cache.put(conn, cache_key, image_hash, image_id, payload)
+    except Exception as e:
+        print(f"[RESULT CACHE] Failed to store result: {e}")
+
+
+def _reuse_cached_result(conn, cache_key, cached, img_bytes, user_id):
+    """
+    캐시 적중 시 추론 없이 응답을 구성합니다.
+    기본적으로 새 이미지 행을 만들고 캐시된 탐지 결과를 복사합니다.
+    RESULT_CACHE_LINK_IMAGE가 켜져 있으면 같은 사용자의 기존 이미지를 재사용하며,
+    응답은 그 이미지의 현재 탐지 아이템(/api/items/add, /delete 반영)으로 다시 만듭니다.
+    """
+    payload = dict(cached["payload"])
+    payload["cached"] = True
+
+    if Config.RESULT_CACHE_LINK_IMAGE and cached["image_id"] is not None:
+        linked = _linked_result(conn, cache_key, cached, payload, user_id)
+        if linked is not None:
+            return linked
+
+    img_width, img_height = payload["image_size"]["width"], payload["image_size"]["height"]
+    image_id = insert_image(conn, user_id=user_id, image_bytes=img_bytes, width=img_width, height=img_height)
+    # 캐시 키에 모델 버전이 포함되므로, 적중한 결과는 현재 버전이 만든 결과입니다.
+    model_version = format_model_version(get_model_versions())
+    results = [dict(result) for result in payload["results"]]
+    predictions = []
+    for result in results:
+        x_min, y_min, x_max, y_max = result["bbox"]
+        predictions.append({"bbox": [x_min * img_width, y_min * img_height, x_max * img_width, y_max * img_height]})
+    save_detected_items(conn, image_id, predictions, results, model_version)
+
+    payload["image_id"] = image_id
+    payload["results"] = results
+    return payload
+
+
+def _linked_result(conn, cache_key, cached, payload, user_id):
+    """기존 image_id를 재사용한 응답. 이미지가 없거나 다른 사용자의 이미지면 None (새 이미지로 복사)"""
+    image_id = cached["image_id"]
+    owner = fetch_image_owner(conn, image_id)
+    if owner is None:
+        # 연결된 이미지가 삭제되었으므로 이 항목은 더 이상 재사용할 수 없습니다.
+        print(f"[RESULT CACHE] Linked image {image_id} no longer exists. Dropping entry.")
+        detection_cache.delete(conn, cache_key)
+        return None
+    if owner != user_id:
+        return None
+
+    img_width, img_height = payload["image_size"]["width"], payload["image_size"]["height"]
+    # 신뢰도는 DB에 저장하지 않으므로 캐시된 값을 item_id로 찾아 사용합니다.
+    confidences = {result.get("item_id"): result.get("confidence") for result in payload["results"]}
+    payload["image_id"] = image_id
+    payload["results"] = [
+        {
+            "item_id": row["item_id"],
+            "name_ko": row["item_name"],
+            "name_en": row["item_name_EN"],
+            "bbox": normalize_bbox([row["bbox_x_min"], row["bbox_y_min"], row["bbox_x_max"], row["bbox_y_max"]],
+                                   img_width, img_height),
+            "confidence": confidences.get(row["item_id"]),
+            "carry_on_allowed": row["carry_on_allowed"],
+            "checked_baggage_allowed": row["checked_baggage_allowed"],
+            "notes": row["notes"] if row["regulation_item_id"] else "DB에 규정 정보 없음",
+            "regulation_item_id": row["regulation_item_id"],
+        }
+        for row in fetch_detected_items_with_regulations(conn, image_id)
+    ]
+    return payload
 
 
 @classify_bp.route("/classify", methods=["POST"])
 def classify():
+    """
+    이미지를 업로드받아 탐지/분류합니다.
+    쿼리 파라미터: ?mode=sync|async (기본값: Config.CLASSIFY_ASYNC)
+                  ?profile=fast|balanced|accurate (기본값: Config.DEFAULT_INFERENCE_PROFILE)
+    비동기 모드에서는 작업을 큐에 넣고 202와 job_id를 즉시 반환합니다.
+    """
     if "image" not in request.files:
         return jsonify({"error": "No image uploaded"}), 400
 
     file = request.files["image"]
     img_bytes = file.read()
+    if not img_bytes:
+        return jsonify({"error": "Empty image file"}), 400
 
-    # (수정됨) 이미지 크기를 먼저 가져옵니다.
+    profile_name = request.args.get("profile")
     try:
-        image = Image.open(io.BytesIO(img_bytes))
-        img_width, img_height = image.size
+        # 비동기 작업이 큐에서 실패하기 전에 잘못된 프로필을 바로 거절합니다.
+        get_profile(profile_name)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    mode = request.args.get("mode")
+    run_async = mode == "async" or (mode != "sync" and Config.CLASSIFY_ASYNC)
+
+    if run_async:
+        try:
+            job_id = classify_queue.enqueue(img_bytes, user_id="custom1", profile=profile_name)
+        except Exception as e:
+            print(f"[CLASSIFY] Failed to enqueue job: {e}")
+            return jsonify({"error": "Job queue unavailable"}), 503
+
+        status_url = url_for("classify.get_classify_job", job_id=job_id)
+        response = jsonify({"job_id": job_id, "status": STATUS_QUEUED, "status_url": status_url})
+        response.headers["Location"] = status_url
+        return response, 202
+
+    try:
+        # Server-Timing이 켜져 있으면 단계별 소요 시간을 응답 헤더로 보냅니다. (브라우저 개발자 도구에서 확인)
+        with (collect_timings() if Config.SERVER_TIMING_ENABLED else nullcontext()) as timings:
+            response = jsonify(process_upload(img_bytes, user_id="custom1", profile_name=profile_name))
+        if timings:
+            response.headers["Server-Timing"] = format_server_timing(timings)
+        return response
+    except ClassifyError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except Exception as e:
-        return jsonify({"error": f"Invalid image file: {e}"}), 400
+        print(f"Error during image processing: {e}")
+        return jsonify({"error": str(e)}), 500
 
-    engine = get_engine()
-    if not engine:
-        return jsonify({"error": "Database connection failed"}), 500
 
+# 스트리밍 응답 형식별 MIME 타입
+STREAM_MIMETYPES = {
+    "sse": "text/event-stream",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def format_stream_event(stream_format, event, data):
+    """이벤트 하나를 SSE(event/data 필드) 또는 NDJSON(한 줄 JSON) 형식으로 직렬화합니다."""
+    body = json.dumps(data, ensure_ascii=False)
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {body}\n\n"
+    return json.dumps({"event": event, "data": data}, ensure_ascii=False) + "\n"
+
+
+@classify_bp.route("/classify/stream", methods=["POST"])
+def classify_stream():
+    """
+    /classify의 스트리밍 버전입니다. 탐지 박스, 물품별 분류 결과, 최종 요약을 순서대로 보냅니다.
+    쿼리 파라미터: ?format=sse|ndjson (기본값: sse)
+                  ?profile=fast|balanced|accurate (기본값: Config.DEFAULT_INFERENCE_PROFILE)
+    이벤트: boxes -> item (물품마다) -> done, 처리 중 오류가 나면 error 이벤트로 끝납니다.
+    """
+    if "image" not in request.files:
+        return jsonify({"error": "No image uploaded"}), 400
+
+    img_bytes = request.files["image"].read()
+    if not img_bytes:
+        return jsonify({"error": "Empty image file"}), 400
+
+    stream_format = request.args.get("format", "sse")
+    if stream_format not in STREAM_MIMETYPES:
+        return jsonify({"error": f"지원하지 않는 스트리밍 형식입니다: {stream_format}"}), 400
+
+    profile_name = request.args.get("profile")
     try:
-        with engine.begin() as conn:
-            # (수정됨) 이미지 저장 시 크기 정보 전달
-            image_id = insert_image(conn, user_id="custom1", image_bytes=img_bytes, width=img_width, height=img_height)
+        get_profile(profile_name)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-            # (수정됨) 탐지 함수에 크기 정보 전달
-            results = run_detection(img_bytes, conn, image_id, img_width, img_height)
+    def generate():
+        try:
+            for event, data in stream_upload(img_bytes, user_id="custom1", profile_name=profile_name):
+                yield format_stream_event(stream_format, event, data)
+        except ClassifyError as e:
+            yield format_stream_event(stream_format, "error", {"error": str(e), "status_code": e.status_code})
+        except Exception as e:
+            print(f"Error during streaming image processing: {e}")
+            yield format_stream_event(stream_format, "error", {"error": str(e), "status_code": 500})
+
+    response = Response(stream_with_context(generate()), mimetype=STREAM_MIMETYPES[stream_format])
+    # 프록시(nginx 등)가 응답을 모아서 보내지 않도록 버퍼링을 끕니다.
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
 
-            return jsonify({
-                "message": "Detection and classification complete.",
-                "image_id": image_id,
-                "image_size": {"width": img_width, "height": img_height},
-                "results": results
-            })
 
+@classify_bp.route("/classify/jobs/<job_id>", methods=["GET"])
+def get_classify_job(job_id):
+    """비동기 분류 작업의 상태와 (완료 시) 결과를 반환합니다."""
+    try:
+        job = classify_queue.get_status(job_id)
     except Exception as e:
-        print(f"Error during image processing: {e}")
-        return jsonify({"error": str(e)}), 500
+        print(f"[CLASSIFY] Failed to read job {job_id}: {e}")
+        return jsonify({"error": "Job queue unavailable"}), 503
+
+    if job is None:
+        return jsonify({"error": "해당 작업을 찾을 수 없습니다."}), 404
+    if job["status"] == STATUS_FAILED:
+        # 동기 처리와 같은 상태 코드로 실패를 알립니다. (예: 이미지 오류 400, 만료 410)
+        return jsonify(job), job["status_code"]
+    return jsonify(job), 200
@@ -0,0 +1,82 @@
+# app/routes/health.py
+from flask import Blueprint, jsonify
+from sqlalchemy import text
+from config import Config
+from app.db.database import get_engine
+from app.db.redis_client import get_redis
+from app.matching.item_service import item_service
+from app.matching.regulation_table import regulation_table
+from app.services import gemini_service
+
+health_bp = Blueprint('health_bp', __name__, url_prefix='/api/health')
+
+# 이 상태인 서브시스템이 하나라도 있으면 준비되지 않은 것으로 봅니다.
+NOT_READY_STATES = ("loading", "failed")
+
+
+def _model_states():
+    """SKU/YOLO 모델 로드 상태. 추론 데몬 모드에서는 데몬에 조회합니다."""
+    if Config.INFERENCE_DAEMON_SOCKET:
+        from app.inference.client import get_daemon_status
+        try:
+            models = get_daemon_status()["models"]
+        except Exception as e:
+            print(f"[HEALTH] Inference daemon unreachable: {e}")
+            return {"sku_model": "failed", "yolo_model": "failed"}
+    else:
+        from app.inference.registry import model_registry
+        models = model_registry.status()
+
+    return {
+        f"{name}_model": models.get(name, {}).get("state", "not_loaded")
+        for name in ("sku", "yolo")
+    }
+
+
+def _check_database():
+    engine = get_engine()
+    if not engine:
+        return "failed"
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return "ready"
+    except Exception as e:
+        print(f"[HEALTH] Database check failed: {e}")
+        return "failed"
+
+
+def _check_redis():
+    """
+    Redis는 비동기 작업 큐, 캐시, 파생 이미지 생성에만 쓰이고 동기 /classify는 Redis 없이 동작합니다.
+    따라서 Redis 장애는 degraded로 보고하고, 비동기 모드가 기본일 때만 failed(준비 안 됨)로 봅니다.
+    """
+    try:
+        get_redis().ping()
+        return "ready"
+    except Exception as e:
+        print(f"[HEALTH] Redis check failed: {e}")
+        return "failed" if Config.CLASSIFY_ASYNC else "degraded"
+
+
+@health_bp.route('/ready', methods=['GET'])
+def readiness():
+    """
+    서브시스템별 로드 상태를 반환합니다.
+    상태: not_loaded(첫 사용 시 로드) / loading / ready / failed / degraded(선택 기능만 사용 불가)
+    loading 또는 failed인 서브시스템이 있으면 503을 반환합니다.
+    """
+    subsystems = {
+        **_model_states(),
+        "gemini": gemini_service.get_state(),
+        "item_cache": "ready" if item_service.initialized else "not_loaded",
+        "regulation_table": "ready" if regulation_table.ready else "not_loaded",
+        "database": _check_database(),
+        "redis": _check_redis(),
+    }
+    ready = not any(state in NOT_READY_STATES for state in subsystems.values())
+    return jsonify({
+        "status": "ready" if ready else "not_ready",
+        "model_load_mode": Config.MODEL_LOAD_MODE,
+        "subsystems": subsystems
+    }), 200 if ready else 503
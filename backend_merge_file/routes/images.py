@@ -0,0 +1,135 @@
+# app/routes/images.py
+import io
+from flask import Blueprint, Response, request, jsonify, send_file, redirect, url_for
+from config import Config
+from app.db.database import get_image_details_by_id, fetch_inline_image_data
+from app.imaging.derivatives import planned_derivatives, select_derivative
+from app.jobs.derivative_queue import enqueue_derivatives
+from app.storage.blob_store import get_blob_store, sniff_content_type, BlobNotFound
+
+images_bp = Blueprint('images_bp', __name__, url_prefix='/api/images')
+
+# blob 키가 내용 해시이므로 같은 URL의 내용은 바뀌지 않습니다.
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+@images_bp.route('/<int:image_id>', methods=['GET'])
+def get_image(image_id):
+    """
+    업로드된 이미지 원본을 반환합니다. HTTP Range(부분 요청)와 If-None-Match를 지원합니다.
+    로컬 저장소는 파일을 그대로 전송하고(send_file), S3 저장소는 요청한 구간만 읽어 스트리밍합니다.
+    """
+    details = get_image_details_by_id(image_id)
+    if not details:
+        return jsonify({"error": "해당 이미지를 찾을 수 없습니다."}), 404
+
+    blob_key = details["blob_key"]
+    mimetype = details["content_type"] or "application/octet-stream"
+    if not blob_key:
+        return _send_inline_image(image_id, details)
+
+    try:
+        return _send_blob(get_blob_store(), blob_key, mimetype)
+    except BlobNotFound:
+        print(f"[IMAGES API] Blob {blob_key} for image {image_id} is missing")
+        return jsonify({"error": "이미지 원본을 찾을 수 없습니다."}), 404
+
+
+@images_bp.route('/<int:image_id>/fit', methods=['GET'])
+def get_fitted_image(image_id):
+    """
+    요청 크기(?w=, ?h= 픽셀, 둘 중 하나 이상)를 만족하는 가장 작은 파생 이미지(썸네일 등)를 반환합니다.
+    Accept에 image/webp가 있고 WebP 파생 이미지가 있으면 WebP를 우선합니다.
+    만족하는 파생 이미지가 없으면 원본으로, 아직 생성 전이면 원본으로 임시 리다이렉트하고 생성을 요청합니다.
+    """
+    try:
+        width = int(request.args['w']) if request.args.get('w') else None
+        height = int(request.args['h']) if request.args.get('h') else None
+    except ValueError:
+        return jsonify({"error": "w, h는 정수여야 합니다."}), 400
+
+    details = get_image_details_by_id(image_id)
+    if not details:
+        return jsonify({"error": "해당 이미지를 찾을 수 없습니다."}), 404
+
+    original_url = url_for('images_bp.get_image', image_id=image_id)
+    if not details["blob_key"] or not details["width"] or not details["height"]:
+        return redirect(original_url, 307)
+
+    planned = planned_derivatives(details["blob_key"], details["width"], details["height"])
+    selected = select_derivative(planned, width, height, accept_webp=_accepts_webp())
+    if selected is None:
+        # 요청 크기가 가장 큰 파생 이미지보다 크면 원본이 가장 작은 후보입니다.
+        response = redirect(original_url, 307)
+        response.headers["Cache-Control"] = "private, max-age=86400"
+        return _vary_on_accept(response)
+
+    try:
+        response = _send_blob(get_blob_store(), selected["key"], selected["mimetype"])
+    except BlobNotFound:
+        enqueue_derivatives(image_id)
+        response = redirect(original_url, 307)
+        response.headers["Cache-Control"] = "no-store"
+        return response
+
+    response.headers["X-Image-Size"] = f"{selected['width']}x{selected['height']}"
+    return _vary_on_accept(response)
+
+
+def _accepts_webp() -> bool:
+    # */*만 보내는 클라이언트는 WebP를 지원하지 않을 수 있으므로 명시한 경우에만 WebP를 보냅니다.
+    return "image/webp" in request.headers.get("Accept", "")
+
+
+def _vary_on_accept(response):
+    # WebP 협상 결과가 Accept에 따라 달라지므로 공유 캐시가 구분하도록 합니다.
+    if Config.DERIVATIVE_WEBP:
+        response.vary.add("Accept")
+    return response
+
+
+def _send_blob(store, blob_key, mimetype):
+    """blob 하나를 조건부/Range 요청을 지원하여 반환합니다. (내용이 바뀌지 않으므로 immutable 캐시)"""
+    path = store.local_path(blob_key)
+    if path:
+        response = send_file(path, mimetype=mimetype, conditional=True, etag=blob_key, max_age=None)
+    else:
+        response = _stream_blob(store, blob_key, mimetype)
+    response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+def _stream_blob(store, blob_key, mimetype):
+    size = store.size(blob_key)
+    if request.if_none_match.contains(blob_key):
+        response = Response(status=304)
+        response.set_etag(blob_key)
+        return response
+
+    byte_range = request.range
+    if byte_range is not None and request.if_range.etag in (None, blob_key):
+        bounds = byte_range.range_for_length(size)
+        if bounds is None:
+            response = Response(status=416)
+            response.headers["Content-Range"] = f"bytes */{size}"
+            return response
+        start, stop = bounds
+        response = Response(store.iter_range(blob_key, start, stop), status=206, mimetype=mimetype,
+                            direct_passthrough=True)
+        response.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+        response.content_length = stop - start
+    else:
+        response = Response(store.iter_range(blob_key), mimetype=mimetype, direct_passthrough=True)
+        response.content_length = size
+
+    response.headers["Accept-Ranges"] = "bytes"
+    response.set_etag(blob_key)
+    return response
+
+
+def _send_inline_image(image_id, details):
+    """blob 저장소로 옮기지 않은 기존 행은 DB의 원본을 그대로 반환합니다."""
+    if not details["has_inline_data"]:
+        return jsonify({"error": "이미지 원본을 찾을 수 없습니다."}), 404
+    data = fetch_inline_image_data(image_id)
+    return send_file(io.BytesIO(data), mimetype=sniff_content_type(data), conditional=True)
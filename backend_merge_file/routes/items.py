@@ -1,16 +1,59 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from app.matching.item_service import item_service
 from app.models.item_model import ItemModel
 from app.models.detected_item_model import DetectedItemModel
+from app.db.database import db, detected_item_row, fetch_items_by_names
+from app.cache.item_results_cache import item_results_cache
+from app.cache.items_snapshot import items_snapshot
 from app.services import gemini_service # Gemini 서비스 임포트
 
 items_bp = Blueprint('items_bp', __name__, url_prefix='/api/items')
 
 @items_bp.route('/all', methods=['GET'])
 def get_all_items():
-    """Vue.js가 초기에 캐싱할 전체 아이템 목록을 제공하는 API"""
-    all_items = item_service.get_all_items_details()
-    return jsonify(all_items)
+    """
+    Vue.js가 초기에 캐싱할 전체 아이템 목록을 제공하는 API
+    - 미리 직렬화/압축된 스냅샷을 제공하며, If-None-Match가 현재 버전과 같으면 304를 반환합니다.
+    - ?since=<버전>: 그 버전 이후 추가/수정된 항목과 삭제된 id만 반환합니다. (버전은 X-Items-Version 헤더)
+      버전 관리 전(X-Items-Version 헤더 없음)에는 전체 목록을 반환합니다.
+    """
+    snapshot = items_snapshot.get()
+
+    since = request.args.get('since')
+    delta = None
+    if since is not None:
+        try:
+            since = int(since)
+        except ValueError:
+            return jsonify({"error": "since는 정수 버전이어야 합니다."}), 400
+        # 버전 관리 전(v0006 마이그레이션 전)이면 None이므로 전체 목록을 제공합니다.
+        delta = snapshot.delta(since)
+
+    if delta is not None:
+        response = jsonify(delta)
+    elif request.if_none_match.contains_weak(snapshot.etag):
+        response = Response(status=304)
+    else:
+        response = Response(snapshot.body, mimetype='application/json')
+        encoding = _preferred_encoding(snapshot.encoded)
+        if encoding:
+            response.set_data(snapshot.encoded[encoding])
+            response.content_encoding = encoding
+        response.vary.add('Accept-Encoding')
+
+    response.set_etag(snapshot.etag, weak=True)
+    if snapshot.version is not None:
+        response.headers['X-Items-Version'] = str(snapshot.version)
+    # 매번 ETag로 확인하도록 합니다. (변경 없으면 304)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def _preferred_encoding(available):
+    """Accept-Encoding에서 허용한 압축 형식 중 brotli, gzip 순으로 고릅니다."""
+    for encoding in ('br', 'gzip'):
+        if encoding in available and request.accept_encodings[encoding] > 0:
+            return encoding
+    return None
 
 @items_bp.route('/autocomplete', methods=['GET'])
 def autocomplete():
@@ -49,7 +92,10 @@ def match_item():
 
 @items_bp.route('/add', methods=['POST'])
 def add_detected_items():
-    """새로 추가된 탐지 아이템을 데이터베이스에 저장합니다."""
+    """
+    새로 추가된 탐지 아이템을 데이터베이스에 저장합니다.
+    물품 이름은 한 번의 IN 쿼리로 조회하고, 탐지 아이템은 한 번의 multi-row INSERT로 저장한 뒤 한 번만 커밋합니다.
+    """
     data = request.get_json()
     if not data or 'image_id' not in data or 'new_items' not in data:
         return jsonify({"error": "image_id와 new_items가 필요합니다."}), 400
@@ -59,52 +105,84 @@ def add_detected_items():
 
     try:
         for item_data in new_items:
-            item_name_ko = item_data['name_ko']
-            item_details = ItemModel.get_by_name(item_name_ko)
+            bbox = item_data.get('bbox')
+            if not item_data.get('name_ko') or not bbox or len(bbox) != 4:
+                raise ValueError("필수 인자(image_id, item_name, bbox)가 누락되었거나 형식이 잘못되었습니다.")
 
-            if not item_details:
-                best_match_result = item_service.find_best_match(item_name_ko)
-                if best_match_result and best_match_result['score'] >= 90:
-                    print(f"[ADD API] Found similar item '{best_match_result['name']}' for '{item_name_ko}'. Using it.")
-                    item_details = ItemModel.get_by_name(best_match_result['name'])
+        item_details_by_name = _resolve_item_details([item_data['name_ko'] for item_data in new_items])
 
+        rows = []
+        for item_data in new_items:
+            item_name_ko = item_data['name_ko']
+            item_details = item_details_by_name.get(item_name_ko)
             if not item_details:
-                print(f"[ADD API] Item '{item_name_ko}' not found in DB and no high-score match. Calling Gemini...")
-                gemini_data = gemini_service.get_item_info_from_gemini(item_name_ko)
-                
-                if gemini_data:
-                    print(f"[ADD API] Gemini returned data for '{item_name_ko}'. Adding to ItemModel...")
-                    item_details = ItemModel.add_item_from_api(gemini_data)
-                else:
-                    print(f"[ADD API] Gemini could not provide data for '{item_name_ko}'. Skipping.")
-                    continue
-
-            packing_info = 'none'
-            if item_details.carry_on_allowed == '예' and item_details.checked_baggage_allowed == '예':
-                packing_info = 'both'
-            elif item_details.carry_on_allowed == '예':
-                packing_info = 'carry_on'
-            elif item_details.checked_baggage_allowed == '예':
-                packing_info = 'checked'
-
-            DetectedItemModel.add_item(
+                print(f"[ADD API] Gemini could not provide data for '{item_name_ko}'. Skipping.")
+                continue
+
+            rows.append(detected_item_row(
                 image_id=image_id,
+                item_name_en=item_details['item_name_EN'],
                 item_name=item_name_ko,
-                item_name_EN=item_details.item_name_EN,
                 bbox=item_data['bbox'],
-                packing_info=packing_info
-            )
+                packing_info=_packing_info(item_details),
+                regulation_item_id=item_details['id']
+            ))
 
-        # 모든 작업 후, 상세 정보가 포함된 최신 목록을 가져옵니다.
-        all_detected_items = DetectedItemModel.get_detailed_by_image_id(image_id)
-        return jsonify(all_detected_items), 201
+        item_ids = DetectedItemModel.add_items(rows)
+        db.session.commit()
+        print(f"[ADD API] Added {len(item_ids)} items to image {image_id}: {item_ids}")
+
+        # 모든 작업 후, 상세 정보가 포함된 최신 목록을 가져와 캐시를 다시 씁니다.
+        return _detailed_results_response(item_results_cache.refresh(image_id, _detailed_loader(image_id)), 201)
 
     except ValueError as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 400
     except Exception as e:
+        db.session.rollback()
         print(f"[ADD API] Server error: {e}")
         return jsonify({"error": "서버 내부 오류가 발생했습니다."}), 500
 
+def _resolve_item_details(item_names):
+    """
+    물품 이름별 규정 정보 {이름: 정보 dict}를 조회합니다.
+    - 캐시된 이름 목록에 없는 이름은 유사 항목(점수 90 이상)을 미리 찾아, 요청한 이름과 함께 한 번의 IN 쿼리로 조회합니다.
+    - 그래도 없는 이름은 Gemini로 규정 정보를 받아 items에 추가합니다. (커밋은 요청 끝에 한 번)
+    """
+    names = set(item_names)
+    known_names = set(item_service.item_names)
+    similar = {}
+    for name in names - known_names:
+        best_match_result = item_service.find_best_match(name)
+        if best_match_result and best_match_result['score'] >= 90:
+            similar[name] = best_match_result['name']
+
+    rows = fetch_items_by_names(db.session.connection(), names | set(similar.values()))
+
+    details = {}
+    for name in names:
+        if name in rows:
+            details[name] = rows[name]
+        elif similar.get(name) in rows:
+            print(f"[ADD API] Found similar item '{similar[name]}' for '{name}'. Using it.")
+            details[name] = rows[similar[name]]
+        else:
+            print(f"[ADD API] Item '{name}' not found in DB and no high-score match. Calling Gemini...")
+            gemini_data = gemini_service.get_item_info_from_gemini(name)
+            if gemini_data:
+                print(f"[ADD API] Gemini returned data for '{name}'. Adding to ItemModel...")
+                details[name] = ItemModel.add_item_from_api(gemini_data, commit=False).to_dict()
+    return details
+
+def _packing_info(item_details):
+    if item_details['carry_on_allowed'] == '예' and item_details['checked_baggage_allowed'] == '예':
+        return 'both'
+    elif item_details['carry_on_allowed'] == '예':
+        return 'carry_on'
+    elif item_details['checked_baggage_allowed'] == '예':
+        return 'checked'
+    return 'none'
+
 @items_bp.route('/delete', methods=['POST'])
 def delete_detected_items():
     """탐지된 아이템들을 데이터베이스에서 삭제하고, 최신 목록을 반환합니다."""
@@ -117,11 +195,12 @@ def delete_detected_items():
 
     try:
         if item_ids_to_delete:
-            DetectedItemModel.delete_items(item_ids_to_delete)
-        
-        # 삭제 작업 후, 상세 정보가 포함된 최신 목록을 가져옵니다.
-        all_detected_items = DetectedItemModel.get_detailed_by_image_id(image_id)
-        return jsonify(all_detected_items), 200
+            DetectedItemModel.delete_items(item_ids_to_delete, image_id=image_id)
+            # 삭제 작업 후, 상세 정보가 포함된 최신 목록을 가져와 캐시를 다시 씁니다.
+            payload = item_results_cache.refresh(image_id, _detailed_loader(image_id))
+        else:
+            payload = item_results_cache.get_json(image_id, _detailed_loader(image_id))
+        return _detailed_results_response(payload, 200)
 
     except Exception as e:
         return jsonify({"error": "서버 내부 오류가 발생했습니다."}), 500
@@ -130,14 +209,16 @@ def delete_detected_items():
 def get_results_by_image_id(image_id):
     """특정 이미지 ID에 대한 모든 상세 탐지 결과를 반환합니다."""
     try:
-        detailed_items = DetectedItemModel.get_detailed_by_image_id(image_id)
-        if detailed_items is None:
-            # get_detailed_by_image_id가 None을 반환하는 경우 (예: 해당 이미지 ID 없음)
-            return jsonify({"error": "해당 이미지 ID에 대한 결과를 찾을 수 없습니다."}), 404
-        return jsonify(detailed_items), 200
+        # 결과는 Redis에 JSON으로 캐시되며 add/delete 시 다시 써집니다.
+        payload = item_results_cache.get_json(image_id, _detailed_loader(image_id))
+        return _detailed_results_response(payload, 200)
     except Exception as e:
         print(f"[RESULTS API] Server error: {e}")
         return jsonify({"error": "서버 내부 오류가 발생했습니다."}), 500
 
+def _detailed_loader(image_id):
+    return lambda: DetectedItemModel.get_detailed_by_image_id(image_id)
 
-
+def _detailed_results_response(payload, status):
+    """미리 직렬화된 상세 결과 JSON을 그대로 응답합니다."""
+    return Response(payload, status=status, mimetype='application/json')
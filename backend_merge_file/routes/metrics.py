@@ -0,0 +1,17 @@
+# app/routes/metrics.py
+from flask import Blueprint, Response, jsonify
+from config import Config
+from app.monitoring.metrics import render_prometheus
+
+metrics_bp = Blueprint('metrics_bp', __name__)
+
+# Prometheus 텍스트 노출 형식
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """이 프로세스의 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+    if not Config.METRICS_ENABLED:
+        return jsonify({"error": "지표 수집이 비활성화되어 있습니다."}), 404
+    return Response(render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,12 +1,38 @@
-import google.generativeai as genai
 from config import Config
 import re
+import threading
 
-# API 키를 사용하여 Gemini 클라이언트를 설정합니다.
-try:
-    genai.configure(api_key=Config.GEMINI_API_KEY)
-except Exception as e:
-    print(f"[Gemini Service] Failed to configure Gemini: {e}")
+# google.generativeai는 import 비용이 크므로 첫 호출 시점에 로드합니다.
+_genai = None
+_genai_state = "not_loaded"
+_genai_lock = threading.Lock()
+
+
+def _get_genai():
+    """Gemini 클라이언트 모듈을 로드하고 API 키를 설정합니다. (최초 1회)"""
+    global _genai, _genai_state
+    if _genai is not None:
+        return _genai
+
+    with _genai_lock:
+        if _genai is None:
+            _genai_state = "loading"
+            try:
+                import google.generativeai as genai
+                # API 키를 사용하여 Gemini 클라이언트를 설정합니다.
+                genai.configure(api_key=Config.GEMINI_API_KEY)
+                _genai = genai
+                _genai_state = "ready"
+            except Exception as e:
+                _genai_state = "failed"
+                print(f"[Gemini Service] Failed to configure Gemini: {e}")
+                raise
+    return _genai
+
+
+def get_state():
+    """Gemini 클라이언트 로드 상태 (readiness 보고용)"""
+    return _genai_state
 
 # Gemini 모델에게 역할을 부여하고, 응답 규칙을 정의하는 시스템 프롬프트입니다.
 SYSTEM_PROMPT = """
@@ -39,6 +65,7 @@ def get_item_info_from_gemini(item_name: str):
         return None
 
     try:
+        genai = _get_genai()
         model = genai.GenerativeModel(
             model_name='gemini-2.5-flash',
             system_instruction=SYSTEM_PROMPT
@@ -2,52 +2,69 @@
 
 import os
 from PIL import Image
-import io
-from ultralytics import YOLO  # YOLO 모델을 사용하기 위해 import
+from config import Config
+from app.imaging.decoded_image import DecodedImage
+from app.inference.registry import model_registry
+from app.inference.box_ops import prune_boxes
+from app.inference.outcome import record_failure
+from app.sku.tiling import should_tile, detect_full, detect_tiled
 
 
-# YOLO 모델 가중치 경로 설정 (지정된 경로 사용)
-SKU_MODEL_PATH = "backend/app/sku/weights/sku_best.pt"
+# SKU 모델 등록 (레지스트리의 활성 버전, 없으면 Config.SKU_MODEL_PATH)
+# 로드 시점은 Config.MODEL_LOAD_MODE를 따릅니다. (eager면 이 시점에 로드)
+model_registry.register("sku")
 
 
-# SKU 모델 인스턴스 생성 (YOLO 클래스 사용)
-# 이 시점에서 모델 파일이 로드됩니다.
-try:
-    sku_model = YOLO(SKU_MODEL_PATH)
-    print(f"SKU model loaded successfully from {SKU_MODEL_PATH}")
-except Exception as e:
-    print(f"Error loading SKU model: {e}")
-    sku_model = None
-
-
-def predict_bbox_with_sku(image_data: bytes, conf_threshold: float = 0.10):
+def predict_bbox_with_sku(image_data, conf_threshold: float = 0.10, imgsz: int = None, tiled: bool = None,
+                          prune: bool = True):
     """
-    BLOB 이미지 데이터를 받아 SKU 모델로 바운딩 박스를 탐지하고 목록을 반환합니다.
+    이미지(BLOB 바이트 또는 DecodedImage)를 받아 SKU 모델로 바운딩 박스를 탐지하고 목록을 반환합니다.
     conf_threshold: 탐지 임계값 (기본 0.15)
+    imgsz: 모델 입력 크기 (None이면 모델 기본값), 박스는 항상 원본 이미지 좌표로 반환됩니다.
+    tiled: 타일 탐지 여부 (None이면 Config.SKU_TILING과 해상도에 따라 자동 결정)
+    prune: True면 크롭 분류 전에 작은/중복/포함된 박스를 제거하고 크롭 수를 제한합니다.
     """
-    if sku_model is None:
-        print("SKU model is not loaded. Cannot perform prediction.")
-        return []
+    with model_registry.acquire("sku") as handle:
+        if handle is None:
+            print("SKU model is not loaded. Cannot perform prediction.")
+            record_failure("sku", "model not loaded")
+            return []
 
-    try:
-        results = sku_model(
-            Image.open(io.BytesIO(image_data)),
-            conf=conf_threshold  # 여기서 임계값 지정
-        )
+        try:
+            image = DecodedImage.ensure(image_data)
+            if tiled is None:
+                tiled = should_tile(image)
+
+            if tiled:
+                boxes, scores = detect_tiled(handle.model, image, conf_threshold, imgsz)
+            else:
+                boxes, scores = detect_full(handle.model, image, conf_threshold, imgsz)
+
+            if prune:
+                boxes = boxes[prune_boxes_for(image, boxes, scores)]
+
+            # 축소 디코딩된 경우 원본 좌표로 되돌립니다.
+            return image.to_original_boxes(boxes).tolist()
+        except Exception as e:
+            print(f"Error in SKU prediction: {e}")
+            record_failure("sku", str(e))
+            return []
+
+
+def prune_boxes_for(image: DecodedImage, boxes, scores):
+    """Config의 크롭 정리 설정으로 prune_boxes를 적용하여 남길 인덱스를 반환합니다. (배열 좌표 기준)"""
+    array_height, array_width = image.array.shape[:2]
+    return prune_boxes(
+        boxes, scores,
+        iou_threshold=Config.CROP_NMS_IOU,
+        min_area=Config.CROP_MIN_AREA_RATIO * array_width * array_height,
+        containment_threshold=Config.CROP_CONTAINMENT_RATIO,
+        max_boxes=Config.MAX_CROPS_PER_IMAGE or None,
+    )
 
-        bboxes = []
-        if results and results[0].boxes:
-            for box in results[0].boxes:
-                bbox = box.xyxy[0].tolist()
-                bboxes.append(bbox)
 
-        return bboxes
-    except Exception as e:
-        print(f"Error in SKU prediction: {e}")
-        return []
-    
 #테스트용 코드
-def save_cropped_images(image_data: bytes, bboxes: list, image_id: int):
+def save_cropped_images(image_data, bboxes: list, image_id: int):
     """
     SKU 모델이 탐지한 바운딩 박스에 맞춰 이미지를 잘라내고 저장합니다.
     """
@@ -56,12 +73,12 @@ def save_cropped_images(image_data: bytes, bboxes: list, image_id: int):
     os.makedirs(RESULT_FOLDER, exist_ok=True)
     
     # 원본 이미지 로드
-    original_image = Image.open(io.BytesIO(image_data))
+    original_image = DecodedImage.ensure(image_data)
     
     for i, bbox in enumerate(bboxes):
         try:
             # 바운딩 박스 좌표로 이미지 크롭
-            cropped_image = original_image.crop(bbox)
+            cropped_image = Image.fromarray(original_image.crop(bbox))
             
             # 파일명 형식: {image_id}_cropped_{인덱스}.jpg
             save_path = os.path.join(RESULT_FOLDER, f"{image_id}_cropped_{i}.jpg")
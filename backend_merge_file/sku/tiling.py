@@ -0,0 +1,121 @@
+# app/sku/tiling.py
+"""
+고해상도 사진(짐이 빽빽한 캐리어 등)을 위한 타일 단위 SKU 탐지입니다.
+이미지를 겹치는 타일로 나누어 배치로 한 번에 추론하고, 전체 이미지 1회 추론 결과와 합친 뒤
+타일 경계에서 중복된 박스를 NMS로 제거합니다.
+타일 수만큼 SKU 추론이 늘어나므로 이미지당 타일 수는 Config.SKU_MAX_TILES로 제한합니다.
+"""
+import numpy as np
+from config import Config
+from app.imaging.decoded_image import DecodedImage
+from app.inference.box_ops import nms
+from app.inference.batcher import MicroBatcher
+
+
+def _predict_images(key, images: list) -> list:
+    """마이크로 배치 실행 함수: BGR 이미지 목록 -> ultralytics Results 목록"""
+    model, conf_threshold, imgsz = key
+    options = {"imgsz": imgsz} if imgsz else {}
+    # 리스트 입력은 ultralytics가 하나의 배치로 묶어 한 번의 forward로 처리합니다.
+    return model(images, conf=conf_threshold, verbose=False, **options)
+
+
+# 동시 요청의 이미지/타일을 모아 탐지하는 배치 스케줄러 (key: 모델 엔진, 임계값, 입력 크기)
+sku_batcher = MicroBatcher("sku", _predict_images, max_batch_size=Config.SKU_MAX_BATCH_SIZE)
+
+
+def should_tile(image: DecodedImage) -> bool:
+    """Config.SKU_TILING(auto | on | off)에 따라 타일 탐지 여부를 결정합니다."""
+    mode = Config.SKU_TILING
+    if mode == "on":
+        return True
+    if mode == "off":
+        return False
+    # auto: 실제 추론할 배열(프로필에 따라 축소된 크기)의 긴 변 기준
+    return max(image.array.shape[:2]) >= Config.SKU_TILING_MIN_DIM
+
+
+def tile_windows(width: int, height: int, tile_size: int, overlap: float) -> np.ndarray:
+    """
+    이미지를 덮는 (N, 4) xyxy 타일 좌표를 반환합니다.
+    인접 타일은 overlap 비율만큼 겹치고, 마지막 타일은 이미지 끝에 맞춥니다.
+    """
+    stride = max(1, int(tile_size * (1 - overlap)))
+
+    def starts(length):
+        if length <= tile_size:
+            return [0]
+        positions = list(range(0, length - tile_size, stride))
+        positions.append(length - tile_size)
+        return positions
+
+    xs, ys = starts(width), starts(height)
+    x0, y0 = np.meshgrid(xs, ys)
+    x0, y0 = x0.ravel(), y0.ravel()
+    return np.stack([x0, y0, np.minimum(x0 + tile_size, width), np.minimum(y0 + tile_size, height)], axis=1)
+
+
+def capped_tile_windows(width: int, height: int, tile_size: int, overlap: float, max_tiles: int = None) -> np.ndarray:
+    """
+    tile_windows와 같지만 타일 수가 max_tiles를 넘으면 타일 한 변을 키워 개수를 맞춥니다.
+    커진 타일은 추론 시 tile_size로 축소되므로 이미지당 SKU 추론 비용이 max_tiles + 1회로 제한됩니다.
+    """
+    window = tile_size
+    windows = tile_windows(width, height, window, overlap)
+    while max_tiles and len(windows) > max_tiles:
+        window = int(window * 1.25) + 1
+        windows = tile_windows(width, height, window, overlap)
+    return windows
+
+
+def _collect(results, offsets: np.ndarray):
+    """ultralytics Results 목록에서 박스/점수를 모아 타일 오프셋만큼 이동합니다."""
+    boxes, scores = [], []
+    for result, (dx, dy) in zip(results, offsets):
+        if result.boxes is None or len(result.boxes) == 0:
+            continue
+        boxes.append(result.boxes.xyxy.cpu().numpy() + np.array([dx, dy, dx, dy], dtype=np.float32))
+        scores.append(result.boxes.conf.cpu().numpy())
+    if not boxes:
+        return np.zeros((0, 4), dtype=np.float32), np.zeros(0, dtype=np.float32)
+    return np.concatenate(boxes), np.concatenate(scores)
+
+
+def detect_full(model, image: DecodedImage, conf_threshold: float, imgsz: int = None):
+    """전체 이미지 1회 추론. 배열 좌표의 (boxes, scores)를 반환합니다."""
+    # ultralytics는 numpy 입력을 BGR로 해석합니다.
+    results = sku_batcher.submit((model, conf_threshold, imgsz), [image.to_bgr()])
+    return _collect(results, np.zeros((1, 2)))
+
+
+def detect_tiled(model, image: DecodedImage, conf_threshold: float, imgsz: int = None,
+                 tile_size: int = None, overlap: float = None, batch_size: int = None, max_tiles: int = None):
+    """
+    전체 이미지 추론 + 타일 배치 추론 결과를 합쳐 NMS로 병합합니다.
+    타일은 tile_size 해상도로 입력하므로 작은 물체가 전체 이미지 추론보다 덜 축소됩니다.
+    batch_size를 지정하면 다른 요청과 묶지 않고 이 요청의 타일만 batch_size개씩 추론합니다. (벤치마크 비교용)
+    max_tiles: 이미지당 최대 타일 수 (기본값: Config.SKU_MAX_TILES, 0이면 제한 없음)
+    배열 좌표의 (boxes, scores)를 점수 내림차순으로 반환합니다.
+    """
+    tile_size = tile_size or Config.SKU_TILE_SIZE
+    overlap = Config.SKU_TILE_OVERLAP if overlap is None else overlap
+    max_tiles = Config.SKU_MAX_TILES if max_tiles is None else max_tiles
+
+    # 여러 타일에 걸친 큰 물체는 전체 이미지 추론에서 잡습니다.
+    full_boxes, full_scores = detect_full(model, image, conf_threshold, imgsz)
+
+    bgr = image.to_bgr()
+    height, width = bgr.shape[:2]
+    windows = capped_tile_windows(width, height, tile_size, overlap, max_tiles)
+
+    tiles = [np.ascontiguousarray(bgr[y0:y1, x0:x1]) for x0, y0, x1, y1 in windows]
+    key = (model, conf_threshold, tile_size)
+    if batch_size:
+        results = sku_batcher.run_now(key, tiles, batch_size)
+    else:
+        results = sku_batcher.submit(key, tiles)
+    tile_boxes, tile_scores = _collect(results, windows[:, :2])
+
+    boxes, scores = np.concatenate([full_boxes, tile_boxes]), np.concatenate([full_scores, tile_scores])
+    keep = nms(boxes, scores, Config.SKU_TILE_NMS_IOU)
+    return boxes[keep], scores[keep]
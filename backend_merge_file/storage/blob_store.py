@@ -0,0 +1,238 @@
+# app/storage/blob_store.py
+"""
+업로드 이미지 원본을 MySQL 밖에 저장하는 내용 주소 기반(content-addressed) blob 저장소입니다.
+DB(images 테이블)에는 blob 키(내용의 SHA-256)와 크기/형식 같은 메타데이터만 저장합니다.
+
+- local: 로컬 파일 시스템. 해시 앞 두 자리씩 두 단계로 디렉토리를 나눕니다. (ab/cd/abcd...)
+  파일은 임시 파일에 쓴 뒤 rename하므로 읽는 쪽이 쓰다 만 파일을 보지 않습니다.
+- s3: S3 호환 저장소. put_object / get_object / head_object / delete_object만 사용하므로
+  boto3 클라이언트(MinIO 등 endpoint_url 지정)나 같은 메서드를 가진 로컬 대체 클라이언트로 동작합니다.
+
+같은 내용은 같은 키가 되므로 재업로드는 저장 공간을 더 쓰지 않습니다.
+원본에서 만든 파생 이미지(썸네일 등)는 '<원본 키>.<이름>' 키로 원본과 같은 위치에 저장합니다.
+"""
+import hashlib
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from config import Config
+
+# 스트리밍 응답에서 한 번에 읽는 크기
+CHUNK_SIZE = 256 * 1024
+
+
+def blob_key_for(data: bytes) -> str:
+    """내용의 SHA-256 해시 (blob 키)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def sniff_content_type(data: bytes) -> str:
+    """파일 앞부분의 시그니처로 이미지 MIME 형식을 추정합니다."""
+    if data[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if data[4:12] in (b"ftypheic", b"ftypheix", b"ftypmif1", b"ftypmsf1"):
+        return "image/heic"
+    return "application/octet-stream"
+
+
+class BlobNotFound(Exception):
+    pass
+
+
+class BlobStore:
+    """blob 저장소 인터페이스"""
+
+    def put(self, data: bytes, key: str = None) -> str:
+        """
+        내용을 저장하고 blob 키를 반환합니다. 이미 있으면 다시 쓰지 않습니다.
+        key를 지정하지 않으면 내용의 SHA-256을 키로 사용합니다.
+        """
+        raise NotImplementedError
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.size(key)
+            return True
+        except BlobNotFound:
+            return False
+
+    def size(self, key: str) -> int:
+        raise NotImplementedError
+
+    def iter_range(self, key: str, start: int = 0, stop: int = None, chunk_size: int = CHUNK_SIZE):
+        """[start, stop) 구간을 chunk_size 단위로 읽는 제너레이터 (HTTP 스트리밍/Range 응답용)"""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def local_path(self, key: str):
+        """로컬 파일로 저장되어 있으면 경로를, 아니면 None을 반환합니다. (send_file 최적화용)"""
+        return None
+
+    def read(self, key: str) -> bytes:
+        return b"".join(self.iter_range(key))
+
+    @contextmanager
+    def view(self, key: str):
+        """
+        blob 전체를 읽기 전용 버퍼로 제공합니다. (bytes처럼 사용 가능)
+        로컬 저장소는 파일을 메모리 매핑하므로 blob 크기만큼 복사하지 않습니다.
+        """
+        yield self.read(key)
+
+
+class LocalBlobStore(BlobStore):
+    def __init__(self, root: str):
+        self.root = root
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key[2:4], key)
+
+    def put(self, data: bytes, key: str = None) -> str:
+        key = key or blob_key_for(data)
+        path = self.path_for(key)
+        if os.path.exists(path):
+            return key
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return key
+
+    def _existing_path(self, key: str) -> str:
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            raise BlobNotFound(key)
+        return path
+
+    def size(self, key: str) -> int:
+        return os.path.getsize(self._existing_path(key))
+
+    def iter_range(self, key: str, start: int = 0, stop: int = None, chunk_size: int = CHUNK_SIZE):
+        with open(self._existing_path(key), "rb") as f:
+            f.seek(start)
+            remaining = None if stop is None else stop - start
+            while remaining is None or remaining > 0:
+                chunk = f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def delete(self, key: str):
+        try:
+            os.remove(self.path_for(key))
+        except FileNotFoundError:
+            pass
+
+    def local_path(self, key: str):
+        return self._existing_path(key)
+
+    @contextmanager
+    def view(self, key: str):
+        with open(self._existing_path(key), "rb") as f:
+            # 빈 파일은 메모리 매핑할 수 없습니다.
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+
+class S3BlobStore(BlobStore):
+    def __init__(self, client, bucket: str, prefix: str = ""):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key[:2]}/{key[2:4]}/{key}"
+
+    def _is_not_found(self, error) -> bool:
+        response = getattr(error, "response", None) or {}
+        return response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    def put(self, data: bytes, key: str = None) -> str:
+        key = key or blob_key_for(data)
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+            return key
+        except Exception as e:
+            if not self._is_not_found(e):
+                raise
+        self.client.put_object(Bucket=self.bucket, Key=self._object_key(key), Body=data,
+                               ContentType=sniff_content_type(data))
+        return key
+
+    def size(self, key: str) -> int:
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))["ContentLength"]
+        except Exception as e:
+            if self._is_not_found(e):
+                raise BlobNotFound(key)
+            raise
+
+    def iter_range(self, key: str, start: int = 0, stop: int = None, chunk_size: int = CHUNK_SIZE):
+        params = {"Bucket": self.bucket, "Key": self._object_key(key)}
+        if start or stop is not None:
+            params["Range"] = f"bytes={start}-{'' if stop is None else stop - 1}"
+        try:
+            body = self.client.get_object(**params)["Body"]
+        except Exception as e:
+            if self._is_not_found(e):
+                raise BlobNotFound(key)
+            raise
+        try:
+            while True:
+                chunk = body.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
+    def delete(self, key: str):
+        self.client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
+
+
+def create_blob_store(backend: str = None) -> BlobStore:
+    """Config.BLOB_STORE_BACKEND에 맞는 저장소를 만듭니다."""
+    backend = backend or Config.BLOB_STORE_BACKEND
+    if backend == "local":
+        return LocalBlobStore(Config.BLOB_STORE_DIR)
+    if backend == "s3":
+        import boto3
+
+        client = boto3.client("s3", endpoint_url=Config.BLOB_S3_ENDPOINT_URL)
+        return S3BlobStore(client, Config.BLOB_S3_BUCKET, Config.BLOB_S3_PREFIX)
+    raise ValueError(f"Unknown blob store backend: {backend}")
+
+
+_blob_store = None
+
+
+def get_blob_store() -> BlobStore:
+    """프로세스 공유 blob 저장소 (첫 호출 시 생성)"""
+    global _blob_store
+    if _blob_store is None:
+        _blob_store = create_blob_store()
+    return _blob_store
@@ -0,0 +1,79 @@
+# app/storage/migrate_image_blobs.py
+"""
+images.image_data에 남아 있는 기존 원본을 blob 저장소로 옮깁니다.
+
+- image_id 순으로 --batch-size개씩 읽어 저장소에 쓰고, 행에 blob 키/크기/형식을 기록한 뒤 배치마다 커밋합니다.
+- 기본적으로 옮긴 행의 image_data를 비웁니다. (--keep-inline이면 유지)
+- 중간에 중단해도 다시 실행하면 아직 옮기지 않은 행부터 이어서 처리합니다.
+- 실패한 행은 건너뛰고 마지막에 image_id 목록을 출력합니다.
+- 테이블 공간은 image_data를 비워도 바로 줄지 않으므로, 완료 후 OPTIMIZE TABLE images를 실행하세요.
+
+실행 예시 (backend 디렉토리에서):
+    python -m app.storage.migrate_image_blobs --dry-run
+    python -m app.storage.migrate_image_blobs --batch-size 200 --sleep 0.5
+"""
+import argparse
+import time
+from app.db.database import get_engine, fetch_inline_images, set_image_blob
+from app.storage.blob_store import get_blob_store, sniff_content_type
+
+
+def migrate(batch_size: int, limit: int = None, dry_run: bool = False, keep_inline: bool = False,
+            sleep: float = 0.0) -> dict:
+    store = get_blob_store()
+    engine = get_engine()
+    last_id = 0
+    stats = {"moved": 0, "bytes": 0, "failed": []}
+    started = time.perf_counter()
+
+    while limit is None or stats["moved"] < limit:
+        size = batch_size if limit is None else min(batch_size, limit - stats["moved"])
+        with engine.begin() as conn:
+            rows = fetch_inline_images(conn, last_id, size)
+            if not rows:
+                break
+            for row in rows:
+                last_id = row["image_id"]
+                data = row["image_data"]
+                if dry_run:
+                    stats["moved"] += 1
+                    stats["bytes"] += len(data)
+                    continue
+                try:
+                    blob_key = store.put(data)
+                    set_image_blob(conn, row["image_id"], blob_key, len(data), sniff_content_type(data),
+                                   clear_inline=not keep_inline)
+                except Exception as e:
+                    print(f"[BLOB MIGRATION] Failed to move image {row['image_id']}: {e}")
+                    stats["failed"].append(row["image_id"])
+                    continue
+                stats["moved"] += 1
+                stats["bytes"] += len(data)
+
+        elapsed = time.perf_counter() - started
+        print(f"[BLOB MIGRATION] {'(dry run) ' if dry_run else ''}{stats['moved']} images, "
+              f"{stats['bytes'] / (1024 * 1024):.1f} MB, up to image_id {last_id} ({elapsed:.1f}s)")
+        if sleep:
+            # 운영 DB 부하를 줄이기 위해 배치 사이에 쉽니다.
+            time.sleep(sleep)
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="images.image_data → blob 저장소 이전")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=None, help="최대 처리 행 수")
+    parser.add_argument("--dry-run", action="store_true", help="옮길 행 수와 크기만 집계")
+    parser.add_argument("--keep-inline", action="store_true", help="옮긴 뒤에도 image_data를 비우지 않음")
+    parser.add_argument("--sleep", type=float, default=0.0, help="배치 사이 대기 시간(초)")
+    args = parser.parse_args()
+
+    stats = migrate(args.batch_size, args.limit, args.dry_run, args.keep_inline, args.sleep)
+    print(f"[BLOB MIGRATION] Done: {stats['moved']} images, {stats['bytes'] / (1024 * 1024):.1f} MB")
+    if stats["failed"]:
+        print(f"[BLOB MIGRATION] Failed image_ids: {stats['failed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# app/tests/conftest.py
+"""
+테스트 공용 설정입니다.
+backend 디렉토리(config.py 위치)를 import 경로에 넣고, 이 패키지를 `app`으로 import할 수 있게 합니다.
+병합 후(backend/app/tests)와 병합 전(backend_merge_file/tests) 배치 모두에서 동작합니다.
+
+실행 예시 (저장소 루트에서):
+    python -m pytest backend_merge_file/tests
+"""
+import sys
+import types
+from pathlib import Path
+import pytest
+
+APP_DIR = Path(__file__).resolve().parents[1]
+BACKEND_DIR = APP_DIR.parent if APP_DIR.name == "app" else APP_DIR.parent / "backend"
+
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+# backend/app.py(Flask 진입점) 모듈이 아니라 이 디렉토리를 app 패키지로 사용합니다.
+if getattr(sys.modules.get("app"), "__path__", None) != [str(APP_DIR)]:
+    app_package = types.ModuleType("app")
+    app_package.__path__ = [str(APP_DIR)]
+    sys.modules["app"] = app_package
+
+
+@pytest.fixture
+def fake_redis():
+    """프로세스 공용 Redis 클라이언트를 fakeredis로 바꿉니다."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("dotenv")
+    from app.db.redis_client import set_redis
+
+    client = fakeredis.FakeRedis()
+    set_redis(client)
+    yield client
+    set_redis(None)
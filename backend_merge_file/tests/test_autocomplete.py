@@ -0,0 +1,79 @@
+# app/tests/test_autocomplete.py
+"""
+자동완성 인덱스의 증분 추가/교체/삭제가 전체를 다시 만든 인덱스와 같은 결과를 내는지,
+검색 중에 항목이 추가되어도 검색이 깨지지 않는지 확인합니다.
+"""
+import threading
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+ITEMS = [
+    {"item_name": "가방", "item_name_EN": "bag"},
+    {"item_name": "보조배터리", "item_name_EN": "power bank"},
+    {"item_name": "라이터", "item_name_EN": "lighter"},
+    {"item_name": "손톱깎이", "item_name_EN": "nail clipper"},
+]
+QUERIES = ["가", "갑", "ㅂㅈ", "배터리", "power", "light", "손톱", "카메라", "camera", "ㄹㅇ"]
+
+
+def _results(index):
+    return {query: index.search(query, limit=5) for query in QUERIES}
+
+
+def test_incremental_updates_match_rebuilt_index():
+    from app.matching.autocomplete import AutocompleteIndex
+
+    index = AutocompleteIndex(ITEMS[:2])
+    index.add(ITEMS[2])
+    index.add(ITEMS[3])
+    index.add({"item_name": "카메라", "item_name_EN": "camera"})
+    index.add({"item_name": "라이터", "item_name_EN": "lighter (1 per person)"})
+    index.remove("가방")
+
+    expected = AutocompleteIndex(ITEMS[1:] + [{"item_name": "카메라", "item_name_EN": "camera"}])
+    expected.add({"item_name": "라이터", "item_name_EN": "lighter (1 per person)"})
+    assert len(index) == 4
+    assert _results(index) == _results(expected)
+    assert "카메라" in index.search("camera")
+    assert "가방" not in index.search("가")
+
+
+def test_unchanged_add_is_a_no_op():
+    from app.matching.autocomplete import AutocompleteIndex
+
+    index = AutocompleteIndex(ITEMS)
+    keys = index._keys
+    index.add(dict(ITEMS[0]))
+    assert index._keys is keys and len(index.names) == len(ITEMS)
+
+
+def test_search_while_adding():
+    from app.matching.autocomplete import AutocompleteIndex
+
+    index = AutocompleteIndex(ITEMS)
+    errors = []
+    done = threading.Event()
+
+    def search():
+        while not done.is_set():
+            try:
+                # 처음부터 있던 항목은 추가가 진행되는 동안에도 항상 찾아야 합니다.
+                assert index.search("보조", limit=1) == ["보조배터리"]
+                assert "라이터" in index.search("라이", limit=5)
+            except Exception as e:
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target=search) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for number in range(300):
+        index.add({"item_name": f"라이터 리필 {number}", "item_name_EN": f"lighter refill {number}"})
+    done.set()
+    for reader in readers:
+        reader.join()
+
+    assert not errors, errors[0]
+    assert len(index) == len(ITEMS) + 300
+    assert index.search("리필 299", limit=1) == ["라이터 리필 299"]
@@ -0,0 +1,45 @@
+# app/tests/test_blueprints.py
+import pytest
+
+for module in ("dotenv", "flask", "flask_sqlalchemy", "sqlalchemy", "pymysql", "redis", "numpy", "PIL", "rapidfuzz"):
+    pytest.importorskip(module)
+
+from flask import Flask
+
+# 블루프린트별 대표 경로 (register_blueprints 이후 앱에 있어야 함)
+EXPECTED_RULES = [
+    "/classify",
+    "/classify/jobs/<job_id>",
+    "/api/items/all",
+    "/api/admin/models",
+    "/metrics",
+    "/api/images/<int:image_id>",
+    "/api/health/ready",
+]
+
+
+@pytest.fixture(scope="module")
+def flask_app():
+    from config import Config
+
+    # 라우트 import 시 모델을 로드하지 않도록 합니다.
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(Config, "MODEL_LOAD_MODE", "lazy")
+        from app.routes.blueprints import register_blueprints
+
+    application = Flask(__name__)
+    register_blueprints(application)
+    return application
+
+
+def test_all_blueprints_registered(flask_app):
+    rules = {rule.rule for rule in flask_app.url_map.iter_rules()}
+    missing = [rule for rule in EXPECTED_RULES if rule not in rules]
+    assert not missing, f"routes not registered: {missing}"
+
+
+def test_register_is_idempotent(flask_app):
+    from app.routes.blueprints import BLUEPRINTS, register_blueprints
+
+    register_blueprints(flask_app)
+    assert set(flask_app.blueprints) == {blueprint.name for blueprint in BLUEPRINTS}
@@ -0,0 +1,102 @@
+# app/tests/test_classify_queue.py
+import json
+import time
+import pytest
+
+
+@pytest.fixture
+def queue(fake_redis):
+    from app.jobs.classify_queue import ClassifyJobQueue
+    return ClassifyJobQueue(redis_client=fake_redis, result_ttl=60)
+
+
+def test_enqueue_dequeue_done(queue, fake_redis):
+    from app.jobs.classify_queue import QUEUE_KEY, PROCESSING_KEY, UPLOAD_KEY
+
+    job_id = queue.enqueue(b"image-bytes", user_id="user-1", profile="fast")
+    assert queue.get_status(job_id) == {"job_id": job_id, "status": "queued"}
+    assert queue.get_user_id(job_id) == "user-1"
+    assert queue.get_profile(job_id) == "fast"
+
+    assert queue.dequeue("worker-a", timeout=1) == job_id
+    assert fake_redis.llen(QUEUE_KEY) == 0
+    assert fake_redis.lrange(PROCESSING_KEY.format(worker_id="worker-a"), 0, -1) == [job_id.encode()]
+    assert queue.get_upload(job_id) == b"image-bytes"
+
+    queue.mark_running(job_id)
+    assert queue.get_status(job_id)["status"] == "running"
+
+    queue.mark_done(job_id, {"results": [{"name_ko": "가위"}]})
+    queue.ack("worker-a", job_id)
+    assert queue.get_status(job_id) == {"job_id": job_id, "status": "done", "result": {"results": [{"name_ko": "가위"}]}}
+    assert fake_redis.llen(PROCESSING_KEY.format(worker_id="worker-a")) == 0
+    assert fake_redis.get(UPLOAD_KEY.format(job_id=job_id)) is None
+
+
+def test_dequeue_is_fifo_and_times_out(queue):
+    first = queue.enqueue(b"1", user_id="u")
+    second = queue.enqueue(b"2", user_id="u")
+    assert queue.dequeue("worker-a", timeout=1) == first
+    assert queue.dequeue("worker-a", timeout=1) == second
+    assert queue.dequeue("worker-a", timeout=1) is None
+
+
+def test_failed_status_keeps_status_code(queue):
+    job_id = queue.enqueue(b"x", user_id="u")
+    queue.mark_failed(job_id, "이미지를 읽을 수 없습니다.", 400)
+    status = queue.get_status(job_id)
+    assert status["status"] == "failed"
+    assert status["error"] == "이미지를 읽을 수 없습니다."
+    assert status["status_code"] == 400
+
+
+def test_unknown_job(queue):
+    assert queue.get_status("missing") is None
+
+
+def test_stale_worker_jobs_are_requeued(queue, fake_redis):
+    from app.jobs.classify_queue import WORKERS_KEY
+
+    job_id = queue.enqueue(b"x", user_id="u")
+    assert queue.dequeue("dead-worker", timeout=1) == job_id
+    # 하트비트가 오래전에 끊긴 워커
+    fake_redis.zadd(WORKERS_KEY, {"dead-worker": time.time() - 1000})
+    queue.heartbeat("live-worker")
+
+    assert queue.requeue_stale(stale_after=60) == 1
+    assert queue.get_status(job_id)["status"] == "queued"
+    assert queue.dequeue("live-worker", timeout=1) == job_id
+    assert fake_redis.zscore(WORKERS_KEY, "dead-worker") is None
+
+
+def test_job_fails_after_max_attempts(queue, fake_redis, monkeypatch):
+    from config import Config
+    from app.jobs.classify_queue import WORKERS_KEY
+
+    monkeypatch.setattr(Config, "CLASSIFY_JOB_MAX_ATTEMPTS", 2)
+    job_id = queue.enqueue(b"x", user_id="u")
+    for attempt in range(2):
+        assert queue.dequeue("crashing-worker", timeout=1) == job_id
+        fake_redis.zadd(WORKERS_KEY, {"crashing-worker": time.time() - 1000})
+        queue.requeue_stale(stale_after=60)
+
+    status = queue.get_status(job_id)
+    assert status["status"] == "failed"
+    assert status["status_code"] == 500
+    assert queue.dequeue("other-worker", timeout=1) is None
+
+
+def test_retire_returns_unfinished_jobs(queue):
+    job_id = queue.enqueue(b"x", user_id="u")
+    assert queue.dequeue("worker-a", timeout=1) == job_id
+    queue.retire("worker-a")
+    assert queue.dequeue("worker-b", timeout=1) == job_id
+
+
+def test_result_is_json(queue, fake_redis):
+    from app.jobs.classify_queue import JOB_KEY
+
+    job_id = queue.enqueue(b"x", user_id="u")
+    queue.mark_done(job_id, {"name": "보조배터리"})
+    stored = fake_redis.hget(JOB_KEY.format(job_id=job_id), "result")
+    assert json.loads(stored) == {"name": "보조배터리"}
@@ -0,0 +1,116 @@
+# app/tests/test_engine_parity.py
+"""
+ONNX 엔진이 PyTorch 엔진과 같은 결과를 내는지 확인합니다. (app.benchmarks.check_engine_parity와 같은 비교)
+실제 가중치 대신 yolov8n 구조의 작은 무작위 가중치 모델을 만들어 ONNX로 내보낸 뒤 비교합니다.
+torch / ultralytics / onnxruntime이 없으면 건너뜁니다.
+"""
+import pytest
+
+for module in ("dotenv", "PIL", "cv2", "onnx", "onnxruntime", "torch", "ultralytics"):
+    pytest.importorskip(module)
+
+import numpy as np
+import torch
+
+FIXTURE_SEED = 0
+IOU_MIN = 0.9
+CONF_TOL = 0.01
+# 무작위 가중치 모델은 점수가 낮으므로 낮은 임계값으로 비교합니다.
+CONF_THRESHOLD = 0.2
+SAMPLE_SIZES = ((640, 480), (1280, 720), (1920, 1440))
+
+
+@pytest.fixture(scope="module")
+def parity():
+    """check_engine_parity 모듈 (모델을 import 시점에 로드하지 않도록 lazy 모드로 import)"""
+    from config import Config
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(Config, "MODEL_LOAD_MODE", "lazy")
+        from app.benchmarks import check_engine_parity
+    return check_engine_parity
+
+
+@pytest.fixture(scope="module")
+def fixture_weights(tmp_path_factory):
+    """
+    yolov8n 구조의 무작위 가중치 .pt와 그 ONNX 내보내기 경로를 만듭니다. (다운로드 없음)
+    초기 가중치 그대로는 활성값이 0에 가까워 모든 점수가 같아지므로,
+    무작위 입력으로 BatchNorm 통계를 맞춰 이미지마다 점수가 다른 박스가 나오게 합니다.
+    """
+    from ultralytics import YOLO
+    from app.inference.export import export_onnx
+
+    torch.manual_seed(FIXTURE_SEED)
+    model = YOLO("yolov8n.yaml")
+    for module in model.model.modules():
+        if isinstance(module, torch.nn.BatchNorm2d):
+            module.reset_running_stats()
+            module.momentum = None  # 누적 평균
+    model.model.train()
+    with torch.no_grad():
+        for _ in range(4):
+            model.model(torch.rand(4, 3, 320, 320))
+    model.model.eval()
+
+    pt_path = tmp_path_factory.mktemp("weights") / "fixture.pt"
+    model.save(str(pt_path))
+    export_onnx(str(pt_path))
+    return str(pt_path)
+
+
+@pytest.fixture(scope="module")
+def engines(fixture_weights):
+    from app.inference.engines import load_engine
+    return load_engine(fixture_weights, "torch"), load_engine(fixture_weights, "onnx")
+
+
+@pytest.fixture(scope="module")
+def samples():
+    """
+    해상도가 다른 고정 시드 노이즈 이미지 (check_engine_parity.load_samples의 합성 이미지와 같은 분포)
+    무작위 모델은 실제 사진에서 점수가 포화되어 박스 순서가 정해지지 않으므로 사진은 사용하지 않습니다.
+    """
+    from app.imaging.decoded_image import DecodedImage
+
+    rng = np.random.default_rng(FIXTURE_SEED)
+    return [DecodedImage(rng.normal(128, 64, (height, width, 3)).clip(0, 255).astype(np.uint8))
+            for width, height in SAMPLE_SIZES]
+
+
+def test_raw_forward_matches(engines):
+    reference, candidate = engines
+    torch.manual_seed(FIXTURE_SEED)
+    batch = torch.rand(2, 3, 320, 320)
+    ref = reference.forward(batch).float().cpu()
+    cand = candidate.forward(batch).float().cpu()
+    assert ref.shape == cand.shape
+    # 박스 좌표(픽셀)와 클래스 점수를 따로 비교합니다.
+    assert torch.allclose(ref[:, :4], cand[:, :4], atol=0.5, rtol=1e-3)
+    assert torch.allclose(ref[:, 4:], cand[:, 4:], atol=1e-3)
+
+
+def test_sku_detections_match(parity, engines, samples):
+    reference, candidate = engines
+    assert any(len(parity.detect(reference, image, CONF_THRESHOLD)[0]) for image in samples), \
+        "fixture model produced no boxes; comparison would be vacuous"
+    assert parity.compare_sku(reference, candidate, samples, IOU_MIN, CONF_TOL, CONF_THRESHOLD) == 0
+
+
+def test_yolo_crop_classification_matches(parity, engines, samples):
+    reference, candidate = engines
+    assert parity.compare_yolo(reference, candidate, reference, samples, CONF_TOL, CONF_THRESHOLD) == 0
+
+
+def test_letterboxed_batch_matches(parity, engines, samples):
+    from app.yolo.detect import classify_batch
+
+    reference, candidate = engines
+    image = samples[-1]
+    width, height = image.width, image.height
+    crops = [[0, 0, width // 2, height // 2], [width // 4, height // 4, width, height], [0, 0, width, height]]
+    batch = np.stack([parity.letterbox(image.crop(bbox), parity.YOLO_CROP_IMGSZ) for bbox in crops])
+    ref_conf, ref_cls = classify_batch(reference, batch)
+    cand_conf, cand_cls = classify_batch(candidate, batch)
+    assert torch.equal(ref_cls, cand_cls)
+    assert float((ref_conf - cand_conf).abs().max()) <= CONF_TOL
@@ -0,0 +1,34 @@
+# app/tests/test_health.py
+import pytest
+
+for module in ("dotenv", "flask", "flask_sqlalchemy", "sqlalchemy", "pymysql", "redis", "numpy", "PIL", "rapidfuzz"):
+    pytest.importorskip(module)
+
+
+class _DownRedis:
+    def ping(self):
+        raise ConnectionError("Redis is down")
+
+
+@pytest.fixture
+def health(monkeypatch):
+    from config import Config
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(Config, "MODEL_LOAD_MODE", "lazy")
+        from app.routes import health
+    monkeypatch.setattr(health, "get_redis", lambda: _DownRedis())
+    return health
+
+
+def test_redis_outage_is_degraded_for_sync_classify(health, monkeypatch):
+    from config import Config
+    monkeypatch.setattr(Config, "CLASSIFY_ASYNC", False)
+    assert health._check_redis() == "degraded"
+    assert "degraded" not in health.NOT_READY_STATES
+
+
+def test_redis_outage_fails_readiness_in_async_mode(health, monkeypatch):
+    from config import Config
+    monkeypatch.setattr(Config, "CLASSIFY_ASYNC", True)
+    assert health._check_redis() == "failed"
@@ -0,0 +1,42 @@
+# app/tests/test_import_budget.py
+"""
+라우트 모듈 import 시간 예산 검사 (app.benchmarks.check_import_budget과 같은 검사)
+예산은 IMPORT_BUDGET_MS 환경 변수로 바꿀 수 있습니다. (기본 1500ms)
+"""
+import os
+import pytest
+from pathlib import Path
+
+# 라우트 모듈이 import하는 의존성이 없으면 측정할 수 없으므로 건너뜁니다.
+for module in ("dotenv", "flask", "flask_sqlalchemy", "sqlalchemy", "pymysql", "redis", "numpy", "PIL", "rapidfuzz"):
+    pytest.importorskip(module)
+
+from app.benchmarks.check_import_budget import APP_MODULES, FORBIDDEN_MODULES, measure_import
+
+APP_DIR = Path(__file__).resolve().parents[1]
+BACKEND_DIR = APP_DIR.parent if APP_DIR.name == "app" else APP_DIR.parent / "backend"
+BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS") or 1500)
+
+# 측정 프로세스에서도 conftest와 같이 이 디렉토리를 app 패키지로 사용합니다.
+SETUP = f"""
+import types
+sys.path.insert(0, {str(BACKEND_DIR)!r})
+app_package = types.ModuleType("app")
+app_package.__path__ = [{str(APP_DIR)!r}]
+sys.modules["app"] = app_package
+"""
+
+
+@pytest.fixture(scope="module")
+def results():
+    return [measure_import(APP_MODULES, FORBIDDEN_MODULES, setup=SETUP, cwd=str(BACKEND_DIR)) for _ in range(3)]
+
+
+def test_no_heavy_modules_at_import(results):
+    loaded = sorted({module for result in results for module in result["loaded"]})
+    assert not loaded, f"heavy modules loaded at import time: {loaded}"
+
+
+def test_import_time_within_budget(results):
+    best_ms = min(result["elapsed_ms"] for result in results)
+    assert best_ms <= BUDGET_MS, f"import time {best_ms:.0f} ms exceeds budget {BUDGET_MS:.0f} ms"
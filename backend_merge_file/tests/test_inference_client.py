@@ -0,0 +1,34 @@
+# app/tests/test_inference_client.py
+import pytest
+
+for module in ("dotenv", "numpy", "PIL"):
+    pytest.importorskip(module)
+
+import numpy as np
+
+
+@pytest.fixture
+def image():
+    from app.imaging.decoded_image import DecodedImage
+    return DecodedImage(np.zeros((32, 48, 3), dtype=np.uint8))
+
+
+def test_unreachable_daemon_raises(image, tmp_path, monkeypatch):
+    from config import Config
+    from app.inference import client
+
+    monkeypatch.setattr(Config, "INFERENCE_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+    with pytest.raises(client.InferenceDaemonError):
+        client.predict_bbox_with_sku(image)
+    with pytest.raises(client.InferenceDaemonError):
+        client.predict_name_with_yolo(image, [[0, 0, 10, 10]])
+
+
+def test_predict_name_forwards_batching_options(image, monkeypatch):
+    from app.inference import client
+
+    sent = []
+    monkeypatch.setattr(client, "call_daemon", lambda message: sent.append(message) or [])
+    client.predict_name_with_yolo(image, [[0, 0, 10, 10]], batched=False, max_batch_size=4, crop_imgsz=320)
+    assert {key: sent[0][key] for key in ("batched", "max_batch_size", "crop_imgsz")} == \
+        {"batched": False, "max_batch_size": 4, "crop_imgsz": 320}
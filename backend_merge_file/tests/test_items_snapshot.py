@@ -0,0 +1,160 @@
+# app/tests/test_items_snapshot.py
+"""
+/api/items/all 스냅샷의 ETag/304, ?since= 증분 조회와 변경 반영을 확인합니다.
+items 테이블과 버전 트리거는 메모리 카탈로그로 대신합니다. (MySQL 불필요)
+"""
+import gzip
+import json
+from contextlib import nullcontext
+import pytest
+
+for module in ("dotenv", "flask", "flask_sqlalchemy", "sqlalchemy", "pymysql", "redis", "numpy", "PIL", "rapidfuzz"):
+    pytest.importorskip(module)
+
+from flask import Flask
+
+
+def _item(item_id, name_en, row_version):
+    return {"id": item_id, "item_name": name_en, "item_name_EN": name_en, "carry_on_allowed": "예",
+            "checked_baggage_allowed": "예", "notes": None, "notes_EN": None, "source": None,
+            "row_version": row_version}
+
+
+class _Catalog:
+    """items 행과 삭제 기록을 버전과 함께 보관하는 메모리 카탈로그 (트리거처럼 변경마다 버전 증가)"""
+
+    def __init__(self):
+        self.version = 0
+        self.rows = {}
+        self.removed = {}
+        self.reads = []
+
+    def upsert(self, item_id, name_en):
+        self.version += 1
+        self.rows[item_id] = _item(item_id, name_en, self.version)
+        self.removed.pop(item_id, None)
+
+    def delete(self, item_id):
+        self.version += 1
+        del self.rows[item_id]
+        self.removed[item_id] = self.version
+
+    def changes(self, conn, since_version=None):
+        self.reads.append(since_version)
+        since = since_version or 0
+        return {
+            "version": self.version,
+            "rows": [dict(row) for item_id, row in sorted(self.rows.items()) if row["row_version"] > since],
+            "removed": {item_id: version for item_id, version in self.removed.items() if version > since},
+        }
+
+
+class _Engine:
+    class _Connection:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def begin(self):
+            return nullcontext()
+
+    def connect(self):
+        return self._Connection()
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    from app.cache import items_snapshot as module
+
+    catalog = _Catalog()
+    catalog.upsert(1, "knife")
+    catalog.upsert(2, "scissors")
+    monkeypatch.setattr(module, "get_engine", lambda: _Engine())
+    monkeypatch.setattr(module, "fetch_catalog_version", lambda conn: catalog.version)
+    monkeypatch.setattr(module, "fetch_catalog_changes", catalog.changes)
+    return catalog
+
+
+@pytest.fixture
+def snapshot(catalog):
+    from app.cache.items_snapshot import ItemsSnapshot
+    return ItemsSnapshot()
+
+
+@pytest.fixture
+def client(snapshot):
+    from config import Config
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(Config, "MODEL_LOAD_MODE", "lazy")
+        from app.routes import items
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(items, "items_snapshot", snapshot)
+        application = Flask(__name__)
+        application.register_blueprint(items.items_bp)
+        yield application.test_client()
+
+
+def test_snapshot_encodes_body_once(snapshot):
+    current = snapshot.get()
+    assert current.etag == "items-v2"
+    assert [item["item_name_EN"] for item in json.loads(current.body)] == ["knife", "scissors"]
+    assert "row_version" not in json.loads(current.body)[0]
+    assert gzip.decompress(current.encoded["gzip"]) == current.body
+    assert snapshot.get() is current
+
+
+def test_stale_snapshot_reads_only_changes(snapshot, catalog):
+    first = snapshot.get()
+    catalog.upsert(3, "lighter")
+    catalog.delete(1)
+    snapshot.mark_stale()
+
+    second = snapshot.get()
+    assert catalog.reads == [None, 2]
+    assert second.version == 4 and second.etag == "items-v4"
+    assert sorted(second.rows) == [2, 3]
+    assert second.delta(first.version) == {
+        "version": 4,
+        "since": 2,
+        "items": [{key: value for key, value in _item(3, "lighter", 3).items() if key != "row_version"}],
+        "removed_ids": [1],
+    }
+
+    # 버전이 그대로면 스냅샷을 다시 만들지 않습니다.
+    snapshot.mark_stale()
+    assert snapshot.get() is second
+
+
+def test_route_returns_304_for_current_etag(client):
+    response = client.get("/api/items/all", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["X-Items-Version"] == "2"
+    assert len(json.loads(gzip.decompress(response.data))) == 2
+
+    etag = response.headers["ETag"]
+    assert etag == 'W/"items-v2"'
+    response = client.get("/api/items/all", headers={"If-None-Match": etag})
+    assert response.status_code == 304 and response.data == b""
+
+
+def test_route_returns_delta_since_version(client, snapshot, catalog):
+    client.get("/api/items/all")
+    catalog.upsert(2, "scissors (blade < 6cm)")
+    snapshot.mark_stale()
+
+    response = client.get("/api/items/all?since=2")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["version"] == 3 and body["removed_ids"] == []
+    assert [item["item_name_EN"] for item in body["items"]] == ["scissors (blade < 6cm)"]
+
+    # 이전 ETag로는 304가 아닌 새 목록을 받습니다.
+    response = client.get("/api/items/all", headers={"If-None-Match": 'W/"items-v2"'})
+    assert response.status_code == 200 and response.headers["ETag"] == 'W/"items-v3"'
+
+    assert client.get("/api/items/all?since=abc").status_code == 400
@@ -0,0 +1,116 @@
+# app/tests/test_micro_batcher.py
+import threading
+import pytest
+
+pytest.importorskip("dotenv")
+
+
+@pytest.fixture(autouse=True)
+def batching(monkeypatch):
+    from config import Config
+    monkeypatch.setattr(Config, "MICRO_BATCHING", True)
+    monkeypatch.setattr(Config, "MICRO_BATCH_TIMEOUT", 5)
+
+
+def _batcher(run_batch, max_batch_size=4, max_wait_ms=50):
+    from app.inference.batcher import MicroBatcher
+    return MicroBatcher("test", run_batch, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+
+def _submit_concurrently(batcher, requests):
+    """[(key, items)]를 동시에 제출하고 요청 순서대로 결과(또는 예외)를 반환합니다."""
+    outcomes = [None] * len(requests)
+    start = threading.Barrier(len(requests))
+
+    def run(index, key, items):
+        start.wait()
+        try:
+            outcomes[index] = batcher.submit(key, items)
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=run, args=(i, key, items)) for i, (key, items) in enumerate(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_concurrent_requests_are_grouped_by_key():
+    calls = []
+
+    def run_batch(key, items):
+        calls.append((key, list(items)))
+        return [item.upper() for item in items]
+
+    batcher = _batcher(run_batch, max_batch_size=8, max_wait_ms=200)
+    outcomes = _submit_concurrently(batcher, [("a", ["a1", "a2"]), ("b", ["b1"]), ("a", ["a3"])])
+
+    assert outcomes == [["A1", "A2"], ["B1"], ["A3"]]
+    # 같은 key의 입력끼리만 한 배치로 묶입니다.
+    assert all(item.startswith(key) for key, items in calls for item in items)
+    assert sorted(item for key, items in calls if key == "a" for item in items) == ["a1", "a2", "a3"]
+
+
+def test_batches_are_split_at_max_batch_size():
+    sizes = []
+
+    def run_batch(key, items):
+        sizes.append(len(items))
+        return list(items)
+
+    batcher = _batcher(run_batch, max_batch_size=3)
+    assert batcher.submit("k", list(range(7))) == list(range(7))
+    assert max(sizes) <= 3
+
+
+def test_batch_error_reaches_every_request():
+    def run_batch(key, items):
+        raise ValueError("model failed")
+
+    batcher = _batcher(run_batch, max_wait_ms=100)
+    outcomes = _submit_concurrently(batcher, [("k", [1]), ("k", [2])])
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+
+
+def test_short_batch_result_is_an_error():
+    batcher = _batcher(lambda key, items: list(items)[:-1])
+    with pytest.raises(RuntimeError):
+        batcher.submit("k", [1, 2])
+    with pytest.raises(RuntimeError):
+        batcher.run_now("k", [1, 2])
+
+
+def test_wait_is_bounded(monkeypatch):
+    from config import Config
+
+    release = threading.Event()
+
+    def run_batch(key, items):
+        release.wait(5)
+        return list(items)
+
+    monkeypatch.setattr(Config, "MICRO_BATCH_TIMEOUT", 0.2)
+    batcher = _batcher(run_batch, max_wait_ms=1)
+    try:
+        with pytest.raises(TimeoutError):
+            batcher.submit("k", [1])
+    finally:
+        release.set()
+
+
+def test_dead_thread_is_restarted():
+    batcher = _batcher(lambda key, items: list(items), max_wait_ms=1)
+    assert batcher.submit("k", [1]) == [1]
+
+    # 배치 스레드가 끝났지만 _thread는 남아 있는 상태를 만듭니다.
+    batcher._loop = lambda: None
+    batcher._thread = None
+    batcher._ensure_thread()
+    batcher._thread.join(1)
+    assert not batcher._thread.is_alive()
+    del batcher._loop
+
+    assert batcher.submit("k", [2]) == [2]
+    assert batcher._thread.is_alive()
@@ -0,0 +1,210 @@
+# app/tests/test_migrations.py
+"""
+마이그레이션 DDL과 자주 실행되는 조회의 실행 계획을 일회용 MySQL DB에서 확인합니다. (스테이징 DB 불필요)
+TEST_MYSQL_URL(예: mysql+pymysql://root:pw@127.0.0.1:3306)이 없으면 건너뜁니다.
+테스트마다 임의 이름의 데이터베이스를 만들고 끝나면 지웁니다.
+"""
+import importlib
+import os
+import uuid
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("pymysql")
+pytest.importorskip("flask_sqlalchemy")
+sqlalchemy = pytest.importorskip("sqlalchemy")
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+TEST_MYSQL_URL = os.environ.get("TEST_MYSQL_URL")
+pytestmark = pytest.mark.skipif(not TEST_MYSQL_URL, reason="TEST_MYSQL_URL이 설정되지 않았습니다.")
+
+# v0001 이전의 스키마 (마이그레이션을 도입하기 전 배포된 DB)
+LEGACY_SCHEMA = [
+    """
+    CREATE TABLE `items` (
+      `id` INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+      `item_name` VARCHAR(255) NOT NULL,
+      `carry_on_allowed` TEXT,
+      `checked_baggage_allowed` TEXT,
+      `notes` TEXT,
+      `item_name_EN` VARCHAR(255) NOT NULL UNIQUE,
+      `notes_EN` TEXT,
+      `source` TEXT
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """,
+    """
+    CREATE TABLE `images` (
+      `image_id` INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+      `user_id` VARCHAR(255) NOT NULL,
+      `image_data` LONGBLOB NOT NULL,
+      `created_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+      `width` INT,
+      `height` INT
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """,
+    """
+    CREATE TABLE `detected_items` (
+      `item_id` INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+      `image_id` INT NOT NULL,
+      `item_name_EN` VARCHAR(255) NOT NULL,
+      `item_name` VARCHAR(255) NOT NULL,
+      `bbox_x_min` FLOAT NOT NULL,
+      `bbox_y_min` FLOAT NOT NULL,
+      `bbox_x_max` FLOAT NOT NULL,
+      `bbox_y_max` FLOAT NOT NULL,
+      `packing_info` ENUM('carry_on','checked','both','none') DEFAULT 'none' NOT NULL,
+      FOREIGN KEY (`image_id`) REFERENCES `images`(`image_id`) ON DELETE CASCADE,
+      FOREIGN KEY (`item_name_EN`) REFERENCES `items`(`item_name_EN`) ON UPDATE CASCADE
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """,
+    """
+    CREATE TABLE `detection_result_cache` (
+      `cache_key` CHAR(64) NOT NULL PRIMARY KEY,
+      `content_hash` CHAR(64) NOT NULL,
+      `image_id` INT,
+      `payload` LONGTEXT NOT NULL,
+      `created_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+      `last_hit_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+      INDEX `idx_detection_result_cache_last_hit` (`last_hit_at`),
+      FOREIGN KEY (`image_id`) REFERENCES `images`(`image_id`) ON DELETE SET NULL
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """,
+]
+
+LEGACY_ITEMS = [
+    {"item_name": "칼", "item_name_EN": "knife", "carry_on_allowed": "불가", "checked_baggage_allowed": "가능"},
+    {"item_name": "가위", "item_name_EN": "scissors", "carry_on_allowed": "조건부", "checked_baggage_allowed": "가능"},
+    {"item_name": "라이터", "item_name_EN": "lighter", "carry_on_allowed": "1개", "checked_baggage_allowed": "불가"},
+]
+
+
+@pytest.fixture
+def engine():
+    """빈 일회용 데이터베이스에 연결된 엔진"""
+    server = create_engine(TEST_MYSQL_URL)
+    name = f"passcheckers_test_{uuid.uuid4().hex[:12]}"
+    with server.begin() as conn:
+        conn.execute(text(f"CREATE DATABASE `{name}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"))
+    engine = create_engine(make_url(TEST_MYSQL_URL).set(database=name))
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+        with server.begin() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS `{name}`"))
+        server.dispose()
+
+
+@pytest.fixture
+def legacy_engine(engine):
+    """마이그레이션 전 스키마와 기존 행이 들어 있는 DB"""
+    with engine.begin() as conn:
+        for ddl in LEGACY_SCHEMA:
+            conn.execute(text(ddl))
+        conn.execute(text("""
+            INSERT INTO items (item_name, item_name_EN, carry_on_allowed, checked_baggage_allowed)
+            VALUES (:item_name, :item_name_EN, :carry_on_allowed, :checked_baggage_allowed)
+        """), LEGACY_ITEMS)
+        conn.execute(text("INSERT INTO images (user_id, image_data, width, height) VALUES ('u', 'x', 640, 480)"))
+        conn.execute(text("""
+            INSERT INTO detected_items (image_id, item_name_EN, item_name, bbox_x_min, bbox_y_min, bbox_x_max, bbox_y_max)
+            VALUES (1, 'knife', '칼', 0, 0, 10, 10), (1, 'lighter', '라이터', 5, 5, 20, 20)
+        """))
+    return engine
+
+
+def _scalar(conn, sql, **params):
+    return conn.execute(text(sql), params).scalar()
+
+
+def test_migrations_upgrade_legacy_schema(legacy_engine):
+    from app.db import migrate
+
+    executed = migrate.migrate(engine=legacy_engine)
+    assert executed == [version for version, _ in migrate.discover_migrations()]
+
+    with legacy_engine.connect() as conn:
+        for table, column in (("detected_items", "model_version"), ("detected_items", "regulation_item_id"),
+                              ("images", "blob_key"), ("images", "byte_size"), ("images", "content_type"),
+                              ("items", "row_version")):
+            assert migrate.column_exists(conn, table, column), f"{table}.{column}"
+        for table, column in (("detected_items", "image_id"), ("detected_items", "regulation_item_id"),
+                              ("items", "item_name_EN"), ("items", "item_name"), ("items", "row_version"),
+                              ("detection_result_cache", "created_at")):
+            assert migrate.leading_index_exists(conn, table, column), f"{table}({column})"
+        assert migrate.foreign_key_exists(conn, "detected_items", "fk_detected_items_regulation_item")
+        triggers = set(conn.execute(text(
+            "SELECT TRIGGER_NAME FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = DATABASE()"
+        )).scalars())
+        assert triggers == {"items_version_before_insert", "items_version_before_update", "items_version_after_delete"}
+
+        # v0005: 이름으로 규정 행을 연결
+        linked = dict(conn.execute(text("""
+            SELECT d.item_name, i.item_name_EN FROM detected_items d JOIN items i ON i.id = d.regulation_item_id
+        """)).fetchall())
+        assert linked == {"칼": "knife", "라이터": "lighter"}
+
+        # v0006: 기존 행도 증분 조회(since=0)에 포함되도록 버전이 채워짐
+        version = _scalar(conn, "SELECT version FROM items_catalog_version WHERE id = 1")
+        assert version >= 1
+        assert _scalar(conn, "SELECT COUNT(*) FROM items WHERE row_version = 0") == 0
+        assert _scalar(conn, "SELECT MAX(row_version) FROM items") == version
+
+    # 다시 실행해도 적용할 것이 없고, 각 단계를 직접 다시 실행해도 실패하지 않습니다.
+    assert migrate.migrate(engine=legacy_engine) == []
+    for _, name in migrate.discover_migrations():
+        importlib.import_module(f"app.db.migrations.{name}").upgrade(legacy_engine)
+
+
+def test_catalog_triggers_track_changes(legacy_engine, monkeypatch):
+    from app.db import database
+    from app.db.migrate import migrate
+
+    # 마이그레이션 전에는 버전 없이 전체 목록을 반환합니다.
+    monkeypatch.setattr(database, "_catalog_versioned", False)
+    with legacy_engine.connect() as conn:
+        changes = database.fetch_catalog_changes(conn, since_version=5)
+    assert changes["version"] is None
+    assert [row["item_name_EN"] for row in changes["rows"]] == ["knife", "scissors", "lighter"]
+
+    migrate(engine=legacy_engine)
+    with legacy_engine.begin() as conn:
+        start = database.fetch_catalog_version(conn)
+        assert len(database.fetch_catalog_changes(conn, since_version=0)["rows"]) == len(LEGACY_ITEMS)
+
+        conn.execute(text("INSERT INTO items (item_name, item_name_EN) VALUES ('우산', 'umbrella')"))
+        conn.execute(text("UPDATE items SET notes = '1개까지' WHERE item_name_EN = 'lighter'"))
+        conn.execute(text("DELETE FROM items WHERE item_name_EN = 'scissors'"))
+
+        changes = database.fetch_catalog_changes(conn, since_version=start)
+    assert changes["version"] == start + 3
+    assert sorted(row["item_name_EN"] for row in changes["rows"]) == ["lighter", "umbrella"]
+    assert list(changes["removed"].values()) == [start + 3]
+
+
+def test_hot_queries_use_indexes(legacy_engine):
+    from app.db.migrate import migrate
+    from app.benchmarks.check_query_plans import HOT_QUERIES, explain
+
+    migrate(engine=legacy_engine)
+    # 행이 거의 없으면 옵티마이저가 전체 스캔을 고르므로 실제와 비슷한 규모로 채웁니다.
+    with legacy_engine.begin() as conn:
+        conn.execute(text("INSERT INTO items (item_name, item_name_EN) VALUES (:ko, :en)"),
+                     [{"ko": f"품목{i}", "en": f"item-{i}"} for i in range(3000)])
+        conn.execute(text("INSERT INTO images (user_id, blob_key, width, height) VALUES (:user_id, :key, 640, 480)"),
+                     [{"user_id": f"user-{i % 50}", "key": f"{i:064x}"} for i in range(500)])
+        conn.execute(text("""
+            INSERT INTO detected_items (image_id, item_name_EN, item_name, bbox_x_min, bbox_y_min, bbox_x_max,
+                                        bbox_y_max, regulation_item_id)
+            VALUES (:image_id, 'knife', '칼', 0, 0, 1, 1, 1)
+        """), [{"image_id": 2 + i % 500} for i in range(5000)])
+        conn.execute(text("INSERT INTO detection_result_cache (cache_key, content_hash, payload) VALUES (:key, :key, '{}')"),
+                     [{"key": f"{i:064x}"} for i in range(3000)])
+        for table in ("items", "images", "detected_items", "detection_result_cache"):
+            conn.execute(text(f"ANALYZE TABLE `{table}`"))
+
+    with legacy_engine.connect() as conn:
+        for name, sql, params in HOT_QUERIES:
+            scans = [row for row in explain(conn, sql, params) if row.get("type") == "ALL"]
+            assert not scans, f"{name}: full table scan on {[row.get('table') for row in scans]}"
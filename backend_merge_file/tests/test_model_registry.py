@@ -0,0 +1,67 @@
+# app/tests/test_model_registry.py
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """가중치 파일 없이 로드가 항상 실패하는 레지스트리 (load_engine 호출 수를 셉니다)"""
+    from config import Config
+    from app.inference import registry as registry_module
+
+    attempts = []
+
+    def broken_engine(path, engine_name):
+        attempts.append(path)
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(Config, "MODEL_LOAD_MODE", "lazy")
+    monkeypatch.setattr(Config, "MODEL_REGISTRY_DIR", None)
+    monkeypatch.setattr(registry_module, "load_engine", broken_engine)
+    registry = registry_module.ModelRegistry()
+    registry.register("sku")
+    registry.attempts = attempts
+    return registry
+
+
+def test_failed_load_is_not_retried_on_every_request(registry, monkeypatch):
+    from config import Config
+    monkeypatch.setattr(Config, "MODEL_LOAD_RETRY_INTERVAL", 60)
+
+    for _ in range(3):
+        with registry.acquire("sku") as handle:
+            assert handle is None
+    with registry.pin() as versions:
+        assert versions == {}
+    assert len(registry.attempts) == 1
+    assert registry.state("sku") == "failed"
+
+
+def test_failed_load_is_retried_after_interval(registry, monkeypatch):
+    from config import Config
+
+    monkeypatch.setattr(Config, "MODEL_LOAD_RETRY_INTERVAL", 60)
+    with registry.acquire("sku"):
+        pass
+    # 마지막 실패가 재시도 간격보다 오래전인 것으로 만듭니다.
+    registry._failed_at["sku"] -= 61
+    with registry.acquire("sku"):
+        pass
+    with registry.acquire("sku"):
+        pass
+    assert len(registry.attempts) == 2
+
+
+def test_explicit_load_always_retries(registry, monkeypatch):
+    from config import Config
+    monkeypatch.setattr(Config, "MODEL_LOAD_RETRY_INTERVAL", 0)
+
+    with registry.acquire("sku"):
+        pass
+    with registry.acquire("sku"):
+        pass
+    with pytest.raises(FileNotFoundError):
+        registry.load("sku")
+    assert len(registry.attempts) == 2
@@ -0,0 +1,181 @@
+# app/tests/test_result_cache.py
+"""
+탐지 결과 캐시의 적중/미스와, 추론이 정상 수행되지 않은 결과를 캐시하지 않는지 확인합니다.
+DB 캐시 테이블은 메모리 dict로 대신하고 Redis는 fakeredis를 사용합니다. (MySQL 불필요)
+"""
+import io
+from contextlib import contextmanager
+import pytest
+
+for module in ("dotenv", "flask", "flask_sqlalchemy", "sqlalchemy", "pymysql", "numpy", "PIL", "rapidfuzz"):
+    pytest.importorskip(module)
+
+from PIL import Image
+
+
+@pytest.fixture
+def cache_table(monkeypatch):
+    """detection_result_cache 테이블 대신 사용할 {cache_key: {image_id, payload}}"""
+    from app.cache import detection_cache
+
+    table = {}
+    monkeypatch.setattr(detection_cache, "fetch_cached_result", lambda conn, key, ttl: table.get(key))
+    monkeypatch.setattr(detection_cache, "insert_cached_result",
+                        lambda conn, key, image_hash, image_id, payload:
+                        table.__setitem__(key, {"image_id": image_id, "payload": payload}))
+    monkeypatch.setattr(detection_cache, "delete_cached_result", lambda conn, key: table.pop(key, None))
+    monkeypatch.setattr(detection_cache, "prune_cached_results", lambda conn, ttl, max_entries: None)
+    return table
+
+
+@pytest.fixture
+def cache(fake_redis, cache_table):
+    from app.cache.detection_cache import DetectionResultCache
+    return DetectionResultCache(redis_client=fake_redis)
+
+
+def test_miss_then_hit(cache, fake_redis):
+    from app.cache.detection_cache import RESULT_KEY
+
+    key = cache.build_key("a" * 64, profile="accurate")
+    assert cache.get(None, key) is None
+
+    cache.put(None, key, "a" * 64, 7, {"results": [{"name_en": "knife"}]})
+    assert fake_redis.exists(RESULT_KEY.format(cache_key=key))
+    assert cache.get(None, key) == {"image_id": 7, "payload": {"results": [{"name_en": "knife"}]}}
+
+
+def test_db_hit_refills_redis(cache, fake_redis):
+    from app.cache.detection_cache import RESULT_KEY
+
+    key = cache.build_key("b" * 64, profile="fast")
+    cache.put(None, key, "b" * 64, 3, {"results": []})
+    fake_redis.flushall()
+
+    assert cache.get(None, key)["image_id"] == 3
+    assert fake_redis.exists(RESULT_KEY.format(cache_key=key))
+
+
+def test_prune_runs_every_n_puts_on_its_own_connection(cache, monkeypatch):
+    import threading
+    from types import SimpleNamespace
+    from config import Config
+    from app.cache import detection_cache
+
+    pruned = []
+    done = threading.Event()
+
+    @contextmanager
+    def begin():
+        yield "prune-conn"
+
+    def prune(conn, ttl, max_entries):
+        pruned.append(conn)
+        done.set()
+
+    monkeypatch.setattr(Config, "RESULT_CACHE_PRUNE_EVERY", 3)
+    monkeypatch.setattr(detection_cache, "get_engine", lambda: SimpleNamespace(begin=begin))
+    monkeypatch.setattr(detection_cache, "prune_cached_results", prune)
+
+    for index in range(2):
+        cache.put("upload-conn", f"key-{index}", "d" * 64, index, {"results": []})
+    assert not done.wait(0.1)
+    cache.put("upload-conn", "key-2", "d" * 64, 2, {"results": []})
+    assert done.wait(5)
+    assert pruned == ["prune-conn"]
+
+
+def test_key_depends_on_profile(cache):
+    assert cache.build_key("c" * 64, profile="fast") != cache.build_key("c" * 64, profile="accurate")
+
+
+@pytest.fixture
+def classify(monkeypatch, fake_redis, cache_table):
+    """모델/DB 없이 _process_upload를 실행할 수 있도록 저장 함수와 모델 호출을 바꾼 classify 모듈"""
+    from config import Config
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(Config, "MODEL_LOAD_MODE", "lazy")
+        from app.routes import classify
+    from app.cache.detection_cache import DetectionResultCache
+
+    @contextmanager
+    def pin_models():
+        yield {"sku": "test", "yolo": "test"}
+
+    image_ids = iter(range(1, 100))
+    monkeypatch.setattr(Config, "RESULT_CACHE_ENABLED", True)
+    monkeypatch.setattr(classify, "detection_cache", DetectionResultCache(redis_client=fake_redis))
+    monkeypatch.setattr(classify, "pin_models", pin_models)
+    monkeypatch.setattr(classify, "insert_image", lambda conn, **kwargs: next(image_ids))
+    monkeypatch.setattr(classify, "insert_detected_items", lambda conn, rows: list(range(len(rows))))
+    monkeypatch.setattr(classify.regulation_table, "lookup", lambda class_id, name: None)
+    monkeypatch.setattr(classify, "fetch_item_info", lambda name: None)
+    return classify
+
+
+def _upload_bytes():
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), (200, 10, 10)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _run(classify):
+    from app.inference.profiles import get_profile
+    return classify._process_upload(None, _upload_bytes(), "user-1", get_profile("fast"))
+
+
+def test_successful_result_is_cached_and_reused(classify, cache_table, monkeypatch):
+    monkeypatch.setattr(classify, "predict_bbox_with_sku", lambda image, **kwargs: [[0, 0, 32, 24]])
+    monkeypatch.setattr(classify, "predict_name_with_yolo", lambda image, bboxes, **kwargs: [
+        {"name": "knife", "class_id": 0, "bbox": bboxes[0], "confidence": 0.9}])
+
+    first = _run(classify)
+    assert first["cached"] is False
+    assert len(cache_table) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached upload must not run inference")
+
+    monkeypatch.setattr(classify, "predict_bbox_with_sku", fail)
+    second = _run(classify)
+    assert second["cached"] is True
+    assert [result["name_en"] for result in second["results"]] == [result["name_en"] for result in first["results"]]
+    assert second["image_id"] != first["image_id"]
+
+
+def test_failed_inference_is_not_cached(classify, cache_table, monkeypatch):
+    from app.inference.outcome import record_failure
+
+    def sku_down(image, **kwargs):
+        # app.sku.detect가 모델 미로드/예외 시 하는 것처럼 빈 결과를 반환합니다.
+        record_failure("sku", "model not loaded")
+        return []
+
+    monkeypatch.setattr(classify, "predict_bbox_with_sku", sku_down)
+    monkeypatch.setattr(classify, "predict_name_with_yolo", lambda image, bboxes, **kwargs: [])
+
+    payload = _run(classify)
+    assert payload["results"] == [] and payload["cached"] is False
+    assert cache_table == {}
+
+    # 다음 업로드는 캐시가 아닌 추론으로 처리됩니다.
+    monkeypatch.setattr(classify, "predict_bbox_with_sku", lambda image, **kwargs: [[0, 0, 32, 24]])
+    monkeypatch.setattr(classify, "predict_name_with_yolo", lambda image, bboxes, **kwargs: [
+        {"name": "knife", "class_id": 0, "bbox": bboxes[0], "confidence": 0.9}])
+    payload = _run(classify)
+    assert payload["cached"] is False and len(payload["results"]) == 1
+    assert len(cache_table) == 1
+
+
+def test_daemon_error_fails_without_caching(classify, cache_table, monkeypatch):
+    from app.inference.client import InferenceDaemonError
+
+    def daemon_down(image, **kwargs):
+        raise InferenceDaemonError("Inference daemon unavailable")
+
+    monkeypatch.setattr(classify, "predict_bbox_with_sku", daemon_down)
+    with pytest.raises(classify.ClassifyError) as error:
+        _run(classify)
+    assert error.value.status_code == 503
+    assert cache_table == {}
@@ -0,0 +1,94 @@
+# app/tests/test_sku_tiling.py
+"""
+타일 탐지 여부 결정, 타일 수 제한, 타일 경계 박스 병합을 stub_models의 대체 탐지 모델로 확인합니다.
+"""
+import pytest
+
+for module in ("dotenv", "numpy", "cv2", "torch"):
+    pytest.importorskip(module)
+
+import numpy as np
+
+
+@pytest.fixture
+def image():
+    from app.imaging.decoded_image import DecodedImage
+    return DecodedImage(np.zeros((3024, 4032, 3), dtype=np.uint8))
+
+
+def test_tiling_is_opt_in(image, monkeypatch):
+    from config import Config
+    from app.sku.tiling import should_tile
+
+    monkeypatch.setattr(Config, "SKU_TILING", "off")
+    assert not should_tile(image)
+    monkeypatch.setattr(Config, "SKU_TILING", "on")
+    assert should_tile(image)
+
+    monkeypatch.setattr(Config, "SKU_TILING", "auto")
+    monkeypatch.setattr(Config, "SKU_TILING_MIN_DIM", 4096)
+    assert not should_tile(image)  # 일반 12MP 사진
+    monkeypatch.setattr(Config, "SKU_TILING_MIN_DIM", 4000)
+    assert should_tile(image)
+
+
+def _coverage(windows, width, height):
+    covered = np.zeros((height, width), dtype=bool)
+    for x0, y0, x1, y1 in windows:
+        covered[y0:y1, x0:x1] = True
+    return covered.all()
+
+
+def test_tile_count_is_capped(image):
+    from app.sku.tiling import tile_windows, capped_tile_windows
+
+    height, width = image.array.shape[:2]
+    assert len(tile_windows(width, height, 640, 0.2)) == 48
+
+    windows = capped_tile_windows(width, height, 640, 0.2, max_tiles=12)
+    assert 1 <= len(windows) <= 12
+    assert _coverage(windows, width, height)
+    assert (windows[:, 2] <= width).all() and (windows[:, 3] <= height).all()
+
+    assert len(capped_tile_windows(width, height, 640, 0.2, max_tiles=0)) == 48
+
+
+class _CountingDetector:
+    """StubDetector를 감싸 입력 이미지 수를 셉니다."""
+
+    def __init__(self):
+        from app.benchmarks.stub_models import StubDetector
+        self.detector = StubDetector(boxes_per_image=4, forward_ms=0, per_item_ms=0)
+        self.images = 0
+
+    def __call__(self, source, **kwargs):
+        self.images += len(source) if isinstance(source, list) else 1
+        return self.detector(source, **kwargs)
+
+
+def test_detect_tiled_runs_at_most_max_tiles_plus_full_pass(image):
+    from app.sku.tiling import detect_tiled
+
+    model = _CountingDetector()
+    detect_tiled(model, image, 0.1, tile_size=640, overlap=0.2, batch_size=8, max_tiles=12)
+    assert model.images <= 13
+
+
+def test_detect_tiled_merges_duplicate_boxes():
+    from config import Config
+    from app.imaging.decoded_image import DecodedImage
+    from app.inference.box_ops import box_iou
+    from app.sku.tiling import detect_tiled
+
+    # 타일 하나 크기의 이미지: 전체 이미지 추론과 타일 추론이 같은 박스를 내므로 NMS로 하나만 남아야 합니다.
+    small = DecodedImage(np.zeros((640, 640, 3), dtype=np.uint8))
+    boxes, scores = detect_tiled(_CountingDetector(), small, 0.1, tile_size=640, overlap=0.2, batch_size=8)
+    assert len(boxes) == 4
+    assert list(scores) == sorted(scores, reverse=True)
+
+    large = DecodedImage(np.zeros((1440, 1920, 3), dtype=np.uint8))
+    boxes, _ = detect_tiled(_CountingDetector(), large, 0.1, tile_size=640, overlap=0.2, batch_size=8)
+    iou = box_iou(boxes, boxes)
+    np.fill_diagonal(iou, 0)
+    assert (iou <= Config.SKU_TILE_NMS_IOU).all()
+    assert (boxes[:, [0, 1]] >= 0).all() and (boxes[:, 2] <= 1920).all() and (boxes[:, 3] <= 1440).all()
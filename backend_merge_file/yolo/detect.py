@@ -1,47 +1,140 @@
 # app/yolo/detect.py
 
-import os
-from ultralytics import YOLO
 from PIL import Image
-import torch
-from torch.serialization import add_safe_globals
-from ultralytics.nn.tasks import DetectionModel
-import io
+import numpy as np
+from config import Config
+from app.imaging.decoded_image import DecodedImage
+from app.inference.registry import model_registry
+from app.inference.batcher import MicroBatcher
+from app.inference.outcome import record_failure
 
-# YOLO 모델 경로 설정
-YOLO_MODEL_PATH = "backend/app/yolo/weights/best.pt"
+# 크롭 분류 입력 크기 (레터박스 정사각형 한 변)
+YOLO_CROP_IMGSZ = 640
 
-# PyTorch 보안 업데이트로 인한 오류 방지
-add_safe_globals([DetectionModel])
+# ultralytics 기본 conf 임계값과 동일 (이 값 미만이면 탐지 없음으로 처리)
+YOLO_CONF_THRESHOLD = 0.25
 
-# YOLO 모델 인스턴스 생성
-try:
-    yolo_model = YOLO(YOLO_MODEL_PATH)
-    print(f"YOLO model loaded successfully from {YOLO_MODEL_PATH}")
-except Exception as e:
-    print(f"Error loading YOLO model: {e}")
-    yolo_model = None
+# 레터박스 패딩 색상 (ultralytics LetterBox 기본값)
+LETTERBOX_PAD_VALUE = 114
 
+# YOLO 모델 등록 (레지스트리의 활성 버전, 없으면 Config.YOLO_MODEL_PATH)
+# 로드 시점은 Config.MODEL_LOAD_MODE를 따릅니다. (eager면 이 시점에 로드)
+model_registry.register("yolo")
 
-def predict_name_with_yolo(image_data: bytes, bboxes: list):
+
+def _classify_crops(key, crops: list) -> list:
+    """마이크로 배치 실행 함수: 레터박스된 크롭 목록 -> (confidence, class id) 목록"""
+    yolo_model, _ = key
+    confs, cls_ids = classify_batch(yolo_model, np.stack(crops))
+    return list(zip(confs.tolist(), cls_ids.tolist()))
+
+
+# 동시 요청의 크롭을 모아 분류하는 배치 스케줄러 (key: 모델 엔진, 크롭 입력 크기)
+crop_batcher = MicroBatcher("yolo", _classify_crops, max_batch_size=Config.YOLO_MAX_BATCH_SIZE)
+
+
+def predict_name_with_yolo(image_data, bboxes: list, batched: bool = True, max_batch_size: int = None,
+                           crop_imgsz: int = None):
+    """
+    이미지(BLOB 바이트 또는 DecodedImage)와 바운딩 박스 목록을 받아 YOLO 모델로 객체 이름을 분류합니다.
+    batched: True면 모든 크롭을 레터박스하여 배치 단위로 한 번에 추론합니다.
+    max_batch_size: 지정하면 다른 요청과 묶지 않고 이 크기씩 바로 추론합니다.
+                    (기본값: 동시 요청과 마이크로 배치, 최대 Config.YOLO_MAX_BATCH_SIZE)
+    crop_imgsz: 크롭 분류 입력 크기 (기본값: YOLO_CROP_IMGSZ)
+    """
+    with model_registry.acquire("yolo") as handle:
+        if handle is None:
+            print("YOLO model is not loaded. Cannot perform prediction.")
+            record_failure("yolo", "model not loaded")
+            return []
+
+        # 이미 디코딩된 버퍼가 있으면 재사용하고, 바이트면 한 번만 디코딩
+        image = DecodedImage.ensure(image_data)
+
+        crop_imgsz = crop_imgsz or YOLO_CROP_IMGSZ
+        if not batched:
+            return _predict_name_per_crop(handle.model, image, bboxes, crop_imgsz)
+        return _predict_name_batched(handle.model, image, bboxes, max_batch_size, crop_imgsz)
+
+
+def _predict_name_batched(yolo_model, image: DecodedImage, bboxes: list, max_batch_size: int = None,
+                          crop_imgsz: int = YOLO_CROP_IMGSZ):
     """
-    BLOB 이미지 데이터와 바운딩 박스 목록을 받아 YOLO 모델로 객체 이름을 분류합니다.
+    모든 크롭을 레터박스하여 배치로 분류합니다.
+    max_batch_size를 지정하지 않으면 crop_batcher를 통해 동시 요청의 크롭과 함께 배치로 실행하고,
+    지정하면 이 요청의 크롭만 max_batch_size개씩 바로 실행합니다. (벤치마크 비교용)
     """
-    if yolo_model is None:
-        print("YOLO model is not loaded. Cannot perform prediction.")
+    if not bboxes:
         return []
 
-    # BLOB 데이터를 PIL Image 객체로 변환
-    image = Image.open(io.BytesIO(image_data))
+    crops = [letterbox(image.crop(bbox), crop_imgsz) for bbox in bboxes]
+    key = (yolo_model, crop_imgsz)
+    if max_batch_size:
+        outputs = crop_batcher.run_now(key, crops, max_batch_size)
+    else:
+        outputs = crop_batcher.submit(key, crops)
+
+    # 임계값을 넘은 크롭만 결과에 포함 (기존 단건 추론과 동일한 기준)
+    final_predictions = []
+    for bbox, (confidence, cls_id) in zip(bboxes, outputs):
+        if confidence >= YOLO_CONF_THRESHOLD:
+            final_predictions.append({
+                'name': yolo_model.names.get(cls_id, f"Unknown_{cls_id}"),
+                'class_id': cls_id,
+                'bbox': bbox,
+                'confidence': confidence
+            })
+
+    return final_predictions
+
+
+def letterbox(crop: np.ndarray, size: int) -> np.ndarray:
+    """
+    (H, W, 3) RGB 크롭(배열 뷰 가능)을 비율을 유지한 채 size x size 정사각형에 맞게
+    리사이즈하고 남는 영역을 패딩합니다. (size, size, 3) uint8 RGB 배열을 반환합니다.
+    """
+    import cv2
+
+    height, width = crop.shape[:2]
+    ratio = min(size / max(width, 1), size / max(height, 1))
+    new_w, new_h = max(1, round(width * ratio)), max(1, round(height * ratio))
+
+    resized = cv2.resize(crop, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    canvas = np.full((size, size, 3), LETTERBOX_PAD_VALUE, dtype=np.uint8)
+    top, left = (size - new_h) // 2, (size - new_w) // 2
+    canvas[top:top + new_h, left:left + new_w] = resized
+    return canvas
+
+
+def classify_batch(yolo_model, batch: np.ndarray):
+    """
+    레터박스된 (B, H, W, 3) 배치를 한 번의 forward로 추론하고,
+    각 크롭에서 가장 높은 confidence의 (confidence, class id)를 텐서 연산으로 구합니다.
+    yolo_model: 추론 엔진 (torch / onnx / onnx-int8 모두 같은 원시 출력 형식)
+    """
+    import torch
+
+    tensor = torch.from_numpy(batch).permute(0, 3, 1, 2).contiguous().float().div_(255.0)
+    preds = yolo_model.forward(tensor)
+
+    # preds: (B, 4 + num_classes, num_anchors) -> 앵커별 최고 클래스 점수
+    anchor_conf, anchor_cls = preds[:, 4:, :].max(dim=1)
+    # 크롭별로 가장 점수가 높은 앵커 선택 (NMS 후 첫 번째 박스와 동일)
+    confs, best_anchor = anchor_conf.max(dim=1)
+    cls_ids = anchor_cls.gather(1, best_anchor.unsqueeze(1)).squeeze(1)
+    return confs.cpu(), cls_ids.cpu()
+
 
+def _predict_name_per_crop(yolo_model, image: DecodedImage, bboxes: list, crop_imgsz: int = YOLO_CROP_IMGSZ):
+    """크롭마다 개별 추론하는 기존 방식입니다. (벤치마크 비교용)"""
     final_predictions = []
 
     for bbox in bboxes:
         # 바운딩 박스 영역을 잘라냄
-        cropped_image = image.crop(bbox)
+        cropped_image = Image.fromarray(image.crop(bbox))
 
         # 잘라낸 이미지를 YOLO 모델에 입력하여 객체 이름 분류
-        yolo_results = yolo_model(cropped_image)
+        yolo_results = yolo_model(cropped_image, imgsz=crop_imgsz)
 
         if yolo_results and yolo_results[0].boxes:
             # YOLO가 탐지한 객체 중 가장 높은 confidence를 가진 결과를 선택
@@ -52,6 +145,7 @@ def predict_name_with_yolo(image_data: bytes, bboxes: list):
 
             final_predictions.append({
                 'name': item_name_en,
+                'class_id': cls_id,
                 'bbox': bbox,
                 'confidence': confidence
             })